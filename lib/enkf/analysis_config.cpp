@@ -41,6 +41,7 @@
 
 #define UPDATE_ENKF_ALPHA_KEY      "ENKF_ALPHA"
 #define UPDATE_STD_CUTOFF_KEY   "STD_CUTOFF"
+#define UPDATE_ROW_CHUNK_SIZE_KEY  "ROW_CHUNK_SIZE"
 
 
 #define ANALYSIS_CONFIG_TYPE_ID 64431306
@@ -231,6 +232,18 @@ double analysis_config_get_std_cutoff(const analysis_config_type * config) {
   return config_settings_get_double_value(config->update_settings, UPDATE_STD_CUTOFF_KEY);
 }
 
+/**
+   The maximum number of parameter rows which are serialized and updated
+   together in the smoother update; 0 means no limit.
+*/
+void analysis_config_set_row_chunk_size( analysis_config_type * config , int row_chunk_size ) {
+  config_settings_set_int_value(config->update_settings, UPDATE_ROW_CHUNK_SIZE_KEY, row_chunk_size );
+}
+
+int analysis_config_get_row_chunk_size(const analysis_config_type * config) {
+  return config_settings_get_int_value(config->update_settings, UPDATE_ROW_CHUNK_SIZE_KEY);
+}
+
 
 void analysis_config_set_log_path(analysis_config_type * config , const char * log_path ) {
   config->log_path        = util_realloc_string_copy(config->log_path , log_path);
@@ -573,6 +586,7 @@ analysis_config_type * analysis_config_alloc_full(
   config->update_settings           = config_settings_alloc( UPDATE_SETTING_KEY );
   config_settings_add_double_setting(config->update_settings, UPDATE_ENKF_ALPHA_KEY , alpha );
   config_settings_add_double_setting(config->update_settings, UPDATE_STD_CUTOFF_KEY, std_cutoff );
+  config_settings_add_int_setting(config->update_settings, UPDATE_ROW_CHUNK_SIZE_KEY, DEFAULT_UPDATE_ROW_CHUNK_SIZE );
 
   config->merge_observations = merge_observations;
   config->rerun = rerun;
@@ -607,6 +621,7 @@ analysis_config_type * analysis_config_alloc_default(void) {
   config->update_settings           = config_settings_alloc( UPDATE_SETTING_KEY );
   config_settings_add_double_setting(config->update_settings, UPDATE_ENKF_ALPHA_KEY , DEFAULT_ENKF_ALPHA);
   config_settings_add_double_setting(config->update_settings, UPDATE_STD_CUTOFF_KEY, DEFAULT_ENKF_STD_CUTOFF );
+  config_settings_add_int_setting(config->update_settings, UPDATE_ROW_CHUNK_SIZE_KEY, DEFAULT_UPDATE_ROW_CHUNK_SIZE );
 
   analysis_config_set_merge_observations( config       , DEFAULT_MERGE_OBSERVATIONS );
   analysis_config_set_rerun( config                    , DEFAULT_RERUN );
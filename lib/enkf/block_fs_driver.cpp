@@ -41,6 +41,7 @@ struct bfs_config_struct {
   int             block_size;
   int             max_cache_size;
   bool            bfs_lock;
+  bool            use_mmap;
 };
 
 
@@ -52,6 +53,7 @@ struct bfs_struct  {
   /* New variables */
   block_fs_type * block_fs;
   char          * mountfile;  // The full path to the file mounted by the block_fs layer - including extension.
+  long            reclaimed;  // The number of bytes reclaimed by the last compaction.
 
   const bfs_config_type * config;
 };
@@ -70,7 +72,7 @@ struct block_fs_driver_struct {
 
 /*****************************************************************/
 
-bfs_config_type * bfs_config_alloc( fs_driver_enum driver_type , bool read_only, bool bfs_lock) {
+bfs_config_type * bfs_config_alloc( fs_driver_enum driver_type , bool read_only, bool bfs_lock, bool use_mmap) {
   const int PARAMETER_blocksize    = 64;
   const int DYNAMIC_blocksize      = 64;
   const int DEFAULT_blocksize      = 64;
@@ -90,6 +92,7 @@ bfs_config_type * bfs_config_alloc( fs_driver_enum driver_type , bool read_only,
     config->fragmentation_limit = fragmentation_limit;
     config->read_only           = read_only;
     config->bfs_lock            = bfs_lock;
+    config->use_mmap            = use_mmap;
 
     switch (driver_type) {
     case( DRIVER_PARAMETER ):
@@ -138,6 +141,7 @@ static bfs_type * bfs_alloc( const bfs_config_type * config ) {
 
   // New init
   fs->mountfile = NULL;
+  fs->reclaimed = 0;
 
   return fs;
 }
@@ -161,6 +165,8 @@ static void bfs_mount( bfs_type * bfs) {
                                   config->preload ,
                                   config->read_only,
                                   config->bfs_lock);
+  if (config->use_mmap)
+    block_fs_mmap( bfs->block_fs );
 }
 
 
@@ -175,6 +181,14 @@ static void * bfs_mount__( void * arg ) {
 
 static void bfs_fsync( bfs_type * bfs ) {
   block_fs_fsync( bfs->block_fs );
+  block_fs_fsync_index( bfs->block_fs );
+}
+
+
+static void * bfs_compact__( void * arg ) {
+  bfs_type * bfs = bfs_safe_cast( arg );
+  bfs->reclaimed = block_fs_compact( bfs->block_fs );
+  return NULL;
 }
 
 
@@ -243,6 +257,14 @@ bool block_fs_sscanf_key(const char * key , char ** config_key , int * __report_
 
 
 
+int block_fs_driver_get_num_fs( const void * _driver ) {
+  const block_fs_driver_type * driver = (const block_fs_driver_type *) _driver;
+  if (driver->__id != BLOCK_FS_DRIVER_ID)
+    util_abort("%s: internal error - cast failed - aborting \n",__func__);
+  return driver->num_fs;
+}
+
+
 static bfs_type * block_fs_driver_get_fs( block_fs_driver_type * driver , int iens ) {
   int phase                = (iens % driver->num_fs);
 
@@ -275,6 +297,28 @@ static void block_fs_driver_load_vector(void * _driver , const char * node_key ,
   }
 }
 
+
+static const void * block_fs_driver_node_view(void * _driver , const char * node_key , int report_step , int iens , size_t * data_size) {
+  block_fs_driver_type * driver = block_fs_driver_safe_cast( _driver );
+  char * key          = block_fs_driver_alloc_node_key( driver , node_key , report_step , iens );
+  bfs_type      * bfs = block_fs_driver_get_fs( driver , iens );
+  const void * view   = block_fs_get_file_view( bfs->block_fs , key , data_size );
+
+  free( key );
+  return view;
+}
+
+
+static const void * block_fs_driver_vector_view(void * _driver , const char * node_key , int iens , size_t * data_size) {
+  block_fs_driver_type * driver = block_fs_driver_safe_cast( _driver );
+  char * key          = block_fs_driver_alloc_vector_key( driver , node_key , iens );
+  bfs_type      * bfs = block_fs_driver_get_fs( driver , iens );
+  const void * view   = block_fs_get_file_view( bfs->block_fs , key , data_size );
+
+  free( key );
+  return view;
+}
+
 /*****************************************************************/
 
 static void block_fs_driver_save_node(void * _driver , const char * node_key , int report_step , int iens ,  buffer_type * buffer) {
@@ -393,6 +437,29 @@ static void block_fs_driver_fsync( void * _driver ) {
 }
 
 
+/*
+  Compacts all the block_fs files of the driver, see block_fs_compact(),
+  and returns the total number of bytes reclaimed.
+*/
+
+static long block_fs_driver_compact( void * _driver ) {
+  block_fs_driver_type * driver = block_fs_driver_safe_cast( _driver );
+  long reclaimed = 0;
+  {
+    thread_pool_type * tp = thread_pool_alloc( 4 , true );
+    for (int driver_nr = 0; driver_nr < driver->num_fs; driver_nr++)
+      thread_pool_add_job( tp , bfs_compact__ , driver->fs_list[driver_nr] );
+
+    thread_pool_join( tp );
+    thread_pool_free( tp );
+  }
+
+  for (int driver_nr = 0; driver_nr < driver->num_fs; driver_nr++)
+    reclaimed += driver->fs_list[driver_nr]->reclaimed;
+  return reclaimed;
+}
+
+
 static block_fs_driver_type * block_fs_driver_alloc(int num_fs) {
   block_fs_driver_type * driver = (block_fs_driver_type *)util_malloc(sizeof * driver );
   {
@@ -409,8 +476,12 @@ static block_fs_driver_type * block_fs_driver_alloc(int num_fs) {
   driver->unlink_vector = block_fs_driver_unlink_vector;
   driver->has_vector    = block_fs_driver_has_vector;
 
+  driver->node_view     = block_fs_driver_node_view;
+  driver->vector_view   = block_fs_driver_vector_view;
+
   driver->free_driver   = block_fs_driver_free;
   driver->fsync_driver  = block_fs_driver_fsync;
+  driver->compact_driver = block_fs_driver_compact;
   driver->__id          = BLOCK_FS_DRIVER_ID;
   driver->num_fs        = num_fs;
 
@@ -421,9 +492,9 @@ static block_fs_driver_type * block_fs_driver_alloc(int num_fs) {
 
 
 
-static void * block_fs_driver_alloc_new( fs_driver_enum driver_type , bool read_only , int num_fs , const char * mountfile_fmt, bool block_level_lock ) {
+static void * block_fs_driver_alloc_new( fs_driver_enum driver_type , bool read_only , int num_fs , const char * mountfile_fmt, bool block_level_lock , bool use_mmap ) {
   block_fs_driver_type * driver = block_fs_driver_alloc( num_fs);
-  driver->config = bfs_config_alloc( driver_type , read_only, block_level_lock );
+  driver->config = bfs_config_alloc( driver_type , read_only, block_level_lock , use_mmap );
   {
     for (int ifs = 0; ifs < driver->num_fs; ifs++)
       driver->fs_list[ifs] = bfs_alloc_new( driver->config , util_alloc_sprintf( mountfile_fmt , ifs) );
@@ -481,13 +552,18 @@ void block_fs_driver_create_fs( FILE * stream ,
   the block_fs_driver_create() function.
 */
 
-void * block_fs_driver_open(FILE * fstab_stream , const char * mount_point , fs_driver_enum driver_type , bool read_only) {
+/*
+  With @use_mmap the data files of a read-only filesystem are memory
+  mapped, see block_fs_mmap().
+*/
+
+void * block_fs_driver_open(FILE * fstab_stream , const char * mount_point , fs_driver_enum driver_type , bool read_only , bool use_mmap) {
   int num_fs                  = util_fread_int( fstab_stream );
   char * tmp_fmt              = util_fread_alloc_string( fstab_stream );
   char * mountfile_fmt        = util_alloc_sprintf("%s%c%s" , mount_point , UTIL_PATH_SEP_CHAR , tmp_fmt );
   const bool block_level_lock = false;
 
-  block_fs_driver_type * driver = (block_fs_driver_type * ) block_fs_driver_alloc_new( driver_type , read_only , num_fs , mountfile_fmt, block_level_lock );
+  block_fs_driver_type * driver = (block_fs_driver_type * ) block_fs_driver_alloc_new( driver_type , read_only , num_fs , mountfile_fmt, block_level_lock , use_mmap );
 
   block_fs_driver_mount( driver );
 
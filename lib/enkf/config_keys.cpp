@@ -258,6 +258,10 @@ const char * config_keys_get_max_resample_key() {
   return MAX_RESAMPLE_KEY;
 }
 
+const char * config_keys_get_memory_poll_period_key() {
+  return MEMORY_POLL_PERIOD_KEY;
+}
+
 const char * config_keys_get_num_realizations_key() {
   return NUM_REALIZATIONS_KEY;
 }
@@ -217,6 +217,7 @@ struct enkf_fs_struct {
   state_map_type            * state_map;
   summary_key_set_type      * summary_key_set;
   misfit_ensemble_type      * misfit_ensemble;
+  bool                        misfit_loaded;         /* The misfit ensemble is read from disk when it is first used. */
   /*
      The variables below here are for storing arbitrary files within
      the enkf_fs storage directory, but not as serialized enkf_nodes.
@@ -276,7 +277,7 @@ enkf_fs_type * enkf_fs_get_ref( enkf_fs_type * fs ) {
 }
 
 
-static enkf_fs_type * enkf_fs_alloc_empty( const char * mount_point ) {
+static enkf_fs_type * enkf_fs_alloc_empty( const char * mount_point , bool read_only ) {
   enkf_fs_type * fs = (enkf_fs_type *)util_malloc(sizeof * fs );
   UTIL_TYPE_ID_INIT( fs , ENKF_FS_TYPE_ID );
   fs->time_map               = time_map_alloc(  );
@@ -284,6 +285,7 @@ static enkf_fs_type * enkf_fs_alloc_empty( const char * mount_point ) {
   fs->state_map              = state_map_alloc();
   fs->summary_key_set        = summary_key_set_alloc();
   fs->misfit_ensemble        = misfit_ensemble_alloc();
+  fs->misfit_loaded          = false;
   fs->index                  = NULL;
   fs->parameter              = NULL;
   fs->dynamic_forecast       = NULL;
@@ -304,7 +306,9 @@ static enkf_fs_type * enkf_fs_alloc_empty( const char * mount_point ) {
     fs->root_path = util_alloc_joined_string( (const char **) path_tmp , path_len , UTIL_PATH_SEP_STRING);
     fs->lock_file = util_alloc_filename( fs->mount_point , fs->case_name , "lock");
 
-    if (util_try_lockf( fs->lock_file , S_IWUSR + S_IWGRP , &fs->lock_fd)) {
+    if (read_only)
+      fs->read_only = true;
+    else if (util_try_lockf( fs->lock_file , S_IWUSR + S_IWGRP , &fs->lock_fd)) {
       fs->read_only = false;
     } else {
       fprintf(stderr," Another program has already opened filesystem read-write - this instance will be UNSYNCRONIZED read-only. Cross your fingers ....\n");
@@ -407,15 +411,15 @@ static void enkf_fs_assign_driver( enkf_fs_type * fs , fs_driver_type * driver ,
 }
 
 
-static enkf_fs_type *  enkf_fs_mount_block_fs( FILE * fstab_stream , const char * mount_point  ) {
-  enkf_fs_type * fs = enkf_fs_alloc_empty( mount_point );
+static enkf_fs_type *  enkf_fs_mount_block_fs( FILE * fstab_stream , const char * mount_point , bool read_only , bool use_mmap ) {
+  enkf_fs_type * fs = enkf_fs_alloc_empty( mount_point , read_only );
 
   {
     while (true) {
       fs_driver_enum driver_type;
       if (fread( &driver_type , sizeof driver_type , 1 , fstab_stream) == 1) {
         if (fs_types_valid( driver_type )) {
-          fs_driver_type * driver = (fs_driver_type * ) block_fs_driver_open( fstab_stream , mount_point , driver_type , fs->read_only);
+          fs_driver_type * driver = (fs_driver_type * ) block_fs_driver_open( fstab_stream , mount_point , driver_type , fs->read_only , fs->read_only && use_mmap);
           enkf_fs_assign_driver( fs , driver , driver_type );
         } else
           block_fs_driver_fskip( fstab_stream );
@@ -427,15 +431,27 @@ static enkf_fs_type *  enkf_fs_mount_block_fs( FILE * fstab_stream , const char
   return fs;
 }
 
-enkf_fs_type * enkf_fs_create_fs( const char * mount_point, fs_driver_impl driver_id , void * arg , bool mount) {
-  const int num_drivers = 32;
+/*
+  The PARAMETER and FORECAST drivers spread the realizations over
+  @num_shards block_fs files, realization iens goes to file (iens %
+  num_shards). Each file is written under its own lock, so realizations
+  in different shards can be stored concurrently; with @num_shards at
+  least the ensemble size every realization gets a file of its own. The
+  number of shards is stored in the fstab, and used when the case is
+  mounted.
+*/
+
+enkf_fs_type * enkf_fs_create_sharded_fs( const char * mount_point, fs_driver_impl driver_id , int num_shards , bool mount) {
+  if (num_shards <= 0)
+    util_abort("%s: invalid number of shards:%d \n",__func__ , num_shards);
+
   FILE * stream = fs_driver_open_fstab( mount_point , true );
   if (stream != NULL) {
     fs_driver_init_fstab( stream, driver_id);
     {
       switch( driver_id ) {
       case( BLOCK_FS_DRIVER_ID ):
-        enkf_fs_create_block_fs( stream , num_drivers , mount_point , arg );
+        enkf_fs_create_block_fs( stream , num_shards , mount_point , NULL );
         break;
       default:
         util_abort("%s: Invalid driver_id value:%d \n",__func__ , driver_id );
@@ -450,6 +466,16 @@ enkf_fs_type * enkf_fs_create_fs( const char * mount_point, fs_driver_impl drive
     return NULL;
 }
 
+
+enkf_fs_type * enkf_fs_create_fs( const char * mount_point, fs_driver_impl driver_id , void * arg , bool mount) {
+  return enkf_fs_create_sharded_fs( mount_point , driver_id , ENKF_FS_DEFAULT_NUM_SHARDS , mount );
+}
+
+
+int enkf_fs_get_num_shards( const enkf_fs_type * fs ) {
+  return block_fs_driver_get_num_fs( fs->dynamic_forecast );
+}
+
 static void enkf_fs_fsync_time_map( enkf_fs_type * fs ) {
   char * filename = enkf_fs_alloc_case_filename( fs , TIME_MAP_FILE );
   time_map_fwrite( fs->time_map , filename );
@@ -573,7 +599,7 @@ bool enkf_fs_update_disk_version(const char * mount_point , int src_version , in
 }
 
 
-enkf_fs_type * enkf_fs_mount(const char * mount_point) {
+static enkf_fs_type * enkf_fs_mount__(const char * mount_point, bool read_only, bool use_mmap) {
   FILE * stream = fs_driver_open_fstab(mount_point, false);
 
   if (!stream)
@@ -587,7 +613,7 @@ enkf_fs_type * enkf_fs_mount(const char * mount_point) {
 
   switch(driver_id) {
   case(BLOCK_FS_DRIVER_ID):
-    fs = enkf_fs_mount_block_fs(stream, mount_point);
+    fs = enkf_fs_mount_block_fs(stream, mount_point, read_only, use_mmap);
     res_log_fdebug("Mounting (block_fs) point %s.", mount_point);
     break;
   default:
@@ -600,13 +626,29 @@ enkf_fs_type * enkf_fs_mount(const char * mount_point) {
   enkf_fs_fread_cases_config(fs);
   enkf_fs_fread_state_map(fs);
   enkf_fs_fread_summary_key_set(fs);
-  enkf_fs_fread_misfit(fs);
 
   enkf_fs_get_ref(fs);
   return fs;
 }
 
 
+enkf_fs_type * enkf_fs_mount(const char * mount_point) {
+  return enkf_fs_mount__(mount_point, false, false);
+}
+
+
+/**
+   Will mount the filesystem read-only, without taking the lock on the
+   case. With @use_mmap the storage files are memory mapped, and the
+   stored data can be accessed without copying through
+   enkf_fs_get_node_view() and enkf_fs_get_vector_view().
+*/
+
+enkf_fs_type * enkf_fs_mount_readonly(const char * mount_point, bool use_mmap) {
+  return enkf_fs_mount__(mount_point, true, use_mmap);
+}
+
+
 bool enkf_fs_exists( const char * mount_point ) {
   bool exists   = false;
 
@@ -699,6 +741,34 @@ static void * enkf_fs_select_driver(enkf_fs_type * fs , enkf_var_type var_type,
 /* Exported functions for enkf_node instances . */
 
 
+static long enkf_fs_compact_driver( fs_driver_type * driver ) {
+  if (driver->compact_driver != NULL)
+    return driver->compact_driver( driver );
+  else
+    return 0;
+}
+
+
+/*
+  Will compact the storage of a mounted case, i.e. rewrite the data
+  files without the space left unused by overwritten and deleted nodes,
+  and return the number of bytes reclaimed. The case can be read while
+  it is compacted. A read-only case is not compacted.
+*/
+
+long enkf_fs_compact( enkf_fs_type * fs ) {
+  long reclaimed = 0;
+  if (fs->read_only)
+    return 0;
+
+  reclaimed += enkf_fs_compact_driver( fs->parameter );
+  reclaimed += enkf_fs_compact_driver( fs->dynamic_forecast );
+  reclaimed += enkf_fs_compact_driver( fs->index );
+  res_log_finfo("Compacted case %s: %ld bytes reclaimed.", fs->case_name , reclaimed);
+  return reclaimed;
+}
+
+
 static void enkf_fs_fsync_driver( fs_driver_type * driver ) {
   if (driver->fsync_driver != NULL)
     driver->fsync_driver( driver );
@@ -747,6 +817,34 @@ void enkf_fs_fread_vector(enkf_fs_type * enkf_fs , buffer_type * buffer ,
 
 
 
+/**
+   Will return a pointer to the serialized data of a node in the memory
+   mapped storage of a filesystem mounted with enkf_fs_mount_readonly(),
+   and set @data_size to the size in bytes. If the storage is not memory
+   mapped, or the node does not exist, NULL is returned. The pointer is
+   valid as long as the filesystem is mounted.
+*/
+
+const void * enkf_fs_get_node_view(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type , int report_step , int iens , size_t * data_size) {
+  fs_driver_type * driver = fs_driver_safe_cast(enkf_fs_select_driver(enkf_fs , var_type , node_key));
+  if (var_type == PARAMETER)
+    /* Parameters are *ONLY* stored at report_step == 0 */
+    report_step = 0;
+
+  if (driver->node_view == NULL)
+    return NULL;
+  return driver->node_view(driver , node_key , report_step , iens , data_size);
+}
+
+
+const void * enkf_fs_get_vector_view(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type , int iens , size_t * data_size) {
+  fs_driver_type * driver = fs_driver_safe_cast(enkf_fs_select_driver(enkf_fs , var_type , node_key));
+  if (driver->vector_view == NULL)
+    return NULL;
+  return driver->vector_view(driver , node_key , iens , data_size);
+}
+
+
 bool enkf_fs_has_node(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type , int report_step , int iens) {
   fs_driver_type * driver = fs_driver_safe_cast(enkf_fs_select_driver(enkf_fs , var_type , node_key));
   return driver->has_node(driver , node_key , report_step , iens );
@@ -899,7 +997,16 @@ summary_key_set_type * enkf_fs_get_summary_key_set( const enkf_fs_type * fs ) {
   return fs->summary_key_set;
 }
 
-misfit_ensemble_type * enkf_fs_get_misfit_ensemble( const enkf_fs_type * fs ) {
+/*
+  The misfit ensemble can be large, and is only read from disk when it
+  is first asked for - not when the filesystem is mounted.
+*/
+
+misfit_ensemble_type * enkf_fs_get_misfit_ensemble( enkf_fs_type * fs ) {
+  if (!fs->misfit_loaded) {
+    enkf_fs_fread_misfit( fs );
+    fs->misfit_loaded = true;
+  }
   return fs->misfit_ensemble;
 }
 
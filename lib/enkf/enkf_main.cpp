@@ -22,6 +22,8 @@
 #include <stdio.h>
 #include <pthread.h>
 #include <thread>
+#include <vector>
+#include <chrono>
 
 #define HAVE_THREAD_POOL 1
 #include <ert/util/rng.h>
@@ -495,6 +497,8 @@ typedef struct {
   int                          row_offset;
   const active_list_type     * active_list;
   const char                 * key;
+  enkf_node_type            ** src_nodes;     /* Nodes held in memory indexed by iens, or NULL to load from src_fs. */
+  enkf_node_type            ** target_nodes;  /* Nodes held in memory indexed by iens, or NULL to load from src_fs and store to target_fs. */
 } serialize_node_info_type;
 
 
@@ -538,7 +542,10 @@ static void * serialize_nodes_mt( void * arg ) {
   const enkf_config_node_type * config_node = ensemble_config_get_node( info->ensemble_config , node_info->key );
   for (int iens = info->iens1; iens < info->iens2; iens++) {
     int column = int_vector_iget( info->iens_active_index , iens);
-    if (column >= 0) {
+    if (column >= 0 && node_info->src_nodes) {
+      node_id_type node_id = {.report_step = info->report_step, .iens = iens };
+      enkf_node_serialize_loaded( node_info->src_nodes[iens] , node_id , node_info->active_list , info->A , node_info->row_offset , column );
+    } else if (column >= 0) {
       serialize_node( info->src_fs ,
                       config_node,
                       iens ,
@@ -553,25 +560,20 @@ static void * serialize_nodes_mt( void * arg ) {
 }
 
 
-static void enkf_main_serialize_node( const char * node_key ,
-                                      const active_list_type * active_list ,
-                                      int row_offset ,
-                                      thread_pool_type * work_pool ,
-                                      serialize_info_type * serialize_info) {
+static void enkf_main_run_node_jobs( void * (*node_job) (void *) ,
+                                     const serialize_node_info_type * node ,
+                                     thread_pool_type * work_pool ,
+                                     serialize_info_type * serialize_info) {
 
-  /* Multithreaded serializing*/
+  /* Multithreaded, each thread handles the realizations [iens1, iens2) of its serialize_info. */
   const int num_cpu_threads = thread_pool_get_max_running( work_pool );
-  serialize_node_info_type node_info[num_cpu_threads];
+  std::vector<serialize_node_info_type> node_info( num_cpu_threads , *node );
   int icpu;
 
   thread_pool_restart( work_pool );
   for (icpu = 0; icpu < num_cpu_threads; icpu++) {
-    node_info[icpu].key            = node_key;
-    node_info[icpu].active_list    = active_list;
-    node_info[icpu].row_offset     = row_offset;
     serialize_info[icpu].node_info = &node_info[icpu];
-
-    thread_pool_add_job( work_pool , serialize_nodes_mt , &serialize_info[icpu]);
+    thread_pool_add_job( work_pool , node_job , &serialize_info[icpu]);
   }
   thread_pool_join( work_pool );
 
@@ -580,6 +582,49 @@ static void enkf_main_serialize_node( const char * node_key ,
 }
 
 
+static void enkf_main_serialize_node( const char * node_key ,
+                                      const active_list_type * active_list ,
+                                      int row_offset ,
+                                      thread_pool_type * work_pool ,
+                                      serialize_info_type * serialize_info) {
+
+  serialize_node_info_type node_info;
+  node_info.key          = node_key;
+  node_info.active_list  = active_list;
+  node_info.row_offset   = row_offset;
+  node_info.src_nodes    = nullptr;
+  node_info.target_nodes = nullptr;
+  enkf_main_run_node_jobs( serialize_nodes_mt , &node_info , work_pool , serialize_info );
+}
+
+
+
+/**
+   Computes the number of active rows and the row offset in the
+   serialized A matrix for each of the unscaled keys in the dataset;
+   the return value is the total number of rows.
+*/
+
+static int enkf_main_init_dataset_layout( const ensemble_config_type * ens_config ,
+                                          const local_dataset_type * dataset ,
+                                          int report_step,
+                                          serialize_info_type * serialize_info) {
+  int current_row = 0;
+
+  const auto& unscaled_keys = local_dataset_unscaled_keys(dataset);
+  serialize_info->active_size.resize( unscaled_keys.size() );
+  serialize_info->row_offset.resize( unscaled_keys.size() );
+  for (int ikw = 0; ikw < unscaled_keys.size(); ikw++) {
+    const auto& key = unscaled_keys[ikw];
+    const active_list_type * active_list = local_dataset_get_node_active_list( dataset , key.c_str() );
+    enkf_fs_type * src_fs = serialize_info->src_fs;
+    serialize_info->active_size[ikw] = __get_active_size( ens_config , src_fs , key.c_str() , report_step , active_list );
+    serialize_info->row_offset[ikw] = current_row;
+    current_row += serialize_info->active_size[ikw];
+  }
+  return current_row;
+}
+
 
 /**
    The return value is the number of rows in the serialized
@@ -595,30 +640,20 @@ static int enkf_main_serialize_dataset( const ensemble_config_type * ens_config
 
   matrix_type * A   = serialize_info->A;
   int ens_size      = matrix_get_columns( A );
-  int current_row   = 0;
+  int rows          = enkf_main_init_dataset_layout( ens_config , dataset , report_step , serialize_info );
+
+  if (rows > matrix_get_rows( A ))
+    matrix_resize( A , rows , ens_size , false );
 
   const auto& unscaled_keys = local_dataset_unscaled_keys(dataset);
-  serialize_info->active_size.resize( unscaled_keys.size() );
-  serialize_info->row_offset.resize( unscaled_keys.size() );
   for (int ikw = 0; ikw < unscaled_keys.size(); ikw++) {
     const auto& key = unscaled_keys[ikw];
     const active_list_type * active_list = local_dataset_get_node_active_list( dataset , key.c_str() );
-    enkf_fs_type * src_fs = serialize_info->src_fs;
-    serialize_info->active_size[ikw] = __get_active_size( ens_config , src_fs , key.c_str() , report_step , active_list );
-    serialize_info->row_offset[ikw] = current_row;
 
-    {
-      int matrix_rows = matrix_get_rows( A );
-      if ((serialize_info->active_size[ikw] + current_row) > matrix_rows)
-        matrix_resize( A , matrix_rows + 2 * serialize_info->active_size[ikw] , ens_size , true );
-    }
-
-    if (serialize_info->active_size[ikw] > 0) {
+    if (serialize_info->active_size[ikw] > 0)
       enkf_main_serialize_node( key.c_str() , active_list , serialize_info->row_offset[ikw] , work_pool , serialize_info );
-      current_row += serialize_info->active_size[ikw];
-    }
   }
-  matrix_shrink_header( A , current_row , ens_size );
+  matrix_shrink_header( A , rows , ens_size );
   return matrix_get_rows( A );
 }
 
@@ -652,42 +687,185 @@ static void * deserialize_nodes_mt( void * arg ) {
   const enkf_config_node_type * config_node = ensemble_config_get_node(info->ensemble_config, node_info->key);
   for (int iens = info->iens1; iens < info->iens2; iens++) {
     int column = int_vector_iget( info->iens_active_index , iens );
-    if (column >= 0)
+    if (column >= 0 && node_info->target_nodes) {
+      node_id_type node_id = {.report_step = info->target_step, .iens = iens };
+      enkf_node_deserialize_loaded( node_info->target_nodes[iens] , node_id , node_info->active_list , info->A , node_info->row_offset , column );
+    } else if (column >= 0)
       deserialize_node( info->target_fs , info->src_fs, config_node, iens , info->target_step , node_info->row_offset , column, node_info->active_list , info->A );
   }
   return NULL;
 }
 
 
+static void enkf_main_deserialize_node( const char * node_key ,
+                                        const active_list_type * active_list ,
+                                        int row_offset ,
+                                        thread_pool_type * work_pool ,
+                                        serialize_info_type * serialize_info) {
+
+  serialize_node_info_type node_info;
+  node_info.key          = node_key;
+  node_info.active_list  = active_list;
+  node_info.row_offset   = row_offset;
+  node_info.src_nodes    = nullptr;
+  node_info.target_nodes = nullptr;
+  enkf_main_run_node_jobs( deserialize_nodes_mt , &node_info , work_pool , serialize_info );
+}
+
+
 static void enkf_main_deserialize_dataset( ensemble_config_type * ensemble_config ,
                                            const local_dataset_type * dataset ,
                                            serialize_info_type * serialize_info ,
                                            thread_pool_type * work_pool ) {
 
-  const int num_cpu_threads = thread_pool_get_max_running( work_pool );
   const auto& unscaled_keys = local_dataset_unscaled_keys(dataset);
   for (int ikw=0; ikw < unscaled_keys.size(); ikw++) {
     const auto& key = unscaled_keys[ikw];
     if (serialize_info->active_size[ikw] > 0) {
       const active_list_type * active_list      = local_dataset_get_node_active_list( dataset , key.c_str() );
+      enkf_main_deserialize_node( key.c_str() , active_list , serialize_info->row_offset[ikw] , work_pool , serialize_info );
+    }
+  }
+}
 
-      {
-        /* Multithreaded */
-        int icpu;
-        serialize_node_info_type node_info[num_cpu_threads];
-        thread_pool_restart( work_pool );
-        for (icpu = 0; icpu < num_cpu_threads; icpu++) {
-          node_info[icpu].key            = key.c_str();
-          node_info[icpu].active_list    = active_list;
-          node_info[icpu].row_offset     = serialize_info->row_offset[ikw];
-          serialize_info[icpu].node_info = &node_info[icpu];
-
-          thread_pool_add_job( work_pool , deserialize_nodes_mt , &serialize_info[icpu]);
-        }
-        thread_pool_join( work_pool );
+
+/*
+  Loads the node of every active realization into node_info->src_nodes
+  from report_step, and into node_info->target_nodes from target_step
+  when the two node arrays differ.
+*/
+static void * load_nodes_mt( void * arg ) {
+  serialize_info_type * info = (serialize_info_type *) arg;
+  const auto * node_info = info->node_info;
+  const enkf_config_node_type * config_node = ensemble_config_get_node( info->ensemble_config , node_info->key );
+  for (int iens = info->iens1; iens < info->iens2; iens++) {
+    if (int_vector_iget( info->iens_active_index , iens ) >= 0) {
+      node_id_type src_id = {.report_step = info->report_step, .iens = iens };
+      node_info->src_nodes[iens] = enkf_node_alloc( config_node );
+      enkf_node_load( node_info->src_nodes[iens] , info->src_fs , src_id );
+
+      if (node_info->target_nodes != node_info->src_nodes) {
+        node_id_type target_id = {.report_step = info->target_step, .iens = iens };
+        node_info->target_nodes[iens] = enkf_node_alloc( config_node );
+        enkf_node_load( node_info->target_nodes[iens] , info->src_fs , target_id );
       }
     }
   }
+  return NULL;
+}
+
+
+/*
+  Stores the nodes in node_info->target_nodes to target_fs and frees
+  all the nodes loaded by load_nodes_mt().
+*/
+static void * store_nodes_mt( void * arg ) {
+  serialize_info_type * info = (serialize_info_type *) arg;
+  const auto * node_info = info->node_info;
+  for (int iens = info->iens1; iens < info->iens2; iens++) {
+    enkf_node_type * target_node = node_info->target_nodes[iens];
+    if (target_node) {
+      node_id_type node_id = {.report_step = info->target_step, .iens = iens };
+      enkf_node_store( target_node , info->target_fs , node_id );
+      state_map_update_undefined( enkf_fs_get_state_map( info->target_fs ) , iens , STATE_INITIALIZED );
+      enkf_node_free( target_node );
+      if (node_info->target_nodes != node_info->src_nodes)
+        enkf_node_free( node_info->src_nodes[iens] );
+    }
+  }
+  return NULL;
+}
+
+
+/**
+   Updates the parameters of the dataset with A = A*X, but instead of
+   serializing all the parameters to one A matrix the active elements
+   of each node are processed in chunks of at most row_chunk_size rows:
+   a chunk is serialized, multiplied with X and deserialized before the
+   next chunk is started. Since the rows of A are updated independently
+   the result is the same as for the full update.
+
+   The nodes of one parameter are loaded once for all the active
+   realizations, updated chunk by chunk in memory and stored once, so
+   the storage I/O does not depend on the number of chunks. The memory
+   used is bounded by row_chunk_size x ens_size elements for A, plus
+   the largest parameter of the dataset for every active realization -
+   twice when the update reads and writes different report steps.
+*/
+
+static void enkf_main_update_dataset_chunked( const ensemble_config_type * ens_config ,
+                                              const local_dataset_type * dataset ,
+                                              int report_step ,
+                                              int row_chunk_size ,
+                                              const matrix_type * X ,
+                                              thread_pool_type * work_pool ,
+                                              serialize_info_type * serialize_info) {
+
+  const int num_cpu_threads = thread_pool_get_max_running( work_pool );
+  const int ens_size = matrix_get_columns( X );
+  const int total_ens_size = int_vector_size( serialize_info->iens_active_index );
+  matrix_type * A = matrix_alloc( row_chunk_size , ens_size );
+  matrix_type * full_A = serialize_info->A;
+
+  for (int icpu = 0; icpu < num_cpu_threads; icpu++)
+    serialize_info[icpu].A = A;
+
+  const auto& unscaled_keys = local_dataset_unscaled_keys(dataset);
+  for (int ikw = 0; ikw < unscaled_keys.size(); ikw++) {
+    const auto& key = unscaled_keys[ikw];
+    const active_list_type * active_list = local_dataset_get_node_active_list( dataset , key.c_str() );
+    const int active_size = __get_active_size( ens_config , serialize_info->src_fs , key.c_str() , report_step , active_list );
+    const int * active_index = active_list_get_active( active_list );
+    if (active_size == 0)
+      continue;
+
+    std::vector<enkf_node_type *> src_nodes( total_ens_size , nullptr );
+    std::vector<enkf_node_type *> target_nodes;
+    serialize_node_info_type node_info;
+    node_info.key          = key.c_str();
+    node_info.active_list  = active_list;
+    node_info.row_offset   = 0;
+    node_info.src_nodes    = src_nodes.data();
+    node_info.target_nodes = src_nodes.data();
+    if (serialize_info->report_step != serialize_info->target_step) {
+      target_nodes.resize( total_ens_size , nullptr );
+      node_info.target_nodes = target_nodes.data();
+    }
+    enkf_main_run_node_jobs( load_nodes_mt , &node_info , work_pool , serialize_info );
+
+    for (int row1 = 0; row1 < active_size; row1 += row_chunk_size) {
+      const int row2 = util_int_min( row1 + row_chunk_size , active_size );
+      active_list_type * chunk_list = active_list_alloc( );
+      for (int row = row1; row < row2; row++)
+        active_list_add_index( chunk_list , active_index ? active_index[row] : row );
+
+      matrix_full_size( A );
+      matrix_shrink_header( A , row2 - row1 , ens_size );
+      node_info.active_list = chunk_list;
+      enkf_main_run_node_jobs( serialize_nodes_mt , &node_info , work_pool , serialize_info );
+      matrix_inplace_matmul_mt2( A , X , work_pool );
+      enkf_main_run_node_jobs( deserialize_nodes_mt , &node_info , work_pool , serialize_info );
+
+      active_list_free( chunk_list );
+    }
+
+    node_info.active_list = active_list;
+    enkf_main_run_node_jobs( store_nodes_mt , &node_info , work_pool , serialize_info );
+  }
+
+  for (int icpu = 0; icpu < num_cpu_threads; icpu++)
+    serialize_info[icpu].A = full_A;
+  matrix_free( A );
+}
+
+
+/*
+  The number of threads used to serialize, multiply and deserialize the
+  A matrix in an update: one per available core.
+*/
+static int enkf_main_get_update_threads() {
+  const unsigned int cores = std::thread::hardware_concurrency();
+  return (cores > 0) ? cores : 4;
 }
 
 
@@ -847,6 +1025,44 @@ static FILE * enkf_main_log_step_list(enkf_main_type * enkf_main, const int_vect
 }
 
 
+/**
+   Fills meas_data and obs_data with the simulated and observed data
+   for the observations of the ministep, and deactivates the outliers.
+*/
+static void enkf_main_collect_update_data(enkf_main_type * enkf_main,
+                                          enkf_fs_type * source_fs,
+                                          const int_vector_type * step_list,
+                                          const local_ministep_type * ministep,
+                                          const int_vector_type * ens_active_list,
+                                          meas_data_type * meas_data,
+                                          obs_data_type * obs_data) {
+  local_obsdata_type * obsdata = local_ministep_get_obsdata(ministep);
+
+  /*
+    Temporarily we will just force the timestep from the input
+    argument onto the obsdata instance; in the future the
+    obsdata should hold it's own here.
+  */
+  local_obsdata_reset_tstep_list(obsdata, step_list);
+
+  const analysis_config_type * analysis_config = enkf_main_get_analysis_config(enkf_main);
+  double alpha = analysis_config_get_alpha(analysis_config);
+  double std_cutoff = analysis_config_get_std_cutoff(analysis_config);
+
+  if (analysis_config_get_std_scale_correlated_obs(analysis_config)) {
+    double scale_factor = enkf_obs_scale_correlated_std(enkf_main->obs, source_fs,
+                                                        ens_active_list, obsdata, alpha, std_cutoff, false);
+    res_log_finfo("Scaling standard deviation in obdsata set:%s with %g",
+                  local_obsdata_get_name(obsdata), scale_factor);
+  }
+  enkf_obs_get_obs_and_measure_data(enkf_main->obs, source_fs, obsdata,
+                                    ens_active_list, meas_data, obs_data);
+
+  enkf_analysis_deactivate_outliers(obs_data, meas_data,
+                                    std_cutoff, alpha, enkf_main->verbose);
+}
+
+
 /**
  * This is THE ENKF update function.  It should only be called from enkf_main_UPDATE.
  */
@@ -914,28 +1130,8 @@ static void enkf_main_update__(enkf_main_type * enkf_main, const int_vector_type
         obs_data_reset(obs_data);
         meas_data_reset(meas_data);
 
-        /*
-          Temporarily we will just force the timestep from the input
-          argument onto the obsdata instance; in the future the
-          obsdata should hold it's own here.
-        */
-        local_obsdata_reset_tstep_list(obsdata, step_list);
-
-        const analysis_config_type * analysis_config = enkf_main_get_analysis_config(enkf_main);
-        double alpha = analysis_config_get_alpha(analysis_config);
-        double std_cutoff = analysis_config_get_std_cutoff(analysis_config);
-
-        if (analysis_config_get_std_scale_correlated_obs(analysis_config)) {
-          double scale_factor = enkf_obs_scale_correlated_std(enkf_main->obs, source_fs,
-                                                              ens_active_list, obsdata, alpha, std_cutoff, false);
-          res_log_finfo("Scaling standard deviation in obdsata set:%s with %g",
-                        local_obsdata_get_name(obsdata), scale_factor);
-        }
-        enkf_obs_get_obs_and_measure_data(enkf_main->obs, source_fs, obsdata,
-                                          ens_active_list, meas_data, obs_data);
-
-        enkf_analysis_deactivate_outliers(obs_data, meas_data,
-                                          std_cutoff, alpha, enkf_main->verbose);
+        enkf_main_collect_update_data(enkf_main, source_fs, step_list, ministep,
+                                      ens_active_list, meas_data, obs_data);
         local_ministep_add_obs_data(ministep, obs_data);
 
         if (enkf_main->verbose)
@@ -1025,8 +1221,11 @@ static void enkf_main_analysis_update( enkf_main_type * enkf_main ,
                                        const meas_data_type * forecast ,
                                        obs_data_type * obs_data) {
 
-  const int cpu_threads       = 4;
-  const int matrix_start_size = 250000;
+  const analysis_config_type * analysis_config = enkf_main_get_analysis_config(enkf_main);
+  const int cpu_threads       = enkf_main_get_update_threads();
+  const int row_chunk_size    = analysis_config_get_row_chunk_size( analysis_config );
+  /* With chunked updates A is only grown as needed for the parameters with row scaling. */
+  const int matrix_start_size = (row_chunk_size > 0) ? 1 : 250000;
   thread_pool_type * tp       = thread_pool_alloc( cpu_threads , false );
   int active_ens_size   = meas_data_get_active_ens_size( forecast );
   int active_size       = obs_data_get_active_size( obs_data );
@@ -1041,7 +1240,6 @@ static void enkf_main_analysis_update( enkf_main_type * enkf_main ,
   int_vector_type * iens_active_index = bool_vector_alloc_active_index_list(ens_mask , -1);
   const bool_vector_type * obs_mask = obs_data_get_active_mask(obs_data);
 
-  const analysis_config_type * analysis_config = enkf_main_get_analysis_config(enkf_main);
   analysis_module_type * module = analysis_config_get_active_module(analysis_config);
   if ( local_ministep_has_analysis_module (ministep))
     module = local_ministep_get_analysis_module (ministep);
@@ -1108,24 +1306,28 @@ static void enkf_main_analysis_update( enkf_main_type * enkf_main ,
           */
 
           // Part 1: Parameters which do not have row scaling attached.
-          enkf_main_serialize_dataset(enkf_main_get_ensemble_config(enkf_main), dataset , step2 ,  use_count , tp , serialize_info);
-          module_info_type * module_info = enkf_main_module_info_alloc(ministep, obs_data, dataset, local_obsdata, serialize_info->active_size.data() , serialize_info->row_offset.data());
-
-          if (analysis_module_check_option( module , ANALYSIS_UPDATE_A)){
-            if (analysis_module_check_option( module , ANALYSIS_ITERABLE)){
-              analysis_module_updateA( module , localA , S , R , dObs , E , D , module_info, enkf_main->shared_rng);
-            }
-            else
-              analysis_module_updateA( module , localA , S , R , dObs , E , D , module_info, enkf_main->shared_rng);
+          if ((localA == NULL) && (row_chunk_size > 0)) {
+            enkf_main_update_dataset_chunked(enkf_main_get_ensemble_config(enkf_main), dataset, step2, row_chunk_size, X, tp, serialize_info);
           } else {
-            if (analysis_module_check_option( module , ANALYSIS_USE_A)){
-            analysis_module_initX( module , X , localA , S , R , dObs , E , D, enkf_main->shared_rng);
+            enkf_main_serialize_dataset(enkf_main_get_ensemble_config(enkf_main), dataset , step2 ,  use_count , tp , serialize_info);
+            module_info_type * module_info = enkf_main_module_info_alloc(ministep, obs_data, dataset, local_obsdata, serialize_info->active_size.data() , serialize_info->row_offset.data());
+
+            if (analysis_module_check_option( module , ANALYSIS_UPDATE_A)){
+              if (analysis_module_check_option( module , ANALYSIS_ITERABLE)){
+                analysis_module_updateA( module , localA , S , R , dObs , E , D , module_info, enkf_main->shared_rng);
+              }
+              else
+                analysis_module_updateA( module , localA , S , R , dObs , E , D , module_info, enkf_main->shared_rng);
+            } else {
+              if (analysis_module_check_option( module , ANALYSIS_USE_A)){
+              analysis_module_initX( module , X , localA , S , R , dObs , E , D, enkf_main->shared_rng);
+              }
+              matrix_inplace_matmul_mt2( A , X , tp );
             }
-            matrix_inplace_matmul_mt2( A , X , tp );
-          }
 
-          enkf_main_deserialize_dataset( enkf_main_get_ensemble_config( enkf_main ) , dataset , serialize_info , tp);
-          enkf_main_module_info_free( module_info );
+            enkf_main_deserialize_dataset( enkf_main_get_ensemble_config( enkf_main ) , dataset , serialize_info , tp);
+            enkf_main_module_info_free( module_info );
+          }
         }
 
         // Part 2: Parameters with row scaling attached - to support distance based localization.
@@ -1257,25 +1459,130 @@ static bool enkf_main_smoother_update__(enkf_main_type * enkf_main , const int_v
 }
 
 
-bool enkf_main_smoother_update(enkf_main_type * enkf_main , enkf_fs_type * source_fs, enkf_fs_type * target_fs) {
+static int_vector_type * enkf_main_alloc_smoother_step_list(const enkf_main_type * enkf_main , enkf_fs_type * source_fs) {
   int stride = 1;
-  int step2;
   time_map_type * time_map = enkf_fs_get_time_map( source_fs );
-  int_vector_type * step_list;
-  bool update_done;
-
-  step2 = time_map_get_last_step( time_map );
+  int step2 = time_map_get_last_step( time_map );
   if (step2 < 0)
     step2 = model_config_get_last_history_restart(enkf_main_get_model_config(enkf_main));
 
-  step_list = enkf_main_update_alloc_step_list( enkf_main , 0 , step2 , stride);
-  update_done = enkf_main_smoother_update__( enkf_main , step_list , source_fs, target_fs );
+  return enkf_main_update_alloc_step_list( enkf_main , 0 , step2 , stride);
+}
+
+
+bool enkf_main_smoother_update(enkf_main_type * enkf_main , enkf_fs_type * source_fs, enkf_fs_type * target_fs) {
+  int_vector_type * step_list = enkf_main_alloc_smoother_step_list( enkf_main , source_fs );
+  bool update_done = enkf_main_smoother_update__( enkf_main , step_list , source_fs, target_fs );
   int_vector_free( step_list );
 
   return update_done;
 }
 
 
+/*
+  The functions below expose the building blocks of the smoother update
+  to external update engines: enkf_main_get_update_data() collects the
+  observed and simulated data of a ministep, enkf_main_alloc_update_A()
+  serializes the parameters of a dataset to the A matrix, and
+  enkf_main_save_update_A() writes an updated A matrix back to the
+  storage. Only the parameters without row scaling are included in A.
+*/
+
+void enkf_main_get_update_data(enkf_main_type * enkf_main ,
+                               enkf_fs_type * source_fs ,
+                               const local_ministep_type * ministep ,
+                               const bool_vector_type * ens_mask ,
+                               meas_data_type * meas_data ,
+                               obs_data_type * obs_data) {
+  int_vector_type * step_list = enkf_main_alloc_smoother_step_list( enkf_main , source_fs );
+  int_vector_type * ens_active_list = bool_vector_alloc_active_list( ens_mask );
+
+  enkf_main_collect_update_data( enkf_main , source_fs , step_list , ministep , ens_active_list , meas_data , obs_data );
+
+  int_vector_free( ens_active_list );
+  int_vector_free( step_list );
+}
+
+
+matrix_type * enkf_main_alloc_update_A(enkf_main_type * enkf_main ,
+                                       enkf_fs_type * source_fs ,
+                                       const local_dataset_type * dataset ,
+                                       const bool_vector_type * ens_mask) {
+  const int cpu_threads = enkf_main_get_update_threads();
+  int active_ens_size = bool_vector_count_equal( ens_mask , true );
+  if (active_ens_size == 0)
+    return NULL;
+
+  int_vector_type * step_list = enkf_main_alloc_smoother_step_list( enkf_main , source_fs );
+  int_vector_type * iens_active_index = bool_vector_alloc_active_index_list( ens_mask , -1 );
+  thread_pool_type * tp = thread_pool_alloc( cpu_threads , false );
+  matrix_type * A = matrix_alloc( 1 , active_ens_size );
+  serialize_info_type * serialize_info = serialize_info_alloc( source_fs ,
+                                                               source_fs ,
+                                                               enkf_main_get_ensemble_config(enkf_main),
+                                                               iens_active_index,
+                                                               0 ,
+                                                               enkf_main->ensemble,
+                                                               SMOOTHER_RUN ,
+                                                               int_vector_get_last( step_list ) ,
+                                                               A ,
+                                                               cpu_threads);
+  enkf_main_serialize_dataset( enkf_main_get_ensemble_config(enkf_main) , dataset , int_vector_get_last( step_list ) , NULL , tp , serialize_info );
+
+  /* The serialized matrix keeps the row stride of the storage; return a compact copy. */
+  matrix_type * compact_A = matrix_alloc_copy( A );
+
+  serialize_info_free( serialize_info );
+  matrix_free( A );
+  thread_pool_free( tp );
+  int_vector_free( iens_active_index );
+  int_vector_free( step_list );
+  return compact_A;
+}
+
+
+/**
+   Will write the updated parameters in A to target_fs. The parameters
+   are initialized from source_fs, so the elements which are not active
+   in the dataset keep their value from the source case. Returns false,
+   without writing anything, if the dimensions of A do not match the
+   dataset.
+*/
+bool enkf_main_save_update_A(enkf_main_type * enkf_main ,
+                             enkf_fs_type * source_fs ,
+                             enkf_fs_type * target_fs ,
+                             const local_dataset_type * dataset ,
+                             const bool_vector_type * ens_mask ,
+                             matrix_type * A) {
+  const int cpu_threads = enkf_main_get_update_threads();
+  ensemble_config_type * ensemble_config = enkf_main_get_ensemble_config(enkf_main);
+  int_vector_type * step_list = enkf_main_alloc_smoother_step_list( enkf_main , source_fs );
+  int_vector_type * iens_active_index = bool_vector_alloc_active_index_list( ens_mask , -1 );
+  serialize_info_type * serialize_info = serialize_info_alloc( source_fs ,
+                                                               target_fs ,
+                                                               ensemble_config ,
+                                                               iens_active_index,
+                                                               0 ,
+                                                               enkf_main->ensemble,
+                                                               SMOOTHER_RUN ,
+                                                               int_vector_get_last( step_list ) ,
+                                                               A ,
+                                                               cpu_threads);
+  int rows = enkf_main_init_dataset_layout( ensemble_config , dataset , int_vector_get_last( step_list ) , serialize_info );
+  bool valid = matrix_check_dims( A , rows , bool_vector_count_equal( ens_mask , true ));
+  if (valid) {
+    thread_pool_type * tp = thread_pool_alloc( cpu_threads , false );
+    enkf_main_deserialize_dataset( ensemble_config , dataset , serialize_info , tp );
+    thread_pool_free( tp );
+  }
+
+  serialize_info_free( serialize_info );
+  int_vector_free( iens_active_index );
+  int_vector_free( step_list );
+  return valid;
+}
+
+
 static void enkf_main_monitor_job_queue ( const enkf_main_type * enkf_main, job_queue_type * job_queue) {
   const analysis_config_type * analysis_config = enkf_main_get_analysis_config( enkf_main );
   if (analysis_config_get_stop_long_running(analysis_config)) {
@@ -1955,12 +2262,21 @@ int enkf_main_load_from_forward_model_with_fs(enkf_main_type * enkf_main, int it
 
 
 int enkf_main_load_from_run_context_from_gui(enkf_main_type* enkf_main, ert_run_context_type* run_context, enkf_fs_type* fs) {
+   return enkf_main_load_from_run_context_timed_from_gui(enkf_main, run_context, fs, 0, NULL);
+}
+
+
+int enkf_main_load_from_run_context_timed_from_gui(enkf_main_type* enkf_main,
+                                                   ert_run_context_type* run_context,
+                                                   enkf_fs_type* fs,
+                                                   int num_threads,
+                                                   double_vector_type * load_times) {
    auto const ens_size = enkf_main_get_ensemble_size(enkf_main);
    stringlist_type ** realizations_msg_list = (stringlist_type **) util_calloc(ens_size, sizeof *realizations_msg_list); // CXX_CAST_ERROR
    for(int iens = 0; iens < ens_size; ++iens)
       realizations_msg_list[iens] = stringlist_alloc_new();
 
-   int loaded = enkf_main_load_from_run_context(enkf_main, run_context, realizations_msg_list, fs);
+   int loaded = enkf_main_load_from_run_context_timed(enkf_main, run_context, realizations_msg_list, fs, num_threads, load_times);
 
    for(int iens = 0; iens < ens_size; ++iens)
       stringlist_free(realizations_msg_list[iens]);
@@ -1968,20 +2284,67 @@ int enkf_main_load_from_run_context_from_gui(enkf_main_type* enkf_main, ert_run_
    return loaded;
 }
 
+
+/*
+  Thread pool job which loads one realization like
+  enkf_state_load_from_forward_model_mt(), and in addition stores the wall
+  clock time spent, in seconds, in the double pointed to by argument 5.
+*/
+
+static void * enkf_main_load_from_forward_model_timed_mt( void * arg ) {
+   arg_pack_type * arg_pack = arg_pack_safe_cast( arg );
+   double * load_time = (double *) arg_pack_iget_ptr( arg_pack , 5 );
+   auto const start = std::chrono::steady_clock::now();
+
+   enkf_state_load_from_forward_model_mt( arg );
+
+   std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+   *load_time = elapsed.count();
+   return NULL;
+}
+
+
 int enkf_main_load_from_run_context(
       enkf_main_type * enkf_main,
       ert_run_context_type * run_context,
       stringlist_type ** realizations_msg_list,
       enkf_fs_type * fs) {
+   return enkf_main_load_from_run_context_timed(enkf_main, run_context, realizations_msg_list, fs, 0, NULL);
+}
+
+
+/*
+  Loads the results of all active realizations in @run_context using a
+  pool of @num_threads threads; if @num_threads <= 0 one thread per core is
+  used. The state map is protected by a lock, so the realizations can be
+  loaded concurrently.
+
+  If @load_times is not NULL it is resized to the ensemble size, and the
+  wall clock time used to load each realization is stored in it; inactive
+  realizations get the value -1.
+*/
+
+int enkf_main_load_from_run_context_timed(
+      enkf_main_type * enkf_main,
+      ert_run_context_type * run_context,
+      stringlist_type ** realizations_msg_list,
+      enkf_fs_type * fs,
+      int num_threads,
+      double_vector_type * load_times) {
    auto const ens_size = enkf_main_get_ensemble_size( enkf_main );
    auto const * iactive = ert_run_context_get_iactive(run_context);
 
+   if (num_threads <= 0)
+     num_threads = util_int_max( 1 , (int) std::thread::hardware_concurrency() );
+
    int result[ens_size];
+   double load_time[ens_size];
    arg_pack_type ** arg_list = (arg_pack_type **) util_calloc( ens_size , sizeof * arg_list ); // CXX_CAST_ERROR
-   thread_pool_type * tp     = thread_pool_alloc( std::thread::hardware_concurrency() , true );
+   thread_pool_type * tp     = thread_pool_alloc( num_threads , true );
 
    for (int iens = 0; iens < ens_size; ++iens) {
      result[iens] = 0;
+     load_time[iens] = -1;
      arg_pack_type * arg_pack = arg_pack_alloc();
      arg_list[iens] = arg_pack;
 
@@ -1992,7 +2355,8 @@ int enkf_main_load_from_run_context(
        arg_pack_append_ptr(arg_pack, realizations_msg_list[iens]);                          /* 2: List of interactive mode messages. */
        arg_pack_append_bool( arg_pack, true );                                              /* 3: Manual load */
        arg_pack_append_ptr(arg_pack, &result[iens]);                                        /* 4: Result */
-       thread_pool_add_job( tp , enkf_state_load_from_forward_model_mt , arg_pack);
+       arg_pack_append_ptr(arg_pack, &load_time[iens]);                                     /* 5: Load time */
+       thread_pool_add_job( tp , enkf_main_load_from_forward_model_timed_mt , arg_pack);
      }
    }
 
@@ -2012,6 +2376,12 @@ int enkf_main_load_from_run_context(
      arg_pack_free(arg_list[iens]);
    }
    free( arg_list );
+
+   if (load_times) {
+     double_vector_reset( load_times );
+     for (int iens = 0; iens < ens_size; ++iens)
+       double_vector_iset( load_times , iens , load_time[iens] );
+   }
    return loaded;
 }
 
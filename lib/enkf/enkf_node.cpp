@@ -625,10 +625,20 @@ bool enkf_node_has_data( enkf_node_type * enkf_node , enkf_fs_type * fs , node_i
 void enkf_node_serialize(enkf_node_type *enkf_node , enkf_fs_type * fs, node_id_type node_id ,
                          const active_list_type * active_list , matrix_type * A , int row_offset , int column) {
 
-  FUNC_ASSERT(enkf_node->serialize);
   enkf_node_load( enkf_node , fs , node_id);
-  enkf_node->serialize(enkf_node->data , node_id , active_list , A , row_offset , column);
+  enkf_node_serialize_loaded( enkf_node , node_id , active_list , A , row_offset , column );
+}
 
+
+/**
+   Like enkf_node_serialize(), but serializes the data already held by
+   the node instead of loading it from storage.
+*/
+void enkf_node_serialize_loaded(const enkf_node_type *enkf_node , node_id_type node_id ,
+                                const active_list_type * active_list , matrix_type * A , int row_offset , int column) {
+
+  FUNC_ASSERT(enkf_node->serialize);
+  enkf_node->serialize(enkf_node->data , node_id , active_list , A , row_offset , column);
 }
 
 
@@ -636,9 +646,20 @@ void enkf_node_serialize(enkf_node_type *enkf_node , enkf_fs_type * fs, node_id_
 void enkf_node_deserialize(enkf_node_type *enkf_node , enkf_fs_type * fs , node_id_type node_id,
                            const active_list_type * active_list , const matrix_type * A , int row_offset , int column) {
 
+  enkf_node_deserialize_loaded( enkf_node , node_id , active_list , A , row_offset , column );
+  enkf_node_store( enkf_node , fs , node_id );
+}
+
+
+/**
+   Like enkf_node_deserialize(), but only updates the data held by the
+   node; the node is not stored.
+*/
+void enkf_node_deserialize_loaded(enkf_node_type *enkf_node , node_id_type node_id,
+                                  const active_list_type * active_list , const matrix_type * A , int row_offset , int column) {
+
   FUNC_ASSERT(enkf_node->deserialize);
   enkf_node->deserialize(enkf_node->data , node_id , active_list , A , row_offset , column);
-  enkf_node_store( enkf_node , fs , node_id );
 }
 
 
@@ -20,6 +20,14 @@
 #include <stdlib.h>
 #include <cmath>
 
+#include <algorithm>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+#include <unordered_set>
+#include <utility>
+#include <vector>
+
 #include <ert/util/hash.h>
 #include <ert/util/vector.h>
 #include <ert/util/type_vector_functions.h>
@@ -171,12 +179,30 @@ In the following example we have two observations
 
 
 #define ENKF_OBS_TYPE_ID 637297
+/*
+  The observation keys sorted lexically, each paired with the position of
+  the observation in obs_vector. A glob pattern only has to be matched
+  against the keys sharing its literal prefix, and the matching positions
+  of every pattern are cached until observations are added or cleared.
+*/
+struct enkf_obs_key_index {
+  std::mutex mutex;
+  bool sorted = true;
+  std::vector<std::pair<std::string, int>> keys;
+  std::unordered_map<std::string, std::vector<int>> matches;
+};
+
+
 struct enkf_obs_struct {
   UTIL_TYPE_ID_DECLARATION;
   /** A hash of obs_vector_types indexed by user provided keys. */
   vector_type         * obs_vector;
   hash_type           * obs_hash;
+  /** A hash of stringlists with the observation keys of each observed state_kw. */
+  hash_type           * data_index;
   time_map_type       * obs_time;     /* For fast lookup of report_step -> obs_time */
+  /** Sorted observation keys and cached glob matches, see enkf_obs_alloc_matching_keylist(). */
+  enkf_obs_key_index  * key_index;
 
   bool                  valid;
   /* Several shared resources - can generally be NULL*/
@@ -214,8 +240,10 @@ enkf_obs_type * enkf_obs_alloc( const history_type * history ,
   enkf_obs_type * enkf_obs = (enkf_obs_type *)util_malloc(sizeof * enkf_obs);
   UTIL_TYPE_ID_INIT( enkf_obs , ENKF_OBS_TYPE_ID );
   enkf_obs->obs_hash        = hash_alloc();
+  enkf_obs->data_index      = hash_alloc();
   enkf_obs->obs_vector      = vector_alloc_new();
   enkf_obs->obs_time        = time_map_alloc();
+  enkf_obs->key_index       = new enkf_obs_key_index();
 
   enkf_obs->history         = history;
   enkf_obs->refcase         = refcase;
@@ -265,9 +293,11 @@ bool enkf_obs_is_valid(const enkf_obs_type* obs) {
 
 void enkf_obs_free(enkf_obs_type * enkf_obs) {
   hash_free(enkf_obs->obs_hash);
+  hash_free(enkf_obs->data_index);
   vector_free( enkf_obs->obs_vector );
   time_map_free( enkf_obs->obs_time );
-    free(enkf_obs);
+  delete enkf_obs->key_index;
+  free(enkf_obs);
 }
 
 
@@ -294,7 +324,22 @@ void enkf_obs_add_obs_vector(enkf_obs_type       * enkf_obs,
       util_abort("%s: Observation with key:%s already added.\n",__func__ , obs_key);
 
     hash_insert_ref(enkf_obs->obs_hash , obs_key , vector );
+    {
+      enkf_obs_key_index * key_index = enkf_obs->key_index;
+      std::lock_guard<std::mutex> lock( key_index->mutex );
+      key_index->keys.emplace_back( obs_key , vector_get_size( enkf_obs->obs_vector ));
+      key_index->sorted = false;
+      key_index->matches.clear();
+    }
     vector_append_owned_ref( enkf_obs->obs_vector , vector , obs_vector_free__);
+
+    if (obs_vector_get_config_node( vector ) != NULL) {
+      const char * state_kw = obs_vector_get_state_kw( vector );
+      if (!hash_has_key( enkf_obs->data_index , state_kw ))
+        hash_insert_hash_owned_ref( enkf_obs->data_index , state_kw , stringlist_alloc_new() , stringlist_free__ );
+
+      stringlist_append_copy( (stringlist_type *) hash_get( enkf_obs->data_index , state_kw ) , obs_key );
+    }
   }
 }
 
@@ -493,7 +538,15 @@ void enkf_obs_get_obs_and_measure_data(const enkf_obs_type      * enkf_obs,
 
 void enkf_obs_clear( enkf_obs_type * enkf_obs ) {
   hash_clear( enkf_obs->obs_hash );
+  hash_clear( enkf_obs->data_index );
   vector_clear( enkf_obs->obs_vector );
+  {
+    enkf_obs_key_index * key_index = enkf_obs->key_index;
+    std::lock_guard<std::mutex> lock( key_index->mutex );
+    key_index->keys.clear();
+    key_index->sorted = true;
+    key_index->matches.clear();
+  }
   ensemble_config_clear_obs_keys(enkf_obs->ensemble_config);
 }
 
@@ -1052,38 +1105,100 @@ obs_impl_type enkf_obs_get_type(const enkf_obs_type * enkf_obs , const char * ke
   return obs_vector_get_impl_type(obs_vector);
 }
 
+/*
+  Returns the obs_vector positions of the observations whose key matches
+  the glob pattern, in insertion order. Must be called with the mutex of
+  the key index held; the returned reference is valid until the index is
+  invalidated.
+*/
+static const std::vector<int>& enkf_obs_key_index_match( enkf_obs_key_index * key_index , const char * pattern ) {
+  auto cached = key_index->matches.find( pattern );
+  if (cached != key_index->matches.end())
+    return cached->second;
+
+  if (!key_index->sorted) {
+    std::sort( key_index->keys.begin() , key_index->keys.end() );
+    key_index->sorted = true;
+  }
+
+  const std::string prefix( pattern , strcspn( pattern , "*?[\\" ));
+  std::vector<int> positions;
+  auto iter = std::lower_bound( key_index->keys.begin() , key_index->keys.end() , prefix ,
+                                [](const std::pair<std::string, int>& entry , const std::string& value) {
+                                  return entry.first < value;
+                                });
+  for (; iter != key_index->keys.end() && iter->first.compare( 0 , prefix.size() , prefix ) == 0; ++iter) {
+    if (util_string_match( iter->first.c_str() , pattern ))
+      positions.push_back( iter->second );
+  }
+  std::sort( positions.begin() , positions.end() );
+  return key_index->matches.emplace( pattern , std::move( positions )).first->second;
+}
+
+
 /**
- */
+   Returns the observation keys matching any of the space separated
+   patterns in input_string, in the order the observations were added.
+   Patterns without wildcards are looked up directly in the hash table,
+   glob patterns go through the sorted key index and their matches are
+   cached until the set of observations changes.
+*/
 
 stringlist_type * enkf_obs_alloc_matching_keylist(const enkf_obs_type * enkf_obs,
                                                   const char * input_string) {
 
-  stringlist_type * obs_keys = hash_alloc_stringlist( enkf_obs->obs_hash );
-
   if (!input_string)
-      return obs_keys;
+    return hash_alloc_stringlist( enkf_obs->obs_hash );
 
   stringlist_type  *  matching_keys = stringlist_alloc_new();
+  std::unordered_set<std::string> matched;
   char             ** input_keys;
   int                 num_keys;
-  int                 obs_keys_count = stringlist_get_size( obs_keys );
+  enkf_obs_key_index * key_index = enkf_obs->key_index;
 
   util_split_string( input_string , " " , &num_keys , &input_keys);
-  for (int i = 0; i < num_keys; i++) {
-    const char * input_key = input_keys[i];
-    for (int j = 0; j < obs_keys_count; j++) {
-      const char * obs_key = stringlist_iget( obs_keys , j);
-
-      if (util_string_match( obs_key , input_key)
-          && !stringlist_contains( matching_keys , obs_key ))
-        stringlist_append_copy( matching_keys , obs_key);
+  {
+    std::lock_guard<std::mutex> lock( key_index->mutex );
+    for (int i = 0; i < num_keys; i++) {
+      const char * input_key = input_keys[i];
+      if (strpbrk( input_key , "*?[" ) == NULL) {
+        if (hash_has_key( enkf_obs->obs_hash , input_key ) && matched.insert( input_key ).second)
+          stringlist_append_copy( matching_keys , input_key );
+      } else {
+        for (int index : enkf_obs_key_index_match( key_index , input_key )) {
+          const obs_vector_type * obs_vector = (const obs_vector_type *) vector_iget_const( enkf_obs->obs_vector , index );
+          const char * obs_key = obs_vector_get_key( obs_vector );
+
+          if (matched.insert( obs_key ).second)
+            stringlist_append_copy( matching_keys , obs_key);
+        }
+      }
     }
   }
   util_free_stringlist( input_keys , num_keys );
-  stringlist_free( obs_keys );
   return matching_keys;
 }
 
+
+/**
+   Returns the state_kw keys which are observed by at least one
+   observation.
+*/
+stringlist_type * enkf_obs_alloc_data_keylist(const enkf_obs_type * enkf_obs) {
+  return hash_alloc_stringlist( enkf_obs->data_index );
+}
+
+
+/**
+   Returns the keys of the observations of the state_kw data_key, in the
+   order the observations were added.
+*/
+stringlist_type * enkf_obs_alloc_data_obs_keylist(const enkf_obs_type * enkf_obs , const char * data_key) {
+  if (hash_has_key( enkf_obs->data_index , data_key ))
+    return stringlist_alloc_deep_copy( (const stringlist_type *) hash_get( enkf_obs->data_index , data_key ));
+  return stringlist_alloc_new();
+}
+
 /**
    This function allocates a hash table which looks like this:
 
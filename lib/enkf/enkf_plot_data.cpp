@@ -106,6 +106,18 @@ int enkf_plot_data_get_size( const enkf_plot_data_type * plot_data ) {
 }
 
 
+/*
+  Will export the values of the whole ensemble in one go. The @values and
+  @mask buffers must hold size * num_steps elements, and are filled in
+  row major order with one row per realization.
+*/
+
+void enkf_plot_data_export( const enkf_plot_data_type * plot_data , int num_steps , double * values , bool * mask) {
+  for (int iens = 0; iens < plot_data->size; iens++)
+    enkf_plot_tvector_export( plot_data->ensemble[iens] , num_steps , &values[iens * num_steps] , &mask[iens * num_steps]);
+}
+
+
 
 
 void enkf_plot_data_load( enkf_plot_data_type * plot_data ,
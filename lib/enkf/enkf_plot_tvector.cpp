@@ -15,6 +15,8 @@
    See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
    for more details.
 */
+#include <math.h>
+
 #include <ert/util/util.h>
 #include <ert/util/double_vector.h>
 #include <ert/util/time_t_vector.h>
@@ -123,6 +125,27 @@ bool enkf_plot_tvector_iget_active( const enkf_plot_tvector_type * plot_tvector
 }
 
 
+/*
+  Will copy the first @num_steps values of the vector to the caller
+  supplied @values and @mask buffers. Steps which are not active, or
+  beyond the end of the vector, are set to NAN in @values and false in
+  @mask.
+*/
+
+void enkf_plot_tvector_export( const enkf_plot_tvector_type * plot_tvector , int num_steps , double * values , bool * mask) {
+  int size = util_int_min( num_steps , enkf_plot_tvector_size( plot_tvector ));
+  for (int step = 0; step < size; step++) {
+    mask[step] = bool_vector_iget( plot_tvector->mask , step );
+    values[step] = mask[step] ? double_vector_iget( plot_tvector->data , step ) : NAN;
+  }
+
+  for (int step = size; step < num_steps; step++) {
+    mask[step] = false;
+    values[step] = NAN;
+  }
+}
+
+
 
 
 
@@ -46,9 +46,12 @@ void fs_driver_init(fs_driver_type * driver) {
   driver->save_vector   = NULL;
   driver->has_vector    = NULL;
   driver->unlink_vector = NULL;
+  driver->node_view     = NULL;
+  driver->vector_view   = NULL;
 
   driver->free_driver   = NULL;
   driver->fsync_driver  = NULL;
+  driver->compact_driver = NULL;
 }
 
 fs_driver_type * fs_driver_safe_cast(void * __driver) {
@@ -174,6 +174,10 @@ hash_iter_type * local_ministep_alloc_dataset_iter( const local_ministep_type *
   return hash_iter_alloc( ministep->datasets );
 }
 
+stringlist_type * local_ministep_alloc_dataset_keys( const local_ministep_type * ministep ) {
+  return hash_alloc_stringlist( ministep->datasets );
+}
+
 
 bool local_ministep_has_analysis_module( const local_ministep_type * ministep){
   return ministep->analysis_module != NULL;
@@ -492,6 +492,9 @@ void model_config_init(model_config_type * model_config ,
   if (config_content_has_item( config , MAX_RESAMPLE_KEY))
     model_config_set_max_internal_submit( model_config , config_content_get_value_as_int( config , MAX_RESAMPLE_KEY ));
 
+  if (config_content_has_item( config , MEMORY_POLL_PERIOD_KEY))
+    forward_model_set_memory_poll_period( model_config->forward_model , config_content_get_value_as_double( config , MEMORY_POLL_PERIOD_KEY ));
+
 
   {
     if (config_content_has_item( config , GEN_KW_EXPORT_NAME_KEY)) {
@@ -666,6 +669,7 @@ static void model_config_init_user_config(config_parser_type * config ) {
   config_add_key_value(config, LOG_FILE_KEY, false, CONFIG_PATH);
 
   config_add_key_value(config, MAX_RESAMPLE_KEY, false, CONFIG_INT);
+  config_add_key_value(config, MEMORY_POLL_PERIOD_KEY, false, CONFIG_FLOAT);
 
 
   item = config_add_schema_item(config, NUM_REALIZATIONS_KEY, true);
@@ -319,6 +319,28 @@ void obs_vector_user_get(const obs_vector_type * obs_vector , const char * index
   obs_vector->user_get(obs_node , index_key , value , std , valid);
 }
 
+
+/**
+   Will fill the arrays @steps, @values and @std with the active report
+   steps of a summary observation vector, and the observed value and
+   standard deviation at each of them. The arrays must have room for
+   obs_vector_get_num_active() elements.
+*/
+
+void obs_vector_export_summary_data(const obs_vector_type * obs_vector , int * steps , double * values , double * std) {
+  if (obs_vector->obs_type != SUMMARY_OBS)
+    util_abort("%s: observation vector %s is not a summary observation \n",__func__ , obs_vector->obs_key);
+
+  for (int i = 0; i < int_vector_size( obs_vector->step_list ); i++) {
+    int step = int_vector_iget( obs_vector->step_list , i );
+    const summary_obs_type * summary_obs = (const summary_obs_type *) vector_iget_const( obs_vector->nodes , step );
+
+    steps[i]  = step;
+    values[i] = summary_obs_get_value( summary_obs );
+    std[i]    = summary_obs_get_std( summary_obs );
+  }
+}
+
 /*
   This function returns the next active (i.e. node != NULL) report
   step, starting with 'prev_step + 1'. If no more active steps are
@@ -963,6 +985,36 @@ double obs_vector_total_chi2(const obs_vector_type * obs_vector , enkf_fs_type *
 }
 
 
+/**
+   This function will evaluate the chi2 of the realizations in
+   @realizations at every active report step of the observation vector.
+   The result is stored in @chi2, which must have room for
+   obs_vector_get_num_active() * @num_realizations elements, with one
+   row of @num_realizations elements for each active step. Realizations
+   without data for a step get chi2 zero, as in obs_vector_total_chi2().
+*/
+
+void obs_vector_export_chi2(const obs_vector_type * obs_vector , enkf_fs_type * fs , int num_realizations , const int * realizations , double * chi2) {
+  enkf_node_type * enkf_node = enkf_node_deep_alloc( obs_vector->config_node );
+  node_id_type node_id;
+
+  for (int i = 0; i < int_vector_size( obs_vector->step_list ); i++) {
+    int report_step = int_vector_iget( obs_vector->step_list , i );
+    double * step_chi2 = &chi2[i * num_realizations];
+    node_id.report_step = report_step;
+
+    for (int j = 0; j < num_realizations; j++) {
+      node_id.iens = realizations[j];
+      if (enkf_node_try_load( enkf_node , fs , node_id))
+        step_chi2[j] = obs_vector_chi2__(obs_vector , report_step , enkf_node, node_id);
+      else
+        step_chi2[j] = 0;
+    }
+  }
+  enkf_node_free( enkf_node );
+}
+
+
 const char * obs_vector_get_obs_key( const obs_vector_type * obs_vector) {
   return obs_vector->obs_key;
 }
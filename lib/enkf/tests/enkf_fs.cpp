@@ -28,6 +28,7 @@
 
 #include <ert/util/test_util.h>
 #include <ert/util/test_work_area.hpp>
+#include <ert/res_util/thread_pool.hpp>
 #include <ert/enkf/enkf_fs.hpp>
 
 
@@ -69,6 +70,63 @@ void test_refcount() {
   }
 }
 
+typedef struct {
+  enkf_fs_type * fs;
+  int iens;
+} write_arg_type;
+
+
+static void * write_vector__( void * arg ) {
+  write_arg_type * write_arg = (write_arg_type *) arg;
+  buffer_type * buffer = buffer_alloc( 100 );
+  for (int i = 0; i < 100; i++)
+    buffer_fwrite_int( buffer , write_arg->iens * 1000 + i );
+
+  enkf_fs_fwrite_vector( write_arg->fs , buffer , "KEY" , DYNAMIC_RESULT , write_arg->iens );
+  buffer_free( buffer );
+  return NULL;
+}
+
+
+void test_sharded() {
+  ecl::util::TestArea ta("sharded");
+  const int ens_size = 50;
+  {
+    enkf_fs_type * fs = enkf_fs_create_fs( "default" , BLOCK_FS_DRIVER_ID , NULL , true);
+    test_assert_int_equal( ENKF_FS_DEFAULT_NUM_SHARDS , enkf_fs_get_num_shards( fs ));
+    enkf_fs_decref( fs );
+  }
+  {
+    enkf_fs_type * fs = enkf_fs_create_sharded_fs( "mnt" , BLOCK_FS_DRIVER_ID , ens_size , true);
+    write_arg_type write_args[ens_size];
+    thread_pool_type * tp = thread_pool_alloc( 8 , true );
+
+    test_assert_int_equal( ens_size , enkf_fs_get_num_shards( fs ));
+    test_assert_true( util_is_directory( "mnt/Ensemble/mod_49" ));
+    for (int iens = 0; iens < ens_size; iens++) {
+      write_args[iens].fs = fs;
+      write_args[iens].iens = iens;
+      thread_pool_add_job( tp , write_vector__ , &write_args[iens] );
+    }
+    thread_pool_join( tp );
+    thread_pool_free( tp );
+    enkf_fs_decref( fs );
+  }
+  {
+    enkf_fs_type * fs = enkf_fs_mount( "mnt" );
+    buffer_type * buffer = buffer_alloc( 100 );
+    test_assert_int_equal( ens_size , enkf_fs_get_num_shards( fs ));
+    for (int iens = 0; iens < ens_size; iens++) {
+      enkf_fs_fread_vector( fs , buffer , "KEY" , DYNAMIC_RESULT , iens );
+      buffer_rewind( buffer );
+      for (int i = 0; i < 100; i++)
+        test_assert_int_equal( iens * 1000 + i , buffer_fread_int( buffer ));
+    }
+    buffer_free( buffer );
+    enkf_fs_decref( fs );
+  }
+}
+
 void createFS() {
 
  pthread_mutex_lock(&data->mutex1);
@@ -146,6 +204,7 @@ void test_read_only2() {
 int main(int argc, char ** argv) {
   test_mount();
   test_refcount();
+  test_sharded();
   test_read_only2();
   exit(0);
 }
@@ -53,6 +53,33 @@ int main(int argc, char ** argv) {
 
   enkf_obs_scale_std(enkf_obs, 3.3);
 
+  {
+    stringlist_type * keys = enkf_obs_alloc_matching_keylist( enkf_obs , "WWCT2 W*" );
+    test_assert_int_equal( stringlist_get_size( keys ) , 2 );
+    test_assert_string_equal( stringlist_iget( keys , 0 ) , "WWCT2" );
+    test_assert_string_equal( stringlist_iget( keys , 1 ) , "WWCT" );
+    stringlist_free( keys );
+
+    keys = enkf_obs_alloc_matching_keylist( enkf_obs , "*2" );
+    test_assert_int_equal( stringlist_get_size( keys ) , 1 );
+    test_assert_string_equal( stringlist_iget( keys , 0 ) , "WWCT2" );
+    stringlist_free( keys );
+  }
+
+  {
+    obs_vector_type * obs_vector3 = obs_vector_alloc(SUMMARY_OBS, "WOPR", NULL, 2);
+    summary_obs_type * summary_obs5 = summary_obs_alloc( "SummaryKey" , "ObservationKey" , 43.2, 2.0);
+    obs_vector_install_node( obs_vector3 , 0 , summary_obs5 );
+    enkf_obs_add_obs_vector(enkf_obs, obs_vector3);
+
+    stringlist_type * keys = enkf_obs_alloc_matching_keylist( enkf_obs , "W*" );
+    test_assert_int_equal( stringlist_get_size( keys ) , 3 );
+    test_assert_string_equal( stringlist_iget( keys , 0 ) , "WWCT" );
+    test_assert_string_equal( stringlist_iget( keys , 1 ) , "WWCT2" );
+    test_assert_string_equal( stringlist_iget( keys , 2 ) , "WOPR" );
+    stringlist_free( keys );
+  }
+
   enkf_obs_free(enkf_obs);
 
   exit(0);
@@ -82,6 +82,8 @@ void                   analysis_config_set_merge_observations( analysis_config_t
 void                   analysis_config_set_log_path(analysis_config_type * config , const char * log_path );
 void                   analysis_config_set_std_cutoff( analysis_config_type * config , double std_cutoff );
 double                 analysis_config_get_std_cutoff( const analysis_config_type * config );
+void                   analysis_config_set_row_chunk_size( analysis_config_type * config , int row_chunk_size );
+int                    analysis_config_get_row_chunk_size( const analysis_config_type * config );
 void                   analysis_config_add_config_items( config_parser_type * config );
 
 bool                   analysis_config_select_module( analysis_config_type * config , const char * module_name );
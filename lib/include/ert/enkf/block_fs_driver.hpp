@@ -30,7 +30,7 @@ extern "C" {
   typedef struct block_fs_driver_struct block_fs_driver_type;
 
   bool                   block_fs_sscanf_key(const char * key , char ** config_key , int * __report_step , int * __iens);
-  void                 * block_fs_driver_open(FILE * fstab_stream , const char * mount_point , fs_driver_enum driver_type , bool read_only);
+  void                 * block_fs_driver_open(FILE * fstab_stream , const char * mount_point , fs_driver_enum driver_type , bool read_only , bool use_mmap);
   void                   block_fs_driver_create_fs( FILE * stream ,
                                                     const char * mount_point ,
                                                     fs_driver_enum driver_type ,
@@ -38,6 +38,7 @@ extern "C" {
                                                     const char * ens_path_fmt,
                                                     const char * filename );
   void                   block_fs_driver_fskip(FILE * fstab_stream);
+  int                    block_fs_driver_get_num_fs( const void * driver );
 
 #ifdef __cplusplus
 }
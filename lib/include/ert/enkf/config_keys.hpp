@@ -85,6 +85,7 @@ extern "C" {
 #define  LOG_FILE_KEY                      "LOG_FILE"
 #define  LOG_LEVEL_KEY                     "LOG_LEVEL"
 #define  MAX_RESAMPLE_KEY                  "MAX_RESAMPLE"
+#define  MEMORY_POLL_PERIOD_KEY            "MEMORY_POLL_PERIOD"
 #define  MAX_SUBMIT_KEY                    "MAX_SUBMIT"
 #define  NUM_REALIZATIONS_KEY              "NUM_REALIZATIONS"
 #define  MIN_REALIZATIONS_KEY              "MIN_REALIZATIONS"
@@ -236,6 +237,7 @@ extern "C" {
   const char * config_keys_get_time_map_key();
   const char * config_keys_get_enspath_key();
   const char * config_keys_get_max_resample_key();
+  const char * config_keys_get_memory_poll_period_key();
   const char * config_keys_get_data_root_key();
   const char * config_keys_get_rftpath_key();
   const char * config_keys_get_gen_kw_export_name_key();
@@ -105,6 +105,7 @@ const char * enkf_defaults_get_default_gen_kw_export_name();
 #define DEFAULT_ENKF_TRUNCATION            0.99
 #define DEFAULT_ENKF_ALPHA                 3.0
 #define DEFAULT_ENKF_STD_CUTOFF            1e-6
+#define DEFAULT_UPDATE_ROW_CHUNK_SIZE      0      /* 0: Update all the rows of a dataset in one go. */
 #define DEFAULT_MERGE_OBSERVATIONS         false
 #define DEFAULT_RERUN                      false
 #define DEFAULT_RERUN_START                0
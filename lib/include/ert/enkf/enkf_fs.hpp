@@ -35,6 +35,8 @@
 #include <ert/enkf/misfit_ensemble_typedef.hpp>
 #include <ert/enkf/summary_key_set.hpp>
 
+#define ENKF_FS_DEFAULT_NUM_SHARDS 32
+
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -43,12 +45,14 @@ extern "C" {
   const      char * enkf_fs_get_case_name( const enkf_fs_type * fs );
   bool              enkf_fs_is_read_only(const enkf_fs_type * fs);
   void              enkf_fs_fsync( enkf_fs_type * fs );
+  PY_USED long      enkf_fs_compact( enkf_fs_type * fs );
 
   enkf_fs_type    * enkf_fs_get_ref( enkf_fs_type * fs );
   int               enkf_fs_decref( enkf_fs_type * fs );
   int               enkf_fs_incref( enkf_fs_type * fs );
   int               enkf_fs_get_refcount( const enkf_fs_type * fs );
   enkf_fs_type    * enkf_fs_mount( const char * path );
+  enkf_fs_type    * enkf_fs_mount_readonly( const char * path , bool use_mmap );
   PY_USED bool      enkf_fs_update_disk_version(const char * mount_point , int src_version , int target_version);
   int               enkf_fs_disk_version(const char * mount_point );
   int               enkf_fs_get_version104( const char * path );
@@ -73,10 +77,16 @@ extern "C" {
                                          int iens);
 
 
+  const void      * enkf_fs_get_node_view(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type ,
+                                          int report_step , int iens , size_t * data_size);
+  const void      * enkf_fs_get_vector_view(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type ,
+                                            int iens , size_t * data_size);
   bool              enkf_fs_has_vector(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type , int iens);
   bool              enkf_fs_has_node(enkf_fs_type * enkf_fs , const char * node_key , enkf_var_type var_type , int report_step , int iens);
 
   enkf_fs_type *    enkf_fs_create_fs( const char * mount_point , fs_driver_impl driver_id , void * arg, bool mount);
+  enkf_fs_type *    enkf_fs_create_sharded_fs( const char * mount_point , fs_driver_impl driver_id , int num_shards , bool mount);
+  PY_USED int       enkf_fs_get_num_shards( const enkf_fs_type * fs );
 
   char             * enkf_fs_alloc_case_filename( const enkf_fs_type * fs , const char * input_name);
   char             * enkf_fs_alloc_case_tstep_filename( const enkf_fs_type * fs , int tstep , const char * input_name);
@@ -93,7 +103,7 @@ extern "C" {
   state_map_type            * enkf_fs_get_state_map( const enkf_fs_type * fs );
   time_map_type             * enkf_fs_get_time_map( const enkf_fs_type * fs );
   cases_config_type         * enkf_fs_get_cases_config( const enkf_fs_type * fs);
-  misfit_ensemble_type      * enkf_fs_get_misfit_ensemble( const enkf_fs_type * fs );
+  misfit_ensemble_type      * enkf_fs_get_misfit_ensemble( enkf_fs_type * fs );
   summary_key_set_type      * enkf_fs_get_summary_key_set( const enkf_fs_type * fs );
 
   void             enkf_fs_increase_run_count(enkf_fs_type * fs);
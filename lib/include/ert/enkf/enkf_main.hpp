@@ -74,6 +74,9 @@ extern "C" {
 
   bool                          enkf_main_UPDATE(enkf_main_type * enkf_main , const int_vector_type * step_list, enkf_fs_type * source_fs, enkf_fs_type * target_fs , int target_step , run_mode_type run_mode);
   bool                          enkf_main_smoother_update(enkf_main_type * enkf_main , enkf_fs_type * source_fs, enkf_fs_type * target_fs);
+  void                          enkf_main_get_update_data(enkf_main_type * enkf_main , enkf_fs_type * source_fs , const local_ministep_type * ministep , const bool_vector_type * ens_mask , meas_data_type * meas_data , obs_data_type * obs_data);
+  matrix_type                 * enkf_main_alloc_update_A(enkf_main_type * enkf_main , enkf_fs_type * source_fs , const local_dataset_type * dataset , const bool_vector_type * ens_mask);
+  bool                          enkf_main_save_update_A(enkf_main_type * enkf_main , enkf_fs_type * source_fs , enkf_fs_type * target_fs , const local_dataset_type * dataset , const bool_vector_type * ens_mask , matrix_type * A);
   void                          enkf_main_create_run_path(enkf_main_type * enkf_main , const ert_run_context_type * run_context);
 
   enkf_main_type              * enkf_main_alloc(const res_config_type *, bool, bool);
@@ -152,6 +155,8 @@ extern "C" {
   PY_USED int enkf_main_load_from_forward_model_from_gui(enkf_main_type * enkf_main, int iter , bool_vector_type * iactive, enkf_fs_type * fs);
   int enkf_main_load_from_run_context(enkf_main_type* enkf_main, ert_run_context_type* run_context, stringlist_type** realizations_msg_list, enkf_fs_type* fs);
   int enkf_main_load_from_run_context_from_gui(enkf_main_type* enkf_main, ert_run_context_type* run_context, enkf_fs_type* fs);
+  int enkf_main_load_from_run_context_timed(enkf_main_type* enkf_main, ert_run_context_type* run_context, stringlist_type** realizations_msg_list, enkf_fs_type* fs, int num_threads, double_vector_type * load_times);
+  PY_USED int enkf_main_load_from_run_context_timed_from_gui(enkf_main_type* enkf_main, ert_run_context_type* run_context, enkf_fs_type* fs, int num_threads, double_vector_type * load_times);
 
   void enkf_main_rank_on_observations(enkf_main_type * enkf_main,
                                       const char * ranking_key,
@@ -131,6 +131,8 @@ extern "C" {
   bool             enkf_node_use_forward_init( const enkf_node_type * enkf_node );
   void             enkf_node_serialize(enkf_node_type * enkf_node , enkf_fs_type * fs , node_id_type node_id , const active_list_type * active_list , matrix_type * A , int row_offset , int column);
   void             enkf_node_deserialize(enkf_node_type *enkf_node , enkf_fs_type * fs , node_id_type node_id , const active_list_type * active_list , const matrix_type * A , int row_offset , int column);
+  void             enkf_node_serialize_loaded(const enkf_node_type * enkf_node , node_id_type node_id , const active_list_type * active_list , matrix_type * A , int row_offset , int column);
+  void             enkf_node_deserialize_loaded(enkf_node_type *enkf_node , node_id_type node_id , const active_list_type * active_list , const matrix_type * A , int row_offset , int column);
 
   bool             enkf_node_forward_load_vector(enkf_node_type *enkf_node , const forward_load_context_type * load_context , const int_vector_type * time_index);
   bool             enkf_node_forward_load  (enkf_node_type *, const forward_load_context_type * load_context);
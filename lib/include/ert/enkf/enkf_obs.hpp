@@ -90,6 +90,8 @@ extern "C" {
   hash_iter_type  * enkf_obs_alloc_iter( const enkf_obs_type * enkf_obs );
 
   stringlist_type * enkf_obs_alloc_matching_keylist(const enkf_obs_type * enkf_obs , const char * input_string);
+  stringlist_type * enkf_obs_alloc_data_keylist(const enkf_obs_type * enkf_obs);
+  stringlist_type * enkf_obs_alloc_data_obs_keylist(const enkf_obs_type * enkf_obs , const char * data_key);
   time_t            enkf_obs_iget_obs_time(const enkf_obs_type * enkf_obs , int report_step);
   void              enkf_obs_scale_std(enkf_obs_type * enkf_obs, double scale_factor);
   void enkf_obs_local_scale_std( const enkf_obs_type * enkf_obs , const local_obsdata_type * local_obsdata, double scale_factor);
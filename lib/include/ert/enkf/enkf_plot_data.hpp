@@ -43,6 +43,7 @@ extern "C" {
                                              const bool_vector_type * input_mask);
   int                   enkf_plot_data_get_size( const enkf_plot_data_type * plot_data );
   enkf_plot_tvector_type * enkf_plot_data_iget( const enkf_plot_data_type * plot_data , int index);
+  void                  enkf_plot_data_export( const enkf_plot_data_type * plot_data , int num_steps , double * values , bool * mask);
 
   UTIL_IS_INSTANCE_HEADER( enkf_plot_data );
 
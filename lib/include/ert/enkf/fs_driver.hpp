@@ -173,7 +173,11 @@ extern "C" {
   typedef void (unlink_vector_ftype)  (void * driver, const char * , int );
   typedef bool (has_vector_ftype)     (void * driver, const char * , int );
 
+  typedef const void * (node_view_ftype)   (void * driver, const char * , int , int , size_t * );
+  typedef const void * (vector_view_ftype) (void * driver, const char * , int , size_t * );
+
   typedef void (fsync_driver_ftype) (void * driver);
+  typedef long (compact_driver_ftype) (void * driver);
   typedef void (free_driver_ftype)  (void * driver);
 
 
@@ -207,8 +211,11 @@ load_vector_ftype         * load_vector;   \
 save_vector_ftype         * save_vector;   \
 has_vector_ftype          * has_vector;    \
 unlink_vector_ftype       * unlink_vector; \
+node_view_ftype           * node_view;     \
+vector_view_ftype         * vector_view;   \
 free_driver_ftype         * free_driver;   \
 fsync_driver_ftype        * fsync_driver;  \
+compact_driver_ftype      * compact_driver;\
 int                         type_id
 
 
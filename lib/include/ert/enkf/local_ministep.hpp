@@ -41,6 +41,7 @@ local_ministep_type * local_ministep_alloc(const char * name, analysis_module_ty
 void                  local_ministep_free(local_ministep_type * ministep);
 void                  local_ministep_free__(void * arg);
 hash_iter_type      * local_ministep_alloc_dataset_iter( const local_ministep_type * ministep );
+stringlist_type     * local_ministep_alloc_dataset_keys( const local_ministep_type * ministep );
 const char          * local_ministep_get_name( const local_ministep_type * ministep );
 void                  local_ministep_summary_fprintf( const local_ministep_type * ministep , FILE * stream);
 void                  local_ministep_add_dataset( local_ministep_type * ministep , const local_dataset_type * dataset);
@@ -71,6 +71,7 @@ extern "C" {
   obs_impl_type        obs_vector_get_impl_type(const obs_vector_type * );
   const int_vector_type * obs_vector_get_step_list(const obs_vector_type * vector);
   void                 obs_vector_user_get(const obs_vector_type * obs_vector , const char * index_key , int report_step , double * value , double * std , bool * valid);
+  void                 obs_vector_export_summary_data(const obs_vector_type * obs_vector , int * steps , double * values , double * std);
   int                  obs_vector_get_next_active_step(const obs_vector_type * , int );
   void               * obs_vector_iget_node(const obs_vector_type * , int );
   obs_vector_type    * obs_vector_alloc_from_GENERAL_OBSERVATION(const conf_instance_type *  , time_map_type * obs_time , const ensemble_config_type * );
@@ -89,6 +90,7 @@ extern "C" {
                                                    double ** chi2);
 
   double                  obs_vector_total_chi2(const obs_vector_type * , enkf_fs_type * , int );
+  void                    obs_vector_export_chi2(const obs_vector_type * obs_vector , enkf_fs_type * fs , int num_realizations , const int * realizations , double * chi2);
   enkf_config_node_type * obs_vector_get_config_node(const obs_vector_type * );
   const char            * obs_vector_get_obs_key( const obs_vector_type * obs_vector);
   local_obsdata_node_type * obs_vector_alloc_local_node(const obs_vector_type * obs_vector);
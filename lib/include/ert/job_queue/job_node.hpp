@@ -96,6 +96,7 @@ typedef struct job_queue_node_struct job_queue_node_type;
   void job_queue_node_free_driver_data( job_queue_node_type * node , queue_driver_type * driver);
   PY_USED bool job_queue_node_update_status( job_queue_node_type * node , job_queue_status_type * status , queue_driver_type * driver);
   PY_USED bool job_queue_node_update_status_simple(job_queue_node_type * node, queue_driver_type * driver );
+  PY_USED void job_queue_node_update_status_list(queue_driver_type * driver, job_queue_node_type ** nodes, int num_nodes);
   int  job_queue_node_get_submit_attempt( const job_queue_node_type * node);
   void job_queue_node_reset_submit_attempt( job_queue_node_type * node);
   void job_queue_node_dec_submit_attempt( job_queue_node_type * node);
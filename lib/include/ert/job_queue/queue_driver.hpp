@@ -68,6 +68,7 @@ extern "C" {
   void queue_driver_blacklist_node(queue_driver_type * driver, void * job_data);
   void queue_driver_kill_job(queue_driver_type * driver, void * job_data);
   job_status_type queue_driver_get_status(queue_driver_type * driver, void * job_data);
+  void queue_driver_get_status_list(queue_driver_type * driver, int num_jobs, void ** job_data, job_status_type * status);
 
   PY_USED const char * queue_driver_get_name(const queue_driver_type * driver);
 
@@ -36,6 +36,7 @@ extern "C" {
   } block_fs_sort_type;
 
   void            block_fs_fsync( block_fs_type * block_fs );
+  void            block_fs_fsync_index( block_fs_type * block_fs );
   bool            block_fs_is_readonly( const block_fs_type * block_fs);
   block_fs_type * block_fs_mount( const char * mount_file ,
                                   int block_size ,
@@ -49,7 +50,11 @@ extern "C" {
   void            block_fs_fwrite_file(block_fs_type * block_fs , const char * filename , const void * ptr , size_t byte_size);
   void            block_fs_fwrite_buffer(block_fs_type * block_fs , const char * filename , const buffer_type * buffer);
   void            block_fs_fread_realloc_buffer( block_fs_type * block_fs , const char * filename , buffer_type * buffer);
+  bool            block_fs_mmap( block_fs_type * block_fs );
+  bool            block_fs_is_mmapped( const block_fs_type * block_fs );
+  const void    * block_fs_get_file_view( block_fs_type * block_fs , const char * filename , size_t * data_size);
   void            block_fs_unlink_file( block_fs_type * block_fs , const char * filename);
+  long int        block_fs_compact( block_fs_type * block_fs );
   bool            block_fs_has_file( block_fs_type * block_fs , const char * filename);
   vector_type   * block_fs_alloc_filelist( block_fs_type * block_fs  , const char * pattern , block_fs_sort_type sort_mode , bool include_free_nodes );
 
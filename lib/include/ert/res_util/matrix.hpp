@@ -88,6 +88,7 @@ typedef struct matrix_struct matrix_type;
   void          matrix_set_row(matrix_type * matrix , const double * data , int row);
 
   matrix_type * matrix_alloc_shared(const matrix_type * src , int row , int column , int rows , int columns);
+  matrix_type * matrix_alloc_wrapper(int rows , int columns , double * data);
   void          matrix_free(matrix_type * matrix);
   void          matrix_safe_free( matrix_type * matrix );
   void          matrix_pretty_print(const matrix_type * matrix , const char * name , const char * fmt);
@@ -141,6 +142,7 @@ typedef struct matrix_struct matrix_type;
   int           matrix_get_rows(const matrix_type * matrix);
   int           matrix_get_columns(const matrix_type * matrix);
   int           matrix_get_column_stride(const matrix_type * matrix);
+  int           matrix_get_row_stride(const matrix_type * matrix);
   void          matrix_get_dims(const matrix_type * matrix ,  int * rows , int * columns , int * row_stride , int * column_stride);
   bool          matrix_is_quadratic(const matrix_type * matrix);
   bool          matrix_equal( const matrix_type * m1 , const matrix_type * m2);
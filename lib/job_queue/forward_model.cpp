@@ -38,6 +38,7 @@
 struct forward_model_struct {
   vector_type               * jobs;         /* The actual jobs in this forward model. */
   const ext_joblist_type    * ext_joblist;  /* This is the list of external jobs which have been installed - which we can choose from. */
+  double                      memory_poll_period; /* Seconds between the resource usage samples of the job_runner; <= 0 for its default. */
 };
 
 #define DEFAULT_JOB_JSON     "jobs.json"
@@ -53,6 +54,7 @@ forward_model_type * forward_model_alloc(const ext_joblist_type * ext_joblist) {
 
   forward_model->jobs        = vector_alloc_new();
   forward_model->ext_joblist = ext_joblist;
+  forward_model->memory_poll_period = 0;
 
   return forward_model;
 }
@@ -180,6 +182,8 @@ static void forward_model_json_fprintf(const forward_model_type * forward_model,
   }
   fprintf(stream, "],\n");
 
+  if (forward_model->memory_poll_period > 0)
+    fprintf(stream, "\"memory_poll_period\" : %g,\n", forward_model->memory_poll_period);
   fprintf(stream, "\"run_id\" : \"%s\",\n", run_id);
   fprintf(stream, "\"ert_pid\" : \"%ld\"\n", (long)getpid()); //Long is big enough to hold __pid_t
   fprintf(stream, "}\n");
@@ -213,3 +217,11 @@ ext_job_type * forward_model_iget_job( forward_model_type * forward_model , int
 int forward_model_get_length( const forward_model_type * forward_model ) {
   return vector_get_size( forward_model->jobs );
 }
+
+void forward_model_set_memory_poll_period( forward_model_type * forward_model , double memory_poll_period) {
+  forward_model->memory_poll_period = memory_poll_period;
+}
+
+double forward_model_get_memory_poll_period( const forward_model_type * forward_model ) {
+  return forward_model->memory_poll_period;
+}
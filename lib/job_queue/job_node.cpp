@@ -23,6 +23,7 @@
 #include <pthread.h>
 
 #include <string>
+#include <vector>
 
 #include <ert/util/util.hpp>
 #include <ert/res_util/arg_pack.hpp>
@@ -612,22 +613,14 @@ cleanup:
   return status_change;
 }
 
-bool job_queue_node_update_status_simple(job_queue_node_type * node,
-                                  queue_driver_type * driver ) {
-  bool status_change = false;
-  pthread_mutex_lock( &node->data_mutex );
-  job_status_type current_status;
-  bool confirmed;
-
-  if (!node->job_data){
-    job_queue_node_update_timestamp(node);
-    pthread_mutex_unlock( &node->data_mutex );
-    return status_change;
-  }
-
-  current_status = job_queue_node_get_status(node);
-
-  confirmed = job_queue_node_status_update_confirmed_running__(node);
+/*
+  Marks a node which has been running for max_confirm_wait seconds
+  without confirming it is alive as failed. Must be called with the
+  data_mutex of the node held.
+*/
+static void job_queue_node_check_confirmed_running__(job_queue_node_type * node) {
+  job_status_type current_status = job_queue_node_get_status(node);
+  bool confirmed = job_queue_node_status_update_confirmed_running__(node);
 
   if ((current_status & JOB_QUEUE_RUNNING) && !confirmed) {
     // it's running, but not confirmed running.
@@ -642,6 +635,22 @@ bool job_queue_node_update_status_simple(job_queue_node_type * node,
       job_queue_node_set_status(node, new_status);
     }
   }
+}
+
+
+bool job_queue_node_update_status_simple(job_queue_node_type * node,
+                                  queue_driver_type * driver ) {
+  bool status_change = false;
+  pthread_mutex_lock( &node->data_mutex );
+  job_status_type current_status;
+
+  if (!node->job_data){
+    job_queue_node_update_timestamp(node);
+    pthread_mutex_unlock( &node->data_mutex );
+    return status_change;
+  }
+
+  job_queue_node_check_confirmed_running__(node);
 
   current_status = job_queue_node_get_status(node);
   if (current_status & JOB_QUEUE_CAN_UPDATE_STATUS) {
@@ -652,6 +661,45 @@ bool job_queue_node_update_status_simple(job_queue_node_type * node,
   return status_change;
 }
 
+
+/**
+   Updates the status of num_nodes nodes like
+   job_queue_node_update_status_simple(), but with one status query to
+   the driver for all of them. The nodes which are queried are kept
+   locked until their new status has been set.
+*/
+void job_queue_node_update_status_list(queue_driver_type * driver,
+                                       job_queue_node_type ** nodes,
+                                       int num_nodes) {
+  std::vector<job_queue_node_type *> query_nodes;
+  std::vector<void *> job_data;
+
+  for (int i = 0; i < num_nodes; i++) {
+    job_queue_node_type * node = nodes[i];
+    pthread_mutex_lock( &node->data_mutex );
+
+    if (!node->job_data) {
+      job_queue_node_update_timestamp(node);
+      pthread_mutex_unlock( &node->data_mutex );
+      continue;
+    }
+
+    job_queue_node_check_confirmed_running__(node);
+    if (job_queue_node_get_status(node) & JOB_QUEUE_CAN_UPDATE_STATUS) {
+      query_nodes.push_back( node );
+      job_data.push_back( node->job_data );
+    } else
+      pthread_mutex_unlock( &node->data_mutex );
+  }
+
+  std::vector<job_status_type> status( query_nodes.size() );
+  queue_driver_get_status_list( driver , job_data.size() , job_data.data() , status.data() );
+  for (size_t i = 0; i < query_nodes.size(); i++) {
+    job_queue_node_set_status( query_nodes[i] , status[i] );
+    pthread_mutex_unlock( &query_nodes[i]->data_mutex );
+  }
+}
+
 bool job_queue_node_status_transition(job_queue_node_type * node,
                                       job_queue_status_type * status,
                                       job_status_type new_status) {
@@ -392,6 +392,17 @@ job_status_type queue_driver_get_status(queue_driver_type * driver, void * job_d
   return status;
 }
 
+/*
+  Queries the status of num_jobs jobs in one go and stores them in
+  status[]. Drivers which cache the output of the cluster status command,
+  like the LSF driver with bjobs, run at most one status command for the
+  whole list.
+*/
+void queue_driver_get_status_list(queue_driver_type * driver, int num_jobs, void ** job_data, job_status_type * status) {
+  for (int i = 0; i < num_jobs; i++)
+    status[i] = driver->get_status(driver->data, job_data[i]);
+}
+
 void queue_driver_free_driver(queue_driver_type * driver) {
   driver->free_driver(driver->data);
 }
@@ -17,12 +17,15 @@
 */
 
 #include <stdlib.h>
+#include <stdint.h>
 #include <string.h>
 #include <stdio.h>
 #include <errno.h>
 #include <unistd.h>
 #include <pthread.h>
 #include <fnmatch.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
 
 #include <ert/util/hash.hpp>
 #include <ert/util/vector.hpp>
@@ -35,7 +38,7 @@
 #define MOUNT_MAP_MAGIC_INT  8861290
 #define BLOCK_FS_TYPE_ID     7100652
 #define INDEX_MAGIC_INT      1213775
-#define INDEX_FORMAT_VERSION       1
+#define INDEX_FORMAT_VERSION       2
 
 // #define ENABLE_CACHE
 
@@ -161,11 +164,18 @@ struct block_fs_struct {
                                             fragmentation_limit == 0.0 : Rotate when one byte is wasted. */
   bool             data_owner;
   int              fsync_interval;  /* 0: never  n: every nth iteration. */
+  long int         modify_count;    /* Counts all writes and unlinks - used to detect changes during block_fs_compact(). */
+  pthread_mutex_t  compact_lock;    /* Held by block_fs_compact(); only one compaction can run at a time. */
+  bool             index_snapshot;  /* The index file on disk describes the current data file - see block_fs_fsync_index(). */
+
+  void           * mmap_data;       /* Read-only mapping of the data file, or NULL - see block_fs_mmap(). */
+  size_t           mmap_size;
 };
 
 /*****************************************************************/
 
 static void block_fs_rotate__( block_fs_type * block_fs );
+static void block_fs_dump_index( block_fs_type * block_fs );
 
 UTIL_SAFE_CAST_FUNCTION( block_fs , BLOCK_FS_TYPE_ID )
 
@@ -411,12 +421,13 @@ static void file_node_set_data_offset( file_node_type * file_node, const char *
 
 
 
-static void file_node_dump_index( const file_node_type * file_node , FILE * index_stream) {
-  util_fwrite_int( file_node->status , index_stream );
-  util_fwrite_long( file_node->node_offset , index_stream );
-  util_fwrite_int( file_node->node_size   , index_stream );
-  util_fwrite_int( file_node->data_offset , index_stream );
-  util_fwrite_int( file_node->data_size   , index_stream );
+static void file_node_dump_index( const file_node_type * file_node , buffer_type * buffer) {
+  long int node_offset = file_node->node_offset;
+  buffer_fwrite_int( buffer , file_node->status );
+  buffer_fwrite( buffer , &node_offset , sizeof node_offset , 1 );
+  buffer_fwrite_int( buffer , file_node->node_size );
+  buffer_fwrite_int( buffer , file_node->data_offset );
+  buffer_fwrite_int( buffer , file_node->data_size );
 }
 
 
@@ -505,6 +516,22 @@ static inline void block_fs_aquire_rlock( block_fs_type * block_fs ) {
 
 
 
+/**
+   Must be called, with the write lock held, before the data file or
+   the index is changed. The index file is removed the first time the
+   filesystem is modified after it was written, so that an index file
+   which is found when mounting always matches the data file.
+*/
+
+static void block_fs_modified( block_fs_type * block_fs ) {
+  block_fs->modify_count++;
+  if (block_fs->index_snapshot) {
+    util_unlink_existing( block_fs->index_file );
+    block_fs->index_snapshot = false;
+  }
+}
+
+
 static void block_fs_insert_index_node( block_fs_type * block_fs , const char * filename , const file_node_type * file_node) {
   hash_insert_ref( block_fs->index , filename , file_node);
 }
@@ -654,6 +681,9 @@ static block_fs_type * block_fs_alloc_empty( const char * mount_file ,
   util_alloc_file_components( mount_file , &block_fs->path , &block_fs->base_name, NULL );
   pthread_mutex_init( &block_fs->io_lock  , NULL);
   pthread_rwlock_init( &block_fs->rw_lock , NULL);
+  pthread_mutex_init( &block_fs->compact_lock , NULL);
+  block_fs->modify_count = 0;
+  block_fs->index_snapshot = false;
   {
     FILE * stream            = util_fopen( mount_file , "r");
     int id                   = util_fread_int( stream );
@@ -666,6 +696,8 @@ static block_fs_type * block_fs_alloc_empty( const char * mount_file ,
   block_fs->data_file   = NULL;
   block_fs->lock_file   = NULL;
   block_fs->index_file  = NULL;
+  block_fs->mmap_data   = NULL;
+  block_fs->mmap_size   = 0;
   block_fs_reinit( block_fs );
 
 
@@ -965,35 +997,64 @@ static void block_fs_build_index( block_fs_type * block_fs , long_vector_type *
 
 
 /**
-   Load an index for (slightly) faster mounting of the filesystem. The
-   function starts be reading a header and check if the current index
-   file is applicable.
-
-   Will return true of the loading succedeed, and false if no index
-   was loaded.
+   The index file is a snapshot of the index and the list of free
+   nodes, which is used to mount the filesystem without scanning
+   through the data file. It consists of a header:
+
+     int     INDEX_MAGIC_INT
+     int     INDEX_FORMAT_VERSION
+     int     version of the data file
+     long    size of the data file
+     time_t  modification time of the data file
+     long    size of the payload
+     uint64  checksum of the payload
+
+   followed by the payload with the active nodes and the free nodes.
+   The snapshot is only used if it matches the data file, which is
+   checked with fstat(), and the checksum is correct.
 */
 
+static uint64_t block_fs_index_checksum( const void * data , size_t size ) {
+  /* 64 bit FNV-1a */
+  const unsigned char * bytes = (const unsigned char *) data;
+  uint64_t checksum = 14695981039346656037ULL;
+  for (size_t i = 0; i < size; i++) {
+    checksum ^= bytes[i];
+    checksum *= 1099511628211ULL;
+  }
+  return checksum;
+}
 
-static bool block_fs_load_index( block_fs_type * block_fs ) {
-  stat_type data_stat;
-  if (fstat( block_fs->data_fd , &data_stat) == 0) {
-    FILE * stream = fopen( block_fs->index_file , "r");
-    if (stream != NULL) {
-      int    id          = util_fread_int( stream );
-      int    version     = util_fread_int( stream );
-      time_t index_mtime = util_fread_time_t( stream );
 
-      time_t data_mtime  = data_stat.st_mtime;
-      fclose( stream );
+static int block_fs_index_header_size( ) {
+  return 3 * sizeof(int) + 2 * sizeof(long int) + sizeof(time_t) + sizeof(uint64_t);
+}
 
-      if ((id == INDEX_MAGIC_INT) &&               /* This is indeed an index file. */
-          (version == INDEX_FORMAT_VERSION) &&     /* The version on disk agrees with this version. */
-          (index_mtime == data_mtime)) {           /* The time stamp agrees with the time stamp of the data. */
 
-        /* Read the whole index file in one single read operation. */
-        buffer_type * buffer = buffer_fread_alloc( block_fs->index_file );
+static bool block_fs_load_index( block_fs_type * block_fs ) {
+  stat_type data_stat;
+  bool loaded = false;
+  if ((fstat( block_fs->data_fd , &data_stat) == 0) && util_file_exists( block_fs->index_file )) {
+    buffer_type * buffer = buffer_fread_alloc( block_fs->index_file );
+
+    if (buffer_get_size( buffer ) >= (size_t) block_fs_index_header_size( )) {
+      int    id             = buffer_fread_int( buffer );
+      int    format_version = buffer_fread_int( buffer );
+      int    data_version   = buffer_fread_int( buffer );
+      long   data_size      = buffer_fread_long( buffer );
+      time_t data_mtime     = buffer_fread_time_t( buffer );
+      long   payload_size   = buffer_fread_long( buffer );
+      uint64_t checksum;
+      buffer_fread( buffer , &checksum , sizeof checksum , 1 );
+
+      if ((id == INDEX_MAGIC_INT) &&                               /* This is indeed an index file. */
+          (format_version == INDEX_FORMAT_VERSION) &&              /* The version on disk agrees with this version. */
+          (data_version == block_fs->version) &&                   /* The index belongs to the current data file ... */
+          (data_size == data_stat.st_size) &&                      /* ... which has not changed since the index was written. */
+          (data_mtime == data_stat.st_mtime) &&
+          (payload_size == (long) buffer_get_remaining_size( buffer )) &&
+          (checksum == block_fs_index_checksum( buffer_iget_data( buffer , buffer_get_offset( buffer )) , payload_size))) {
 
-        buffer_fskip( buffer , sizeof( time_t ) + 2 * sizeof( int ));
         /*1: Loading all the active nodes. */
         {
           int num_active_nodes = buffer_fread_int( buffer );
@@ -1016,14 +1077,14 @@ static bool block_fs_load_index( block_fs_type * block_fs ) {
             block_fs_insert_free_node(block_fs , file_node);
           }
         }
-        buffer_free( buffer );
-
-        return true;
+        block_fs->index_snapshot = true;
+        loaded = true;
       }
     }
+    buffer_free( buffer );
   }
-  /** No index was loaded - for whatever reason. */
-  return false;
+  /** If no index was loaded - for whatever reason - the data file must be scanned. */
+  return loaded;
 }
 
 
@@ -1093,6 +1154,21 @@ static void block_fs_unlink_free_node( block_fs_type * block_fs , free_node_type
 
 
 
+/**
+   The size of a new node which can hold @min_size bytes, rounded up to
+   a whole number of blocks.
+*/
+
+static int block_fs_node_size( const block_fs_type * block_fs , size_t min_size ) {
+  div_t d = div( min_size , block_fs->block_size );
+  int node_size = d.quot * block_fs->block_size;
+  if (d.rem)
+    node_size += block_fs->block_size;
+
+  return node_size;
+}
+
+
 /**
    This function first checks the free nodes if any of them can be
    used, otherwise a new node is created.
@@ -1124,12 +1200,7 @@ static file_node_type * block_fs_get_new_node( block_fs_type * block_fs , const
     int node_size;
     file_node_type * new_node;
 
-    {
-      div_t d   = div( min_size , block_fs->block_size );
-      node_size = d.quot * block_fs->block_size;
-      if (d.rem)
-        node_size += block_fs->block_size;
-    }
+    node_size = block_fs_node_size( block_fs , min_size );
 
     /* Must lock the total size here ... */
     offset = block_fs->data_file_size;
@@ -1165,6 +1236,7 @@ bool block_fs_has_file( block_fs_type * block_fs , const char * filename) {
 
 static void block_fs_unlink_file__( block_fs_type * block_fs , const char * filename ) {
   file_node_type * node = (file_node_type*)hash_pop( block_fs->index , filename );
+  block_fs_modified( block_fs );
   block_fs_clear_cache_node( block_fs , node );
 
   node->status      = NODE_FREE;
@@ -1279,6 +1351,8 @@ static void block_fs_fwrite_file_unlocked(block_fs_type * block_fs , const char
   bool   new_node = true;
   size_t min_size = data_size + file_node_header_size( filename );
 
+  block_fs_modified( block_fs );
+
   if (block_fs_has_file__( block_fs , filename )) {
     file_node = (file_node_type*)hash_get( block_fs->index , filename );
     if (file_node->node_size < min_size) {
@@ -1328,6 +1402,84 @@ void block_fs_fwrite_buffer(block_fs_type * block_fs , const char * filename , c
    Reads the full content of 'filename' into the buffer.
 */
 
+/**
+   Will map the data file of a read-only block_fs instance into memory,
+   after which the nodes are read from the mapping instead of with
+   fseek()/fread(), and block_fs_get_file_view() can hand out pointers to
+   the stored data. The nodes in the index must all be within the data
+   file as it was when the filesystem was mounted; nodes written later by
+   another process which owns the filesystem are read from the data file.
+
+   Returns true if the data file has been mapped. A filesystem which is
+   mounted read-write, or which has no data, is not mapped.
+*/
+
+bool block_fs_mmap( block_fs_type * block_fs ) {
+  if (block_fs->mmap_data != NULL)
+    return true;
+
+  if (block_fs->data_owner || block_fs->data_fd < 0)
+    return false;
+
+  {
+    struct stat stat_buffer;
+    if (fstat( block_fs->data_fd , &stat_buffer ) != 0 || stat_buffer.st_size == 0)
+      return false;
+
+    {
+      void * data = mmap( NULL , stat_buffer.st_size , PROT_READ , MAP_SHARED , block_fs->data_fd , 0 );
+      if (data == MAP_FAILED) {
+        fprintf(stderr,"%s: failed to mmap %s: %s - will use normal reads.\n",__func__ , block_fs->data_file , strerror( errno ));
+        return false;
+      }
+      block_fs->mmap_data = data;
+      block_fs->mmap_size = stat_buffer.st_size;
+    }
+  }
+  return true;
+}
+
+
+bool block_fs_is_mmapped( const block_fs_type * block_fs ) {
+  return (block_fs->mmap_data != NULL);
+}
+
+
+static const void * block_fs_node_view( const block_fs_type * block_fs , const file_node_type * node ) {
+  if (block_fs->mmap_data == NULL)
+    return NULL;
+
+  {
+    size_t data_start = node->node_offset + node->data_offset;
+    if (data_start + node->data_size > block_fs->mmap_size)
+      return NULL;
+
+    return (const char *) block_fs->mmap_data + data_start;
+  }
+}
+
+
+/**
+   Will return a pointer to the data stored for @filename in the memory
+   mapped data file, and set @data_size to the size of the data. The
+   pointer is valid until the filesystem is closed. If the filesystem is
+   not memory mapped, or there is no such file, NULL is returned.
+*/
+
+const void * block_fs_get_file_view( block_fs_type * block_fs , const char * filename , size_t * data_size) {
+  const void * view = NULL;
+  block_fs_aquire_rlock( block_fs );
+  if (hash_has_key( block_fs->index , filename )) {
+    const file_node_type * node = (const file_node_type*)hash_get( block_fs->index , filename);
+    view = block_fs_node_view( block_fs , node );
+    if (view != NULL)
+      *data_size = node->data_size;
+  }
+  block_fs_release_rwlock( block_fs );
+  return view;
+}
+
+
 void block_fs_fread_realloc_buffer( block_fs_type * block_fs , const char * filename , buffer_type * buffer) {
   block_fs_aquire_rlock( block_fs );
   {
@@ -1339,14 +1491,15 @@ void block_fs_fread_realloc_buffer( block_fs_type * block_fs , const char * file
          Going low-level
       */
 
+      const void * view = block_fs_node_view( block_fs , node );
 #ifdef ENABLE_CACHE
       if (node->cache != NULL)
         file_node_buffer_read_from_cache( node , buffer );
       else
-#else
-      if (true)
 #endif
-
+      if (view != NULL)
+        buffer_fwrite( buffer , view , 1 , node->data_size );
+      else
       {
         pthread_mutex_lock( &block_fs->io_lock );
         block_fs_fseek_node_data(block_fs , node );
@@ -1361,70 +1514,115 @@ void block_fs_fread_realloc_buffer( block_fs_type * block_fs , const char * file
   block_fs_release_rwlock( block_fs );
 }
 
+/**
+   Writes the index snapshot, see block_fs_load_index(). The data file
+   is flushed to disk first, and the index is written to a temporary
+   file which is then renamed, so an index file on disk is always
+   complete. The calling scope must hold the write lock.
+*/
+
 static void block_fs_dump_index( block_fs_type * block_fs ) {
-  if (block_fs->data_owner) {
+  if (block_fs->data_owner && (block_fs->data_stream != NULL)) {
     struct stat stat_buffer;
-    int stat_return = stat(block_fs->data_file , &stat_buffer);
-    if (stat_return != 0)
+    fflush( block_fs->data_stream );
+    fsync( block_fs->data_fd );
+    if (fstat( block_fs->data_fd , &stat_buffer ) != 0)
       return;
     {
-      time_t data_mtime = stat_buffer.st_mtime;
-      FILE * index_stream = util_fopen( block_fs->index_file , "w");
-      util_fwrite_int( INDEX_MAGIC_INT , index_stream );
-      util_fwrite_int( INDEX_FORMAT_VERSION , index_stream );
-      util_fwrite_time_t( data_mtime , index_stream );
+      buffer_type * buffer = buffer_alloc( 1024 );
 
       /* 1: Dumping the hash table of active nodes. */
       {
         hash_iter_type * index_iter = hash_iter_alloc( block_fs->index );
 
-        util_fwrite_int( hash_get_size( block_fs->index ) , index_stream);
+        buffer_fwrite_int( buffer , hash_get_size( block_fs->index ));
         while (!hash_iter_is_complete( index_iter )) {
           const char * key = hash_iter_get_next_key( index_iter );
           const file_node_type * file_node = (const file_node_type*)hash_get( block_fs->index , key );
 
-          util_fwrite_string( key , index_stream);
-          file_node_dump_index( file_node , index_stream );
+          buffer_fwrite_string( buffer , key );
+          file_node_dump_index( file_node , buffer );
         }
         hash_iter_free( index_iter );
       }
 
       /* 2: Dumping information about empty slots in the datafile. */
-      util_fwrite_int( block_fs->num_free_nodes , index_stream );
+      buffer_fwrite_int( buffer , block_fs->num_free_nodes );
       {
         free_node_type * current = block_fs->free_nodes;
         while ( current != NULL) {
-          file_node_dump_index( current->file_node , index_stream );
+          file_node_dump_index( current->file_node , buffer );
           current = current->next;
         }
       }
 
-      fclose( index_stream );
+      {
+        char * tmp_file     = util_alloc_sprintf( "%s.tmp" , block_fs->index_file );
+        FILE * index_stream = fopen( tmp_file , "w");
+        uint64_t checksum   = block_fs_index_checksum( buffer_get_data( buffer ) , buffer_get_size( buffer ));
+
+        if (index_stream == NULL) {
+          /* Without an index file the filesystem is still valid, the index will be built on the next mount. */
+          free( tmp_file );
+          buffer_free( buffer );
+          return;
+        }
+
+        util_fwrite_int( INDEX_MAGIC_INT , index_stream );
+        util_fwrite_int( INDEX_FORMAT_VERSION , index_stream );
+        util_fwrite_int( block_fs->version , index_stream );
+        util_fwrite_long( stat_buffer.st_size , index_stream );
+        util_fwrite_time_t( stat_buffer.st_mtime , index_stream );
+        util_fwrite_long( buffer_get_size( buffer ) , index_stream );
+        util_fwrite( &checksum , sizeof checksum , 1 , index_stream , __func__ );
+        util_fwrite( buffer_get_data( buffer ) , 1 , buffer_get_size( buffer ) , index_stream , __func__ );
+        fflush( index_stream );
+        fsync( fileno( index_stream ));
+        fclose( index_stream );
+
+        if (rename( tmp_file , block_fs->index_file ) == 0)
+          block_fs->index_snapshot = true;
+        else
+          util_unlink_existing( tmp_file );
+        free( tmp_file );
+      }
+      buffer_free( buffer );
     }
   }
 }
 
 
 /**
-   Close/synchronize the open file descriptors and free all memory
-   related to the block_fs instance.
-
-   If the boolean unlink_empty is set to true all the files will be
-   unlinked if the filesystem is empty.
+   Writes the index snapshot if the filesystem has been modified since
+   it was last written, so that the filesystem can be mounted quickly
+   even if it is not closed properly.
 */
 
+void block_fs_fsync_index( block_fs_type * block_fs ) {
+  if (block_fs->data_owner) {
+    block_fs_aquire_wlock( block_fs );
+    if (!block_fs->index_snapshot)
+      block_fs_dump_index( block_fs );
+    block_fs_release_rwlock( block_fs );
+  }
+}
+
+
 void block_fs_close( block_fs_type * block_fs , bool unlink_empty) {
   block_fs_fsync( block_fs );
 
   if (block_fs->data_owner)
     block_fs_aquire_wlock( block_fs );
 
-  if (block_fs->data_stream != NULL)
-    fclose( block_fs->data_stream );
+  if (block_fs->mmap_data != NULL)
+    munmap( block_fs->mmap_data , block_fs->mmap_size );
 
-  if (block_fs->data_owner)
+  if (block_fs->data_owner && !block_fs->index_snapshot)
     block_fs_dump_index( block_fs );
 
+  if (block_fs->data_stream != NULL)
+    fclose( block_fs->data_stream );
+
   if (block_fs->lock_fd > 0) {
     close( block_fs->lock_fd );     /* Closing the lock_file file descriptor - and releasing the lock. */
     util_unlink_existing( block_fs->lock_file );
@@ -1658,3 +1856,167 @@ vector_type * block_fs_alloc_filelist( block_fs_type * block_fs  , const char *
 
   return sort_vector;
 }
+
+
+
+/*****************************************************************/
+/* Online compaction.                                            */
+/*****************************************************************/
+
+/*
+   Copies all the nodes in the index, in the order they have in the
+   current data file, to @new_stream without any holes between them.
+   The new file_node instances are installed in @new_index and
+   @new_nodes, and the size of the new data file is returned.
+
+   The calling scope must hold either the read lock or the write lock;
+   the nodes are read with a separate stream, so concurrent readers
+   are not disturbed.
+*/
+
+static long int block_fs_compact_copy__( block_fs_type * block_fs , FILE * new_stream , hash_type * new_index , vector_type * new_nodes) {
+  vector_type * sort_vector = vector_alloc_new();
+  buffer_type * buffer      = buffer_alloc( 1024 );
+  long int new_size         = 0;
+  FILE * old_stream;
+
+  pthread_mutex_lock( &block_fs->io_lock );
+  fflush( block_fs->data_stream );
+  pthread_mutex_unlock( &block_fs->io_lock );
+  old_stream = util_fopen( block_fs->data_file , "r");
+
+  {
+    hash_iter_type * iter = hash_iter_alloc( block_fs->index );
+    while (!hash_iter_is_complete( iter )) {
+      const char * key = hash_iter_get_next_key( iter );
+      const file_node_type * node = (const file_node_type *) hash_get( block_fs->index , key );
+      vector_append_owned_ref( sort_vector , user_file_node_alloc( key , node ) , user_file_node_free__ );
+    }
+    hash_iter_free( iter );
+  }
+  vector_sort( sort_vector , offset_cmp );
+
+  for (int i = 0; i < vector_get_size( sort_vector ); i++) {
+    const user_file_node_type * unode = (const user_file_node_type *) vector_iget_const( sort_vector , i );
+    const file_node_type * old_node   = unode->file_node;
+    int node_size                     = block_fs_node_size( block_fs , old_node->data_size + file_node_header_size( unode->filename ));
+    file_node_type * new_node         = file_node_alloc( NODE_IN_USE , new_size , node_size );
+
+    new_node->data_size = old_node->data_size;
+    file_node_set_data_offset( new_node , unode->filename );
+
+    buffer_clear( buffer );
+    fseek__( old_stream , old_node->node_offset + old_node->data_offset , SEEK_SET );
+    buffer_stream_fread( buffer , old_node->data_size , old_stream );
+
+    fseek__( new_stream , new_node->node_offset + new_node->data_offset , SEEK_SET );
+    util_fwrite( buffer_get_data( buffer ) , 1 , buffer_get_size( buffer ) , new_stream , __func__ );
+    file_node_fwrite( new_node , unode->filename , new_stream );
+
+    vector_append_owned_ref( new_nodes , new_node , file_node_free__ );
+    hash_insert_ref( new_index , unode->filename , new_node );
+    new_size += node_size;
+  }
+
+  fclose( old_stream );
+  buffer_free( buffer );
+  vector_free( sort_vector );
+
+  fflush( new_stream );
+  fsync( fileno( new_stream ));
+  return new_size;
+}
+
+
+/**
+   Will rewrite the data file without the holes left by overwritten
+   and unlinked nodes, and return the number of bytes reclaimed.
+
+   Unlike block_fs_rotate__() the nodes are copied while only holding
+   the read lock, so the filesystem can be read during the
+   compaction; writers wait. The write lock is only taken to switch
+   to the new data file. If the filesystem is modified in the short
+   window between the two locks the copy is thrown away and done again
+   under the write lock.
+
+   Instances which are not data owner, or which have no free space,
+   are left untouched and 0 is returned.
+*/
+
+long int block_fs_compact( block_fs_type * block_fs ) {
+  long int reclaimed = 0;
+  if (!block_fs->data_owner)
+    return 0;
+
+  pthread_mutex_lock( &block_fs->compact_lock );
+  block_fs_aquire_rlock( block_fs );
+  if ((block_fs->free_size > 0) && (block_fs->data_stream != NULL)) {
+    hash_type * new_index    = hash_alloc();
+    vector_type * new_nodes  = vector_alloc_new();
+    char * tmp_file          = util_alloc_sprintf( "%s.compact" , block_fs->data_file );
+    FILE * new_stream        = util_fopen( tmp_file , "w+");
+    long int modify_count    = block_fs->modify_count;
+    long int new_size        = block_fs_compact_copy__( block_fs , new_stream , new_index , new_nodes );
+
+    block_fs_release_rwlock( block_fs );
+    block_fs_aquire_wlock( block_fs );
+
+    if (block_fs->modify_count != modify_count) {
+      /* The filesystem was written to before we got the write lock - copy again. */
+      hash_free( new_index );
+      vector_free( new_nodes );
+      new_index = hash_alloc();
+      new_nodes = vector_alloc_new();
+
+      fseek__( new_stream , 0 , SEEK_SET );
+      if (ftruncate( fileno( new_stream ) , 0 ) != 0)
+        util_abort("%s: failed to truncate %s \n",__func__ , tmp_file );
+      new_size = block_fs_compact_copy__( block_fs , new_stream , new_index , new_nodes );
+    }
+    reclaimed = block_fs->data_file_size - new_size;
+
+    {
+      char * old_data_file = util_alloc_string_copy( block_fs->data_file );
+      char * old_lock_file = util_alloc_string_copy( block_fs->lock_file );
+
+      /*
+        The new data file is complete on disk before the mount map is
+        updated to point to it; the index file describes the old data
+        file and is replaced below.
+      */
+      block_fs_modified( block_fs );
+      block_fs->version++;
+      block_fs_set_filenames( block_fs );
+      if (rename( tmp_file , block_fs->data_file ) != 0)
+        util_abort("%s: failed to move %s to %s \n",__func__ , tmp_file , block_fs->data_file );
+      block_fs_fwrite_mount_info__( block_fs->mount_file , block_fs->version );
+
+      fclose( block_fs->data_stream );
+      unlink( old_data_file );
+      unlink( old_lock_file );
+      free( old_data_file );
+      free( old_lock_file );
+    }
+
+    free_node_free_list( block_fs->free_nodes );
+    hash_free( block_fs->index );
+    vector_free( block_fs->file_nodes );
+
+    block_fs->index            = new_index;
+    block_fs->file_nodes       = new_nodes;
+    block_fs->free_nodes       = NULL;
+    block_fs->num_free_nodes   = 0;
+    block_fs->free_size        = 0;
+    block_fs->total_cache_size = 0;
+    block_fs->data_file_size   = new_size;
+    block_fs->data_stream      = new_stream;
+    block_fs->data_fd          = fileno( new_stream );
+    block_fs_dump_index( block_fs );
+
+    free( tmp_file );
+  }
+  block_fs_release_rwlock( block_fs );
+  pthread_mutex_unlock( &block_fs->compact_lock );
+
+  return reclaimed;
+}
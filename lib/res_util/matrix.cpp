@@ -230,6 +230,30 @@ matrix_type * matrix_alloc_shared(const matrix_type * src , int row , int column
 }
 
 
+/**
+   This function will allocate a matrix object which wraps the
+   external storage 'data', which must hold rows * columns elements in
+   column-major order. The matrix does not take ownership of the data;
+   the calling scope must keep the storage alive for the lifetime of
+   the matrix, and the matrix can not be resized.
+*/
+
+matrix_type * matrix_alloc_wrapper(int rows , int columns , double * data) {
+  if ((rows <= 0) || (columns <= 0))
+    util_abort("%s: invalid matrix size [%d,%d] \n",__func__ , rows , columns);
+
+  {
+    matrix_type * matrix = matrix_alloc_empty();
+
+    matrix_init_header( matrix , rows , columns , 1 , rows );
+    matrix->data          = data;
+    matrix->data_owner    = false;
+
+    return matrix;
+  }
+}
+
+
 /*****************************************************************/
 
 static matrix_type * matrix_alloc__(int rows, int columns , bool safe_mode) {
@@ -1196,6 +1220,10 @@ int matrix_get_column_stride(const matrix_type * matrix) {
   return matrix->column_stride;
 }
 
+int matrix_get_row_stride(const matrix_type * matrix) {
+  return matrix->row_stride;
+}
+
 
 void matrix_get_dims(const matrix_type * matrix ,  int * rows , int * columns , int * row_stride , int * column_stride) {
 
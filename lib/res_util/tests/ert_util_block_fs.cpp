@@ -21,6 +21,7 @@
 
 
 #include <ert/util/test_util.hpp>
+#include <ert/util/buffer.hpp>
 #include <ert/util/test_work_area.hpp>
 #include <ert/res_util/block_fs.hpp>
 
@@ -98,8 +99,126 @@ void test_lock_conflict() {
 
 
 
+static void assert_file_content( block_fs_type * bfs , const char * filename , int value , int size) {
+  buffer_type * buffer = buffer_alloc( 100 );
+  block_fs_fread_realloc_buffer( bfs , filename , buffer );
+  test_assert_int_equal( size * sizeof(int) , buffer_get_size( buffer ));
+  buffer_rewind( buffer );
+  for (int i = 0; i < size; i++)
+    test_assert_int_equal( value , buffer_fread_int( buffer ));
+  buffer_free( buffer );
+}
+
+
+static void fwrite_file( block_fs_type * bfs , const char * filename , int value , int size) {
+  buffer_type * buffer = buffer_alloc( 100 );
+  for (int i = 0; i < size; i++)
+    buffer_fwrite_int( buffer , value );
+  block_fs_fwrite_buffer( bfs , filename , buffer );
+  buffer_free( buffer );
+}
+
+
+void test_compact() {
+  ecl::util::TestArea ta("compact");
+  const int num_files = 20;
+  char * filename;
+  block_fs_type * bfs = block_fs_mount( "test.mnt" , 64 , 0 , 1.0 , 10 , false , false , false );
+
+  test_assert_int_equal( 0 , block_fs_compact( bfs ));
+  for (int i = 0; i < num_files; i++) {
+    filename = util_alloc_sprintf( "file_%d" , i );
+    fwrite_file( bfs , filename , i , 100 );
+    free( filename );
+  }
+
+  /* Growing a file leaves a hole, and so does unlinking. */
+  for (int i = 0; i < num_files; i += 2) {
+    filename = util_alloc_sprintf( "file_%d" , i );
+    fwrite_file( bfs , filename , i , 200 );
+    free( filename );
+  }
+  block_fs_unlink_file( bfs , "file_1" );
+
+  {
+    size_t size = util_file_size( "test.data_0" );
+    long int reclaimed = block_fs_compact( bfs );
+    test_assert_true( reclaimed > 0 );
+    test_assert_false( util_file_exists( "test.data_0" ));
+    test_assert_true( util_file_exists( "test.data_1" ));
+    test_assert_int_equal( size - reclaimed , util_file_size( "test.data_1" ));
+    test_assert_int_equal( 0 , block_fs_compact( bfs ));
+  }
+
+  fwrite_file( bfs , "file_1" , 1 , 50 );
+  for (int i = 0; i < num_files; i++) {
+    filename = util_alloc_sprintf( "file_%d" , i );
+    assert_file_content( bfs , filename , i , (i % 2 == 0) ? 200 : (i == 1) ? 50 : 100 );
+    free( filename );
+  }
+  block_fs_close( bfs , false );
+
+  bfs = block_fs_mount( "test.mnt" , 64 , 0 , 1.0 , 10 , false , false , false );
+  for (int i = 0; i < num_files; i++) {
+    filename = util_alloc_sprintf( "file_%d" , i );
+    assert_file_content( bfs , filename , i , (i % 2 == 0) ? 200 : (i == 1) ? 50 : 100 );
+    free( filename );
+  }
+  block_fs_close( bfs , false );
+}
+
+
+static void assert_all_files( block_fs_type * bfs , int num_files ) {
+  for (int i = 0; i < num_files; i++) {
+    char * filename = util_alloc_sprintf( "file_%d" , i );
+    assert_file_content( bfs , filename , i , 100 );
+    free( filename );
+  }
+}
+
+
+void test_index_snapshot() {
+  ecl::util::TestArea ta("index");
+  const int num_files = 10;
+  block_fs_type * bfs = block_fs_mount( "test.mnt" , 64 , 0 , 1.0 , 10 , false , false , false );
+  for (int i = 0; i < num_files - 1; i++) {
+    char * filename = util_alloc_sprintf( "file_%d" , i );
+    fwrite_file( bfs , filename , i , 100 );
+    free( filename );
+  }
+  test_assert_false( util_file_exists( "test.index" ));
+  block_fs_fsync_index( bfs );
+  test_assert_true( util_file_exists( "test.index" ));
+
+  /* The snapshot is removed when the filesystem is modified ... */
+  fwrite_file( bfs , "file_9" , 9 , 100 );
+  test_assert_false( util_file_exists( "test.index" ));
+
+  /* ... and written again when it is closed. */
+  block_fs_close( bfs , false );
+  test_assert_true( util_file_exists( "test.index" ));
+
+  bfs = block_fs_mount( "test.mnt" , 64 , 0 , 1.0 , 10 , false , false , false );
+  assert_all_files( bfs , num_files );
+  block_fs_close( bfs , false );
+
+  /* A corrupt snapshot is ignored, and the index is built from the data file. */
+  {
+    FILE * stream = util_fopen( "test.index" , "r+");
+    fseek( stream , -8 , SEEK_END );
+    fputc( 0xff , stream );
+    fclose( stream );
+  }
+  bfs = block_fs_mount( "test.mnt" , 64 , 0 , 1.0 , 10 , false , false , false );
+  assert_all_files( bfs , num_files );
+  block_fs_close( bfs , false );
+}
+
+
 int main(int argc , char ** argv) {
   test_readonly();
   test_lock_conflict();
+  test_compact();
+  test_index_snapshot();
   exit(0);
 }
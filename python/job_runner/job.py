@@ -5,17 +5,21 @@ import time
 from datetime import datetime as dt
 from subprocess import Popen
 
-from psutil import Process, TimeoutExpired, NoSuchProcess, AccessDenied, ZombieProcess
+from psutil import Process, TimeoutExpired
 
 from job_runner.io import assert_file_executable
 from job_runner.reporting.message import Exited, Running, Start
+from job_runner.util.process_tree import ProcessTreeSampler
 
 
 class Job(object):
     MEMORY_POLL_PERIOD = 5  # Seconds between memory polls
 
-    def __init__(self, job_data, index, sleep_interval=1):
+    def __init__(self, job_data, index, sleep_interval=1, memory_poll_period=None):
         self.sleep_interval = sleep_interval
+        if memory_poll_period is None:
+            memory_poll_period = self.MEMORY_POLL_PERIOD
+        self.memory_poll_period = memory_poll_period
         self.job_data = job_data
         self.index = index
         self.std_err = None
@@ -90,24 +94,15 @@ class Job(object):
         exit_code = None
 
         process = Process(proc.pid)
-        max_memory_usage = 0
+        # The memory usage is summed over the job process and all its
+        # children, e.g. the ranks of an MPI job.
+        sampler = ProcessTreeSampler(process)
         while exit_code is None:
-            try:
-                memory = process.memory_info().rss
-            except (NoSuchProcess, AccessDenied, ZombieProcess):
-                """In case of a process that has died and is in some
-                transitional state, we ignore any failures. Only seen on OSX
-                thus far.
-                See https://github.com/giampaolo/psutil/issues/1044#issuecomment-298745532
-                """
-                memory = 0
-            if memory > max_memory_usage:
-                max_memory_usage = memory
-
-            yield Running(self, max_memory_usage, memory)
+            usage = sampler.sample()
+            yield Running(self, usage.max_rss, usage.rss, usage=usage)
 
             try:
-                exit_code = process.wait(timeout=self.MEMORY_POLL_PERIOD)
+                exit_code = process.wait(timeout=self.memory_poll_period)
             except TimeoutExpired:
                 run_time = dt.now() - run_start_time
                 if (
@@ -122,19 +117,20 @@ class Job(object):
                     Propagating the unsuccessful Exited message will kill the
                     callee group. See job_dispatch.py.
                     """
+                    usage = sampler.sample()
                     process_group_id = os.getpgid(proc.pid)
                     this_group_id = os.getpgid(os.getpid())
                     if process_group_id != this_group_id:
                         os.killpg(process_group_id, signal.SIGKILL)
 
-                    yield Exited(self, exit_code).with_error(
+                    yield Exited(self, exit_code, usage=usage).with_error(
                         "Job:{} has been running for more than {} minutes - explicitly killed.".format(
                             self.name(), max_running_minutes
                         )
                     )
                     return
 
-        exited_message = Exited(self, exit_code)
+        exited_message = Exited(self, exit_code, usage=sampler.finish())
 
         if exit_code != 0:
             yield exited_message.with_error(
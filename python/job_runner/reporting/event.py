@@ -6,7 +6,7 @@ from job_runner.reporting.message import (
     Running,
     Start,
 )
-import queue
+import collections
 import threading
 from pathlib import Path
 from job_runner.util.client import Client
@@ -16,13 +16,39 @@ _FM_JOB_RUNNING = "com.equinor.ert.forward_model_job.running"
 _FM_JOB_SUCCESS = "com.equinor.ert.forward_model_job.success"
 _FM_JOB_FAILURE = "com.equinor.ert.forward_model_job.failure"
 
+# Running events are dropped when this many events are waiting to be sent,
+# all other events are always queued.
+DEFAULT_MAX_QUEUE_SIZE = 1000
+DEFAULT_MAX_BATCH_SIZE = 100
+
 
 class TransitionError(ValueError):
     pass
 
 
 class Event:
-    def __init__(self, evaluator_url, token=None, cert_path=None):
+    """Reports the progress of the forward model to the ensemble evaluator.
+
+    Reporting never blocks the job runner: the events are queued and sent
+    by a publisher thread. A Running event replaces the previous Running
+    event of the same job if that has not been sent yet, and Running events
+    are dropped if more than @max_queue_size events are waiting. Start,
+    success and failure events are never dropped.
+
+    The publisher sends all waiting events, at most @max_batch_size at a
+    time; with @batch_events they are sent as one CloudEvents JSON batch,
+    otherwise as one message per event.
+    """
+
+    def __init__(
+        self,
+        evaluator_url,
+        token=None,
+        cert_path=None,
+        max_queue_size=DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+        batch_events=False,
+    ):
         self._evaluator_url = evaluator_url
         self._token = token
         if cert_path is not None:
@@ -34,17 +60,46 @@ class Event:
         self._ee_id = None
         self._real_id = None
         self._step_id = None
-        self._event_queue = queue.Queue()
+        self._max_queue_size = max_queue_size
+        self._max_batch_size = max_batch_size
+        self._batch_events = batch_events
+
+        # The queued events are kept in single element lists, so that a
+        # Running event which has not been sent yet can be replaced in place.
+        self._event_queue = collections.deque()
+        self._pending_running = {}
+        self._num_dropped = 0
+        self._finished = False
+        self._condition = threading.Condition()
         self._event_publisher_thread = threading.Thread(target=self._publish_event)
         self._initialize_state_machine()
 
+    def _next_batch(self):
+        with self._condition:
+            while not self._event_queue and not self._finished:
+                self._condition.wait()
+
+            batch = []
+            while self._event_queue and len(batch) < self._max_batch_size:
+                slot = self._event_queue.popleft()
+                source = slot[0]["source"]
+                if self._pending_running.get(source) is slot:
+                    del self._pending_running[source]
+                batch.append(slot[0])
+            return batch
+
     def _publish_event(self):
         with Client(self._evaluator_url, self._token, self._cert) as client:
             while True:
-                event = self._event_queue.get()
-                if event is None:
+                batch = self._next_batch()
+                if not batch:
                     return
-                client.send(to_json(event).decode())
+                if self._batch_events:
+                    events = ",".join(to_json(event).decode() for event in batch)
+                    client.send(f"[{events}]")
+                else:
+                    for event in batch:
+                        client.send(to_json(event).decode())
 
     def _initialize_state_machine(self):
         initialized = (Init,)
@@ -78,8 +133,24 @@ class Event:
         self._states[new_state](msg)
         self._state = new_state
 
-    def _dump_event(self, event):
-        self._event_queue.put(event)
+    def _dump_event(self, event, coalesce=False):
+        source = event["source"]
+        with self._condition:
+            if coalesce:
+                slot = self._pending_running.get(source)
+                if slot is not None:
+                    slot[0] = event
+                    return
+                if len(self._event_queue) >= self._max_queue_size:
+                    self._num_dropped += 1
+                    return
+                slot = [event]
+                self._pending_running[source] = slot
+            else:
+                self._pending_running.pop(source, None)
+                slot = [event]
+            self._event_queue.append(slot)
+            self._condition.notify()
 
     def _step_path(self):
         return f"/ert/ee/{self._ee_id}/real/{self._real_id}/step/{self._step_id}"
@@ -148,6 +219,12 @@ class Event:
                 )
 
         elif isinstance(msg, Running):
+            data = {
+                "max_memory_usage": msg.max_memory_usage,
+                "current_memory_usage": msg.current_memory_usage,
+            }
+            if msg.usage is not None:
+                data.update(msg.usage.to_dict())
             self._dump_event(
                 CloudEvent(
                     {
@@ -155,13 +232,13 @@ class Event:
                         "source": job_path,
                         "datacontenttype": "application/json",
                     },
-                    {
-                        "max_memory_usage": msg.max_memory_usage,
-                        "current_memory_usage": msg.current_memory_usage,
-                    },
-                )
+                    data,
+                ),
+                coalesce=True,
             )
 
     def _finished_handler(self, msg):
-        self._event_queue.put(None)
+        with self._condition:
+            self._finished = True
+            self._condition.notify()
         self._event_publisher_thread.join()
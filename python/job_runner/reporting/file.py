@@ -16,6 +16,10 @@ from job_runner.reporting.message import (
 )
 from job_runner.util import data as data_util
 
+# Minimum number of seconds between rewrites of status.json caused by
+# Running messages; all other messages always update the file.
+DEFAULT_RUNNING_UPDATE_INTERVAL = 10
+
 
 class File(object):
     LOG_file = "JOB_LOG"
@@ -24,10 +28,16 @@ class File(object):
     OK_file = "OK"
     STATUS_json = "status.json"
 
-    def __init__(self, sync_disc_timeout=10):
+    def __init__(
+        self,
+        sync_disc_timeout=10,
+        running_update_interval=DEFAULT_RUNNING_UPDATE_INTERVAL,
+    ):
         self.status_dict = {}
         self.node = socket.gethostname()
         self._sync_disc_timeout = sync_disc_timeout
+        self._running_update_interval = running_update_interval
+        self._last_status_dump = None
 
     def report(self, msg):
         job_status = {}
@@ -57,6 +67,8 @@ class File(object):
                 self._complete_status_file(msg)
         elif isinstance(msg, Exited):
             job_status["end_time"] = data_util.datetime_serialize(msg.timestamp)
+            if msg.usage is not None:
+                job_status.update(msg.usage.to_dict())
 
             if msg.success():
                 job_status["status"] = _JOB_STATUS_SUCCESS
@@ -75,7 +87,15 @@ class File(object):
         elif isinstance(msg, Running):
             job_status["max_memory_usage"] = msg.max_memory_usage
             job_status["current_memory_usage"] = msg.current_memory_usage
+            if msg.usage is not None:
+                job_status.update(msg.usage.to_dict())
             job_status["status"] = _JOB_STATUS_RUNNING
+            if (
+                self._last_status_dump is not None
+                and time.monotonic() - self._last_status_dump
+                < self._running_update_interval
+            ):
+                return
 
         elif isinstance(msg, Finish):
             if msg.success():
@@ -183,6 +203,11 @@ class File(object):
             )
         time.sleep(self._sync_disc_timeout)  # Let the disks sync up
 
+    # The file is replaced atomically, so readers never see a partially
+    # written status.json.
     def _dump_status_json(self):
-        with open(self.STATUS_json, "w") as fp:
-            json.dump(self.status_dict, fp, indent=1)
+        tmp_file = "{}.{}.tmp".format(self.STATUS_json, os.getpid())
+        with open(tmp_file, "w") as fp:
+            json.dump(self.status_dict, fp)
+        os.replace(tmp_file, self.STATUS_json)
+        self._last_status_dump = time.monotonic()
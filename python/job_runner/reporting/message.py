@@ -60,13 +60,15 @@ class Start(Message):
 
 
 class Running(Message):
-    def __init__(self, job, max_memory_usage, current_memory_usage):
+    def __init__(self, job, max_memory_usage, current_memory_usage, usage=None):
         super(Running, self).__init__(job)
         self.max_memory_usage = max_memory_usage
         self.current_memory_usage = current_memory_usage
+        self.usage = usage
 
 
 class Exited(Message):
-    def __init__(self, job, exit_code):
+    def __init__(self, job, exit_code, usage=None):
         super(Exited, self).__init__(job)
         self.exit_code = exit_code
+        self.usage = usage
@@ -20,6 +20,7 @@ class JobRunner(object):
         self.ert_pid = jobs_data.get("ert_pid")
         self.global_environment = jobs_data.get("global_environment")
         self.global_update_path = jobs_data.get("global_update_path")
+        memory_poll_period = jobs_data.get("memory_poll_period")
         job_data_list = jobs_data["jobList"]
 
         if self.simulation_id is not None:
@@ -27,7 +28,9 @@ class JobRunner(object):
 
         self.jobs = []
         for index, job_data in enumerate(job_data_list):
-            self.jobs.append(Job(job_data, index))
+            self.jobs.append(
+                Job(job_data, index, memory_poll_period=memory_poll_period)
+            )
 
         self._set_environment()
         self._update_path()
@@ -1,22 +1,64 @@
 import websockets
 import asyncio
 import cloudevents
+import collections
+import json
+import logging
+import os
+import random
 import ssl
+import threading
 from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
 from websockets.datastructures import Headers
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BACKOFF = 60
+DEFAULT_MAX_BUFFER_SIZE = 1000
+DEFAULT_CLOSE_TIMEOUT = 60
+
 
 class Client:
+    """Websocket client used to send events to the ensemble evaluator.
+
+    By default send() blocks until the message is sent, reconnecting with
+    exponential backoff if the connection is lost. In buffered mode send()
+    only appends the message to an in-memory buffer, and a background
+    thread sends the buffer over one long-lived connection. When more than
+    @max_buffer_size messages are waiting the newest ones are appended to
+    the file @spill_path, if given; messages left in that file when the
+    client is closed are sent first by the next client using it.
+    """
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        if self.websocket is not None:
-            self.loop.run_until_complete(self.websocket.close())
-        self.loop.close()
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        if self._async_websocket is not None:
+            await self._async_websocket.close()
+            self._async_websocket = None
+        # close() blocks while the buffer is flushed, and must run the
+        # shutdown of self.loop outside the caller's loop.
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
 
     def __init__(
-        self, url, token=None, cert=None, max_retries=10, timeout_multiplier=5
+        self,
+        url,
+        token=None,
+        cert=None,
+        max_retries=10,
+        timeout_multiplier=5,
+        max_backoff=DEFAULT_MAX_BACKOFF,
+        buffered=False,
+        max_buffer_size=DEFAULT_MAX_BUFFER_SIZE,
+        spill_path=None,
+        close_timeout=DEFAULT_CLOSE_TIMEOUT,
     ):
         if url is None:
             raise ValueError("url was None")
@@ -40,20 +82,52 @@ class Client:
 
         self._max_retries = max_retries
         self._timeout_multiplier = timeout_multiplier
+        self._max_backoff = max_backoff
+        # A websocket can only be used from the event loop which created
+        # it: self.websocket belongs to self.loop, and _async_websocket to
+        # the caller's loop in non-buffered send_async().
         self.websocket = None
+        self._async_websocket = None
         self.loop = asyncio.new_event_loop()
 
+        self._buffered = buffered
+        self._max_buffer_size = max_buffer_size
+        self._spill_path = spill_path
+        self._spill_offset = 0
+        self._close_timeout = close_timeout
+        self._buffer = collections.deque()
+        self._lock = threading.Lock()
+        self._closing = False
+        self._wakeup = None
+        self._sender_task = None
+        self._sender_thread = None
+        if buffered:
+            self._sender_thread = threading.Thread(
+                target=self._run_sender, name="ClientSender", daemon=True
+            )
+            self._sender_thread.start()
+
     async def get_websocket(self):
         return await websockets.connect(
             self.url, ssl=self._ssl_context, extra_headers=self._extra_headers
         )
 
-    async def _send(self, msg):
+    def _backoff(self, retry):
+        """Exponential backoff with jitter, in seconds, before retry number
+        @retry + 1."""
+        retry = min(retry, 16)
+        delay = min(
+            self._max_backoff, 0.2 + self._timeout_multiplier * (2 ** retry - 1)
+        )
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _send(self, msg, caller_loop=False):
+        attr = "_async_websocket" if caller_loop else "websocket"
         for retry in range(self._max_retries + 1):
             try:
-                if self.websocket is None:
-                    self.websocket = await self.get_websocket()
-                await self.websocket.send(msg)
+                if getattr(self, attr) is None:
+                    setattr(self, attr, await self.get_websocket())
+                await getattr(self, attr).send(msg)
                 return
             except ConnectionClosedOK:
                 # Connection was closed no point in trying to send more messages
@@ -61,11 +135,23 @@ class Client:
             except (ConnectionClosed, ConnectionRefusedError, OSError):
                 if retry == self._max_retries:
                     raise
-                await asyncio.sleep(0.2 + self._timeout_multiplier * retry)
-                self.websocket = None
+                await asyncio.sleep(self._backoff(retry))
+                setattr(self, attr, None)
+
+    async def send_async(self, msg):
+        """Send @msg from a coroutine running in the caller's event loop. In
+        buffered mode the message is only added to the buffer. The client
+        should then be closed with `async with`."""
+        if self._buffered:
+            self._enqueue(msg)
+        else:
+            await self._send(msg, caller_loop=True)
 
     def send(self, msg):
-        self.loop.run_until_complete(self._send(msg))
+        if self._buffered:
+            self._enqueue(msg)
+        else:
+            self.loop.run_until_complete(self._send(msg))
 
     def send_event(self, ev_type, ev_source, ev_data=None):
         if ev_data is None:
@@ -79,3 +165,134 @@ class Client:
             ev_data,
         )
         self.send(cloudevents.http.to_json(event).decode())
+
+    def close(self):
+        """Close the connection. In buffered mode the buffer is sent first;
+        messages which could not be sent within the close timeout are kept
+        in the spill file, if there is one, and dropped otherwise."""
+        if self._sender_thread is not None:
+            self._closing = True
+            self._wake()
+            self._sender_thread.join(self._close_timeout)
+            if self._sender_thread.is_alive():
+                self.loop.call_soon_threadsafe(self._sender_task.cancel)
+                self._sender_thread.join()
+            self._sender_thread = None
+            self._save_buffer()
+
+        if self.websocket is not None:
+            self.loop.run_until_complete(self.websocket.close())
+            self.websocket = None
+        self.loop.close()
+
+    def _spilling(self):
+        return (
+            self._spill_path is not None
+            and os.path.isfile(self._spill_path)
+            and os.path.getsize(self._spill_path) > self._spill_offset
+        )
+
+    def _enqueue(self, msg):
+        with self._lock:
+            if self._spill_path is not None and (
+                len(self._buffer) >= self._max_buffer_size or self._spilling()
+            ):
+                # Once messages have been spilled, new messages go to the
+                # file as well to keep them in order.
+                with open(self._spill_path, "a") as f:
+                    f.write(json.dumps(msg) + "\n")
+            else:
+                self._buffer.append(msg)
+        self._wake()
+
+    def _refill_buffer(self):
+        """Move messages from the spill file to the empty in-memory buffer."""
+        if not self._spilling():
+            return
+        with open(self._spill_path) as f:
+            f.seek(self._spill_offset)
+            while len(self._buffer) < self._max_buffer_size:
+                line = f.readline()
+                if not line:
+                    break
+                self._buffer.append(json.loads(line))
+            self._spill_offset = f.tell()
+        if not self._spilling():
+            os.unlink(self._spill_path)
+            self._spill_offset = 0
+
+    def _save_buffer(self):
+        with self._lock:
+            if not self._buffer and not self._spilling():
+                return
+            if self._spill_path is None:
+                logger.warning(
+                    f"Dropping {len(self._buffer)} unsent messages to {self.url}"
+                )
+                self._buffer.clear()
+                return
+
+            remaining = []
+            if self._spilling():
+                with open(self._spill_path) as f:
+                    f.seek(self._spill_offset)
+                    remaining = f.readlines()
+            tmp_path = self._spill_path + ".tmp"
+            with open(tmp_path, "w") as f:
+                for msg in self._buffer:
+                    f.write(json.dumps(msg) + "\n")
+                f.writelines(remaining)
+            os.replace(tmp_path, self._spill_path)
+            self._spill_offset = 0
+            self._buffer.clear()
+
+    def _wake(self):
+        if self._buffered:
+            self.loop.call_soon_threadsafe(self._set_wakeup)
+
+    def _set_wakeup(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _next_message(self):
+        with self._lock:
+            if not self._buffer:
+                self._refill_buffer()
+            return self._buffer[0] if self._buffer else None
+
+    def _run_sender(self):
+        self._sender_task = self.loop.create_task(self._sender())
+        try:
+            self.loop.run_until_complete(self._sender_task)
+        except asyncio.CancelledError:
+            pass
+
+    async def _sender(self):
+        self._wakeup = asyncio.Event()
+        retry = 0
+        while True:
+            self._wakeup.clear()
+            msg = self._next_message()
+            if msg is None:
+                if self._closing:
+                    return
+                await self._wakeup.wait()
+                continue
+
+            try:
+                if self.websocket is None:
+                    self.websocket = await self.get_websocket()
+                await self.websocket.send(msg)
+            except ConnectionClosedOK:
+                # Connection was closed no point in trying to send more messages
+                return
+            except (ConnectionClosed, ConnectionRefusedError, OSError) as e:
+                logger.debug(f"Failed to send to {self.url}: {e}")
+                self.websocket = None
+                await asyncio.sleep(self._backoff(retry))
+                retry += 1
+                continue
+
+            retry = 0
+            with self._lock:
+                self._buffer.popleft()
@@ -24,6 +24,11 @@ def create_job_dict(job):
         "stderr": job.std_err,
         "current_memory_usage": None,
         "max_memory_usage": None,
+        "current_pss_memory_usage": None,
+        "max_pss_memory_usage": None,
+        "cpu_seconds": None,
+        "read_bytes": None,
+        "write_bytes": None,
     }
 
 
@@ -0,0 +1,177 @@
+"""Resource usage sampling of a process and all its descendants."""
+import resource
+
+from psutil import AccessDenied, NoSuchProcess, ZombieProcess
+
+_PROCESS_ERRORS = (NoSuchProcess, AccessDenied, ZombieProcess)
+
+
+class ProcessTreeUsage(object):
+    """Resource usage of a process tree.
+
+    Memory is given in bytes, and is the sum over all the processes alive
+    at the time of the sample. The CPU time in seconds and the I/O counters
+    in bytes are accumulated over all processes seen in the tree, including
+    processes which have since exited.
+    """
+
+    def __init__(
+        self,
+        rss=0,
+        max_rss=0,
+        pss=None,
+        max_pss=None,
+        cpu_seconds=0.0,
+        read_bytes=None,
+        write_bytes=None,
+    ):
+        self.rss = rss
+        self.max_rss = max_rss
+        self.pss = pss
+        self.max_pss = max_pss
+        self.cpu_seconds = cpu_seconds
+        self.read_bytes = read_bytes
+        self.write_bytes = write_bytes
+
+    def to_dict(self):
+        return {
+            "current_memory_usage": self.rss,
+            "max_memory_usage": self.max_rss,
+            "current_pss_memory_usage": self.pss,
+            "max_pss_memory_usage": self.max_pss,
+            "cpu_seconds": self.cpu_seconds,
+            "read_bytes": self.read_bytes,
+            "write_bytes": self.write_bytes,
+        }
+
+
+class ProcessTreeSampler(object):
+    """Samples the resource usage of @process and all its descendants.
+
+    PSS (proportional set size) divides shared pages between the processes
+    sharing them, so unlike RSS it does not count the memory shared by e.g.
+    the ranks of an MPI job several times. It is only available on Linux,
+    and is otherwise reported as None.
+
+    @process must be a child of the calling process, which must not reap
+    any other children while sampling, so that finish() can account for
+    the usage after the last sample.
+    """
+
+    def __init__(self, process):
+        self._process = process
+        self._cpu_seconds = {}
+        self._io_counters = {}
+        self._usage = ProcessTreeUsage()
+        self._rusage_start = resource.getrusage(resource.RUSAGE_CHILDREN)
+
+    @property
+    def usage(self):
+        """The most recent sample."""
+        return self._usage
+
+    def _processes(self):
+        processes = [self._process]
+        try:
+            processes.extend(self._process.children(recursive=True))
+        except _PROCESS_ERRORS:
+            pass
+        return processes
+
+    def sample(self):
+        """Sample the process tree, and return the updated ProcessTreeUsage."""
+        rss = 0
+        pss = None
+        for process in self._processes():
+            try:
+                with process.oneshot():
+                    rss += process.memory_info().rss
+                    process_pss = self._pss(process)
+                    if process_pss is not None:
+                        pss = (pss or 0) + process_pss
+
+                    cpu_times = process.cpu_times()
+                    self._cpu_seconds[process.pid] = cpu_times.user + cpu_times.system
+                    io_counters = self._io(process)
+                    if io_counters is not None:
+                        self._io_counters[process.pid] = io_counters
+            except _PROCESS_ERRORS:
+                # The process exited after the tree was listed, or is in
+                # some transitional state, see
+                # https://github.com/giampaolo/psutil/issues/1044
+                continue
+
+        previous = self._usage
+        max_pss = previous.max_pss
+        if pss is not None:
+            max_pss = max(pss, max_pss or 0)
+
+        read_bytes = write_bytes = None
+        if self._io_counters:
+            read_bytes = sum(io[0] for io in self._io_counters.values())
+            write_bytes = sum(io[1] for io in self._io_counters.values())
+
+        self._usage = ProcessTreeUsage(
+            rss=rss,
+            max_rss=max(rss, previous.max_rss),
+            pss=pss,
+            max_pss=max_pss,
+            cpu_seconds=sum(self._cpu_seconds.values()),
+            read_bytes=read_bytes,
+            write_bytes=write_bytes,
+        )
+        return self._usage
+
+    def finish(self):
+        """Complete the usage once @process has been reaped, and return it.
+
+        The kernel's accounting of the reaped children covers the whole
+        run, including the interval after the last sample: the CPU time and
+        block I/O of @process and the descendants it has reaped, and the
+        peak RSS of the largest of them. Current memory is reported as in
+        the last sample.
+        """
+        rusage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        start = self._rusage_start
+        previous = self._usage
+
+        cpu_seconds = (rusage.ru_utime - start.ru_utime) + (
+            rusage.ru_stime - start.ru_stime
+        )
+
+        # ru_maxrss is in kilobytes, and is the maximum over all children
+        # ever reaped, so it only says something about this process tree
+        # when it has grown.
+        max_rss = previous.max_rss
+        if rusage.ru_maxrss > start.ru_maxrss:
+            max_rss = max(max_rss, rusage.ru_maxrss * 1024)
+
+        # The block counts are in units of 512 bytes
+        read_bytes = (rusage.ru_inblock - start.ru_inblock) * 512
+        write_bytes = (rusage.ru_oublock - start.ru_oublock) * 512
+
+        self._usage = ProcessTreeUsage(
+            rss=previous.rss,
+            max_rss=max_rss,
+            pss=previous.pss,
+            max_pss=previous.max_pss,
+            cpu_seconds=max(previous.cpu_seconds, cpu_seconds),
+            read_bytes=max(previous.read_bytes or 0, read_bytes),
+            write_bytes=max(previous.write_bytes or 0, write_bytes),
+        )
+        return self._usage
+
+    @staticmethod
+    def _pss(process):
+        try:
+            return process.memory_full_info().pss
+        except (AttributeError, AccessDenied):
+            return None
+
+    @staticmethod
+    def _io(process):
+        try:
+            io_counters = process.io_counters()
+        except (AttributeError, AccessDenied):
+            return None
+        return io_counters.read_bytes, io_counters.write_bytes
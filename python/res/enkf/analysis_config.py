@@ -106,6 +106,12 @@ class AnalysisConfig(BaseCClass):
     _set_std_cutoff = ResPrototype(
         "void analysis_config_set_std_cutoff(analysis_config, double)"
     )
+    _get_row_chunk_size = ResPrototype(
+        "int analysis_config_get_row_chunk_size(analysis_config)"
+    )
+    _set_row_chunk_size = ResPrototype(
+        "void analysis_config_set_row_chunk_size(analysis_config, int)"
+    )
     _set_global_std_scaling = ResPrototype(
         "void analysis_config_set_global_std_scaling(analysis_config, double)"
     )
@@ -237,6 +243,17 @@ class AnalysisConfig(BaseCClass):
     def setStdCutoff(self, std_cutoff):
         self._set_std_cutoff(std_cutoff)
 
+    def getRowChunkSize(self):
+        """:rtype: int"""
+        return self._get_row_chunk_size()
+
+    def setRowChunkSize(self, row_chunk_size):
+        """Update at most @row_chunk_size parameter rows at a time in the
+        smoother update; 0 updates all the rows of a dataset in one go."""
+        if row_chunk_size < 0:
+            raise ValueError("The row chunk size must be non-negative")
+        self._set_row_chunk_size(row_chunk_size)
+
     def get_merge_observations(self):
         return self._get_merge_observations()
 
@@ -323,6 +340,9 @@ class AnalysisConfig(BaseCClass):
         if self.getEnkfAlpha() != other.getEnkfAlpha():
             return False
 
+        if self.getRowChunkSize() != other.getRowChunkSize():
+            return False
+
         if self.get_merge_observations() != other.get_merge_observations():
             return False
 
@@ -100,6 +100,9 @@ class ConfigKeys:
     _max_resample_key = ResPrototype(
         "char* config_keys_get_max_resample_key()", bind=False
     )
+    _memory_poll_period_key = ResPrototype(
+        "char* config_keys_get_memory_poll_period_key()", bind=False
+    )
     _data_root_key = ResPrototype("char* config_keys_get_data_root_key()", bind=False)
     _rftpath_key = ResPrototype("char* config_keys_get_rftpath_key()", bind=False)
     _gen_kw_export_name_key = ResPrototype(
@@ -308,6 +311,7 @@ class ConfigKeys:
     SIMULATION_JOB = _simulation_job_key()
     RUNPATH = _runpath()
     MAX_RESAMPLE = _max_resample_key()
+    MEMORY_POLL_PERIOD = _memory_poll_period_key()
     DATAROOT = _data_root_key()
     RFTPATH = _rftpath_key()
     GEN_KW_EXPORT_NAME = _gen_kw_export_name_key()
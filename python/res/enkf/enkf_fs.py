@@ -13,17 +13,23 @@
 #
 #  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
 #  for more details.
+import ctypes
 import sys
+
+import numpy
 from cwrap import BaseCClass
 from res import ResPrototype
 from res.enkf import TimeMap, StateMap, SummaryKeySet
-from res.enkf.enums import EnKFFSType
+from res.enkf.enums import EnKFFSType, EnkfVarType, ErtImplType
 
 
 class EnkfFs(BaseCClass):
     TYPE_NAME = "enkf_fs"
 
     _mount = ResPrototype("void* enkf_fs_mount(char* )", bind=False)
+    _mount_readonly = ResPrototype(
+        "void* enkf_fs_mount_readonly(char*, bool)", bind=False
+    )
     _exists = ResPrototype("bool  enkf_fs_exists(char*)", bind=False)
     _disk_version = ResPrototype("int   enkf_fs_disk_version(char*)", bind=False)
     _update_disk_version = ResPrototype(
@@ -39,21 +45,53 @@ class EnkfFs(BaseCClass):
         "bool  enkf_fs_has_vector(enkf_fs,   char*,  int,   int, int)"
     )
     _get_case_name = ResPrototype("char* enkf_fs_get_case_name(enkf_fs)")
+    _get_mount_point = ResPrototype("char* enkf_fs_get_mount_point(enkf_fs)")
     _is_read_only = ResPrototype("bool  enkf_fs_is_read_only(enkf_fs)")
     _is_running = ResPrototype("bool  enkf_fs_is_running(enkf_fs)")
     _fsync = ResPrototype("void  enkf_fs_fsync(enkf_fs)")
+    _compact = ResPrototype("long  enkf_fs_compact(enkf_fs)")
     _create = ResPrototype(
         "enkf_fs_obj   enkf_fs_create_fs(char* , enkf_fs_type_enum , void* , bool)",
         bind=False,
     )
+    _create_sharded = ResPrototype(
+        "enkf_fs_obj   enkf_fs_create_sharded_fs(char* , enkf_fs_type_enum , int , bool)",
+        bind=False,
+    )
+    _get_num_shards = ResPrototype("int   enkf_fs_get_num_shards(enkf_fs)")
     _get_time_map = ResPrototype("time_map_ref  enkf_fs_get_time_map(enkf_fs)")
     _get_state_map = ResPrototype("state_map_ref enkf_fs_get_state_map(enkf_fs)")
     _summary_key_set = ResPrototype(
         "summary_key_set_ref enkf_fs_get_summary_key_set(enkf_fs)"
     )
+    _get_node_view = ResPrototype(
+        "void* enkf_fs_get_node_view(enkf_fs, char*, enkf_var_type_enum, int, int, size_t*)"
+    )
+    _get_vector_view = ResPrototype(
+        "void* enkf_fs_get_vector_view(enkf_fs, char*, enkf_var_type_enum, int, size_t*)"
+    )
+
+    # A stored node starts with the time it was stored, and a serialized
+    # summary vector then continues with the implementation type, the size
+    # and the default value before the data.
+    _NODE_HEADER_SIZE = ctypes.sizeof(ctypes.c_long)
+    _SUMMARY_HEADER_SIZE = 2 * ctypes.sizeof(ctypes.c_int) + ctypes.sizeof(
+        ctypes.c_double
+    )
 
-    def __init__(self, mount_point):
-        c_ptr = self._mount(mount_point)
+    def __init__(self, mount_point, read_only=False, use_mmap=False):
+        """
+        With @read_only the case is mounted without taking the lock on it.
+        With @use_mmap, which requires @read_only, the storage files are
+        memory mapped, and the stored data can be accessed without copying
+        with nodeView(), vectorView() and summaryView().
+        """
+        if read_only:
+            c_ptr = self._mount_readonly(mount_point, use_mmap)
+        elif use_mmap:
+            raise ValueError("Only a read-only filesystem can be memory mapped")
+        else:
+            c_ptr = self._mount(mount_point)
         super(EnkfFs, self).__init__(c_ptr)
 
     def copy(self):
@@ -82,10 +120,87 @@ class EnkfFs(BaseCClass):
         """@rtype: str"""
         return self._get_case_name()
 
+    def getMountPoint(self):
+        """@rtype: str"""
+        return self._get_mount_point()
+
     def isReadOnly(self):
         """@rtype: bool"""
         return self._is_read_only()
 
+    def _view(self, address, size):
+        if not address:
+            return None
+        data = (ctypes.c_char * size.value).from_address(address)
+        # The view is only valid as long as the filesystem is mounted
+        data._fs = self
+        view = numpy.frombuffer(data, dtype=numpy.uint8)
+        view.flags.writeable = False
+        return view
+
+    def nodeView(self, key, var_type, report_step, iens):
+        """
+        Will return a read-only numpy array of bytes over the serialized
+        data of the node in the memory mapped storage, or None if the node
+        does not exist or the filesystem is not memory mapped.
+        @type var_type: EnkfVarType
+        @rtype: numpy.ndarray
+        """
+        size = ctypes.c_size_t(0)
+        address = self._get_node_view(
+            key, var_type, report_step, iens, ctypes.byref(size)
+        )
+        return self._view(address, size)
+
+    def vectorView(self, key, var_type, iens):
+        """
+        As nodeView() for data which is stored as one vector for all report
+        steps, like summary data.
+        @type var_type: EnkfVarType
+        @rtype: numpy.ndarray
+        """
+        size = ctypes.c_size_t(0)
+        address = self._get_vector_view(key, var_type, iens, ctypes.byref(size))
+        return self._view(address, size)
+
+    def summaryView(self, key, iens):
+        """
+        Will return the summary vector @key of realization @iens, indexed by
+        report step, as a read-only numpy array sharing memory with the
+        memory mapped storage. Returns None if there is no such vector or
+        the filesystem is not memory mapped.
+        @rtype: numpy.ndarray
+        """
+        view = self.vectorView(key, EnkfVarType.DYNAMIC_RESULT, iens)
+        if view is None:
+            return None
+
+        impl_type, size = numpy.frombuffer(
+            view, dtype=numpy.intc, count=2, offset=self._NODE_HEADER_SIZE
+        )
+        if impl_type != ErtImplType.SUMMARY.value:
+            raise ValueError("The node %s is not a summary vector" % key)
+        return numpy.frombuffer(
+            view,
+            dtype=numpy.float64,
+            count=size,
+            offset=self._NODE_HEADER_SIZE + self._SUMMARY_HEADER_SIZE,
+        )
+
+    def compact(self):
+        """
+        Will rewrite the storage files without the space left unused by
+        overwritten and deleted data, and return the number of bytes
+        reclaimed. The filesystem can be read while it is compacted; a
+        read-only filesystem is not compacted.
+        @rtype: int
+        """
+        return self._compact()
+
+    def numShards(self):
+        """@rtype: int"""
+        return self._get_num_shards()
+
     def refCount(self):
         return self._get_refcount()
 
@@ -108,11 +223,22 @@ class EnkfFs(BaseCClass):
         return cls._update_disk_version(path, src_version, target_version)
 
     @classmethod
-    def createFileSystem(cls, path, mount=False):
+    def createFileSystem(cls, path, mount=False, num_shards=None):
+        """
+        The realizations are spread over @num_shards storage files, which
+        can be written concurrently; with @num_shards at least the
+        ensemble size every realization is stored in a file of its own.
+        The default is 32 shards.
+        """
         assert isinstance(path, str)
         fs_type = EnKFFSType.BLOCK_FS_DRIVER_ID
-        arg = None
-        fs = cls._create(path, fs_type, arg, mount)
+        if num_shards is None:
+            arg = None
+            fs = cls._create(path, fs_type, arg, mount)
+        else:
+            if num_shards <= 0:
+                raise ValueError("The number of shards must be positive")
+            fs = cls._create_sharded(path, fs_type, num_shards, mount)
         return fs
 
     # The umount( ) method should not normally be called explicitly by
@@ -1,5 +1,7 @@
 import os.path
 import re
+import time
+from collections import namedtuple
 
 from cwrap import BaseCClass
 from ecl.util.util import StringList, BoolVector
@@ -14,6 +16,9 @@ from res.enkf import (
 )
 
 
+CompactionResult = namedtuple("CompactionResult", "bytes_reclaimed seconds")
+
+
 def naturalSortKey(s, _nsre=re.compile("([0-9]+)")):
     return [
         int(text) if text.isdigit() else text.lower() for text in re.split(_nsre, s)
@@ -148,8 +153,11 @@ class EnkfFsManager(BaseCClass):
     # The return value from the getFileSystem will be a weak reference to the
     # underlying enkf_fs object. That implies that the fs manager must be in
     # scope for the return value to be valid.
-    def getFileSystem(self, case_name, mount_root=None):
+    def getFileSystem(self, case_name, mount_root=None, num_shards=None):
         """
+        If the case does not exist it is created, with the realizations
+        spread over @num_shards storage files, see
+        EnkfFs.createFileSystem().
         @rtype: EnkfFs
         """
         if mount_root is None:
@@ -162,7 +170,7 @@ class EnkfFsManager(BaseCClass):
                 if self._fs_rotator.atCapacity():
                     self._fs_rotator.dropOldestFileSystem()
 
-                EnkfFs.createFileSystem(full_case_name)
+                EnkfFs.createFileSystem(full_case_name, num_shards=num_shards)
 
             new_fs = EnkfFs(full_case_name)
             self._fs_rotator.addFileSystem(new_fs, full_case_name)
@@ -171,6 +179,25 @@ class EnkfFsManager(BaseCClass):
 
         return fs
 
+    def compactCase(self, case_name, mount_root=None):
+        """
+        Compacts the storage of an existing case, see EnkfFs.compact(),
+        and returns the number of bytes reclaimed and the time it took in
+        seconds. The case can be read while it is compacted.
+        @rtype: CompactionResult
+        """
+        if mount_root is None:
+            mount_root = self._mount_root
+
+        full_case_name = self._createFullCaseName(mount_root, case_name)
+        if not EnkfFs.exists(full_case_name):
+            raise KeyError("No such case: %s" % case_name)
+
+        fs = self.getFileSystem(case_name, mount_root)
+        start_time = time.time()
+        bytes_reclaimed = fs.compact()
+        return CompactionResult(bytes_reclaimed, time.time() - start_time)
+
     def isCaseRunning(self, case_name, mount_root=None):
         """Returns true if case is mounted and write_count > 0
         @rtype: bool
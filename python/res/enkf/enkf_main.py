@@ -15,6 +15,7 @@
 #  for more details.
 import sys
 import ctypes, warnings
+import logging
 from os.path import isfile
 
 from cwrap import BaseCClass
@@ -35,7 +36,9 @@ from res.enkf.enums import EnkfInitModeEnum
 from res.enkf.key_manager import KeyManager
 from res.util import Log
 from res.util.substitution_list import SubstitutionList
-from ecl.util.util import rng
+from ecl.util.util import rng, DoubleVector
+
+logger = logging.getLogger(__name__)
 
 
 class EnKFMain(BaseCClass):
@@ -229,12 +232,12 @@ class _RealEnKFMain(BaseCClass):
     _export_field_with_fs = ResPrototype(
         "bool enkf_main_export_field_with_fs(enkf_main, char*, char*, bool_vector, enkf_field_file_format_enum, int, enkf_fs_manager)"
     )
-    _load_from_forward_model = ResPrototype(
-        "int enkf_main_load_from_forward_model_from_gui(enkf_main, int, bool_vector, enkf_fs)"
-    )
     _load_from_run_context = ResPrototype(
         "int enkf_main_load_from_run_context_from_gui(enkf_main, ert_run_context, enkf_fs)"
     )
+    _load_from_run_context_timed = ResPrototype(
+        "int enkf_main_load_from_run_context_timed_from_gui(enkf_main, ert_run_context, enkf_fs, int, double_vector)"
+    )
     _create_run_path = ResPrototype(
         "void enkf_main_create_run_path(enkf_main , ert_run_context)"
     )
@@ -428,13 +431,55 @@ class _RealEnKFMain(BaseCClass):
             keyword, path, iactive, file_type, report_step, state, enkfFs
         )
 
-    def loadFromForwardModel(self, realization, iteration, fs):
+    def loadFromForwardModel(self, realization, iteration, fs, num_threads=0):
         """Returns the number of loaded realizations"""
-        return self._load_from_forward_model(iteration, realization, fs)
+        run_context = self.getRunContextENSEMPLE_EXPERIMENT(fs, realization, iteration)
+        return self.loadFromRunContext(run_context, fs, num_threads=num_threads)
 
-    def loadFromRunContext(self, run_context, fs):
-        """Returns the number of loaded realizations"""
-        return self._load_from_run_context(run_context, fs)
+    def loadFromRunContext(self, run_context, fs, num_threads=0):
+        """Returns the number of loaded realizations
+
+        The realizations are loaded in parallel using @num_threads threads,
+        the default value 0 means one thread per core. The time spent loading
+        each realization is logged.
+        """
+        loaded, load_times = self.loadFromRunContextWithTiming(
+            run_context, fs, num_threads=num_threads
+        )
+        if load_times:
+            slowest = max(load_times, key=load_times.get)
+            logger.info(
+                "Loaded %d of %d realizations, total load time %.2f s, "
+                "slowest realization %d: %.2f s"
+                % (
+                    loaded,
+                    len(load_times),
+                    sum(load_times.values()),
+                    slowest,
+                    load_times[slowest],
+                )
+            )
+            for iens, load_time in sorted(load_times.items()):
+                logger.debug("Realization %d loaded in %.2f s" % (iens, load_time))
+        return loaded
+
+    def loadFromRunContextWithTiming(self, run_context, fs, num_threads=0):
+        """
+        Loads the results like loadFromRunContext() and returns a tuple
+        (loaded, load_times) where load_times is a dict mapping each active
+        realization to the wall clock time in seconds used to load it.
+        @rtype: (int, dict)
+        """
+        load_time_vector = DoubleVector()
+        loaded = self._load_from_run_context_timed(
+            run_context, fs, num_threads, load_time_vector
+        )
+        load_times = {
+            iens: load_time
+            for iens, load_time in enumerate(load_time_vector)
+            if load_time >= 0
+        }
+        return loaded, load_times
 
     def initRun(self, run_context):
         self._init_run(run_context)
@@ -46,6 +46,12 @@ class EnkfObs(BaseCClass):
     _alloc_matching_keylist = ResPrototype(
         "stringlist_obj enkf_obs_alloc_matching_keylist(enkf_obs, char*)"
     )
+    _alloc_data_keylist = ResPrototype(
+        "stringlist_obj enkf_obs_alloc_data_keylist(enkf_obs)"
+    )
+    _alloc_data_obs_keylist = ResPrototype(
+        "stringlist_obj enkf_obs_alloc_data_obs_keylist(enkf_obs, char*)"
+    )
     _has_key = ResPrototype("bool enkf_obs_has_key(enkf_obs, char*)")
     _obs_type = ResPrototype("enkf_obs_impl_type enkf_obs_get_type(enkf_obs, char*)")
     _get_vector = ResPrototype("obs_vector_ref enkf_obs_get_vector(enkf_obs, char*)")
@@ -143,14 +149,26 @@ class EnkfObs(BaseCClass):
         """
         key_list = self._alloc_matching_keylist(pattern)
         if obs_type:
-            new_key_list = []
-            for key in key_list:
-                if self.obsType(key) == obs_type:
-                    new_key_list.append(key)
-            return new_key_list
+            typed_keys = set(self.getTypedKeylist(obs_type))
+            return [key for key in key_list if key in typed_keys]
         else:
             return key_list
 
+    def getObservedDataKeys(self):
+        """
+        Will return the keys of the data, e.g. summary vectors, which have
+        at least one observation.
+        @rtype: StringList
+        """
+        return self._alloc_data_keylist()
+
+    def getDataObservationKeys(self, data_key):
+        """
+        Will return the keys of the observations of the data @data_key.
+        @rtype: StringList
+        """
+        return self._alloc_data_obs_keylist(data_key)
+
     def hasKey(self, key):
         """@rtype: bool"""
         return key in self
@@ -1,5 +1,44 @@
 from cwrap import BaseCClass
+from ecl.util.util import BoolVector
+import numpy as np
+
 from res import ResPrototype
+from res.enkf.enums import RealizationStateEnum
+from res.enkf.meas_data import MeasData
+from res.enkf.obs_data import ObsData
+from res.util import Matrix
+
+
+class UpdateProblem(object):
+    """
+    The ensemble smoother update problem of one ministep, with the
+    matrices as numpy arrays. The columns correspond to the active
+    realizations in @ens_mask, and the rows of the observation matrices
+    to the active observations:
+
+      S:    the simulated responses.
+      E:    the perturbations of the observations.
+      D:    the perturbed innovations, dObs[:, 0] + E - S.
+      R:    the observation error covariance.
+      dObs: the observed values and their standard deviations.
+      A:    a dict from dataset name to the serialized parameters of the
+            dataset, one row for each active parameter element.
+
+    The arrays share storage with the underlying C matrices. An update
+    engine can modify the arrays of A in place or replace them with new
+    arrays, and store the result with ESUpdate.saveUpdateProblem().
+    Parameters with row scaling attached are not part of A.
+    """
+
+    def __init__(self, ministep, ens_mask, S, E, D, R, dObs, A):
+        self.ministep = ministep
+        self.ens_mask = ens_mask
+        self.S = S
+        self.E = E
+        self.D = D
+        self.R = R
+        self.dObs = dObs
+        self.A = A
 
 
 class ESUpdate(BaseCClass):
@@ -7,6 +46,15 @@ class ESUpdate(BaseCClass):
     _smoother_update = ResPrototype(
         "bool enkf_main_smoother_update(es_update, enkf_fs, enkf_fs)"
     )
+    _get_update_data = ResPrototype(
+        "void enkf_main_get_update_data(es_update, enkf_fs, local_ministep, bool_vector, meas_data, obs_data)"
+    )
+    _alloc_update_A = ResPrototype(
+        "matrix_obj enkf_main_alloc_update_A(es_update, enkf_fs, local_dataset, bool_vector)"
+    )
+    _save_update_A = ResPrototype(
+        "bool enkf_main_save_update_A(es_update, enkf_fs, enkf_fs, local_dataset, bool_vector, matrix)"
+    )
 
     def __init__(self, enkf_main):
         assert isinstance(enkf_main, BaseCClass)
@@ -42,3 +90,87 @@ class ESUpdate(BaseCClass):
         data_fs = run_context.get_sim_fs()
         target_fs = run_context.get_target_fs()
         return self._smoother_update(data_fs, target_fs)
+
+    def createUpdateProblem(self, source_fs, ministep=None, scale_data=False):
+        """
+        Will build the update problem of @ministep from the simulated data
+        in @source_fs, using the realizations which have data. By default
+        the single ministep of the local configuration is used. If
+        @scale_data is True S, E, D, R and dObs are scaled with the
+        observation standard deviations, as for the analysis modules with
+        the SCALE_DATA option.
+        @rtype: UpdateProblem
+        """
+        enkf_main = self.parent()
+        if ministep is None:
+            updatestep = enkf_main.getLocalConfig().getUpdatestep()
+            if len(updatestep) != 1:
+                raise ValueError(
+                    "The update step has %d ministeps, select one" % len(updatestep)
+                )
+            ministep = updatestep[0]
+
+        ens_mask = BoolVector(
+            default_value=False, initial_size=enkf_main.getEnsembleSize()
+        )
+        source_fs.getStateMap().selectMatching(
+            ens_mask, RealizationStateEnum.STATE_HAS_DATA
+        )
+
+        meas_data = MeasData(ens_mask)
+        obs_data = ObsData(self._analysis_config().getGlobalStdScaling())
+        self._get_update_data(source_fs, ministep, ens_mask, meas_data, obs_data)
+        if meas_data.activeObsSize() == 0:
+            raise ValueError(
+                "No active observations for ministep: %s" % ministep.name()
+            )
+
+        S = meas_data.createS()
+        R = obs_data.createR()
+        dObs = obs_data.createDObs()
+        E = obs_data.createE(enkf_main.rng(), meas_data.getActiveEnsSize())
+        D = obs_data.createD(E, S)
+        if scale_data:
+            obs_data.scale(S, E=E, D=D, R=R, D_obs=dObs)
+
+        A = {}
+        for name in ministep.keys():
+            A_matrix = self._alloc_update_A(source_fs, ministep[name], ens_mask)
+            if A_matrix is None:
+                A[name] = np.empty((0, meas_data.getActiveEnsSize()), order="F")
+            else:
+                A[name] = A_matrix.numpyView()
+
+        return UpdateProblem(
+            ministep,
+            ens_mask,
+            S.numpyView(),
+            E.numpyView(),
+            D.numpyView(),
+            R.numpyView(),
+            dObs.numpyView(),
+            A,
+        )
+
+    def saveUpdateProblem(self, problem, source_fs, target_fs):
+        """
+        Will store the parameters in problem.A to @target_fs. Parameter
+        elements which are not active in the ministep keep the value they
+        have in @source_fs. Parameters which are not part of the ministep
+        are not copied, so @target_fs should be initialized from
+        @source_fs first, e.g. with
+        EnkfFsManager.initializeCaseFromExisting().
+        """
+        for name, A in problem.A.items():
+            if A.size == 0:
+                continue
+            if not self._save_update_A(
+                source_fs,
+                target_fs,
+                problem.ministep[name],
+                problem.ens_mask,
+                Matrix.fromNumpy(A),
+            ):
+                raise ValueError(
+                    "The A matrix of dataset %s has wrong shape %s" % (name, A.shape)
+                )
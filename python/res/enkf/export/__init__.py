@@ -6,6 +6,8 @@ from .gen_data_collector import GenDataCollector
 from .gen_data_observation_collector import GenDataObservationCollector
 from .misfit_collector import MisfitCollector
 from .arg_loader import ArgLoader
+from .export_cache import ExportCache
+from .export_writer import ExportWriter
 
 __all__ = [
     "DesignMatrixReader",
@@ -16,4 +18,6 @@ __all__ = [
     "GenDataCollector",
     "GenDataObservationCollector",
     "ArgLoader",
+    "ExportCache",
+    "ExportWriter",
 ]
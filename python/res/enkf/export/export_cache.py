@@ -0,0 +1,153 @@
+import hashlib
+import logging
+import os
+
+import numpy
+from pandas import DataFrame, Index, MultiIndex
+
+logger = logging.getLogger(__name__)
+
+
+class ExportCache(object):
+    """
+    Columnar on-disk cache of the DataFrames produced by the export
+    collectors. The frames are stored as NPZ files in the directory
+    export_cache/ below the mount point of the case.
+
+    Every cache entry is stamped with a fingerprint of the case: the
+    contents of the state map and the time map, and the size and
+    modification time of the storage files. When realizations load new
+    data the fingerprint changes and the stale entries are recomputed.
+
+    The arguments an entry is stored under must include the configuration
+    the frame depends on, like the resolved list of keys and the ensemble
+    size, as the fingerprint only covers the case on disk.
+    """
+
+    CACHE_DIR = "export_cache"
+
+    def __init__(self, fs):
+        """@type fs: EnkfFs"""
+        self._fs = fs
+        self._mount_point = fs.getMountPoint()
+        self._path = os.path.join(self._mount_point, ExportCache.CACHE_DIR)
+        self._fingerprint = None
+
+    @property
+    def path(self):
+        return self._path
+
+    def _storage_files(self):
+        for root, dirs, files in os.walk(self._mount_point):
+            if root == self._mount_point and ExportCache.CACHE_DIR in dirs:
+                dirs.remove(ExportCache.CACHE_DIR)
+            dirs.sort()
+            for name in sorted(files):
+                yield os.path.join(root, name)
+
+    def fingerprint(self):
+        """@rtype: str"""
+        if self._fingerprint is None:
+            sha = hashlib.sha1()
+            for state in self._fs.getStateMap():
+                sha.update(b"%d," % state.value)
+            sha.update(b";")
+            for time in self._fs.getTimeMap():
+                sha.update(b"%d," % time.ctime())
+            sha.update(b";")
+            for filename in self._storage_files():
+                stat = os.stat(filename)
+                sha.update(
+                    (
+                        "%s:%d:%d,"
+                        % (
+                            os.path.relpath(filename, self._mount_point),
+                            stat.st_size,
+                            stat.st_mtime_ns,
+                        )
+                    ).encode("utf-8")
+                )
+            self._fingerprint = sha.hexdigest()
+        return self._fingerprint
+
+    def _filename(self, name, args):
+        arg_hash = hashlib.sha1(repr(args).encode("utf-8")).hexdigest()
+        return os.path.join(self._path, "%s-%s.npz" % (name, arg_hash[:16]))
+
+    def load(self, name, *args):
+        """
+        Returns the cached frame for the collector @name called with @args,
+        or None if there is no valid cache entry.
+        @rtype: DataFrame
+        """
+        filename = self._filename(name, args)
+        if not os.path.isfile(filename):
+            return None
+
+        try:
+            with numpy.load(filename, allow_pickle=False) as npz:
+                if str(npz["fingerprint"]) != self.fingerprint():
+                    return None
+                return ExportCache._frame_from_arrays(npz)
+        except (IOError, OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable export cache %s: %s" % (filename, e))
+            return None
+
+    def store(self, name, frame, *args):
+        """Stores @frame as the cached result of the collector @name."""
+        filename = self._filename(name, args)
+        tmp_filename = filename + ".tmp.npz"
+        try:
+            if not os.path.isdir(self._path):
+                os.makedirs(self._path)
+            numpy.savez(
+                tmp_filename,
+                fingerprint=numpy.array(self.fingerprint()),
+                **ExportCache._frame_to_arrays(frame)
+            )
+            os.rename(tmp_filename, filename)
+        except (IOError, OSError) as e:
+            logger.warning("Could not write export cache %s: %s" % (filename, e))
+
+    def clear(self):
+        if os.path.isdir(self._path):
+            for name in os.listdir(self._path):
+                os.unlink(os.path.join(self._path, name))
+
+    @staticmethod
+    def _index_to_arrays(prefix, index):
+        arrays = {
+            "%s_names"
+            % prefix: numpy.array(
+                ["" if name is None else name for name in index.names]
+            ),
+        }
+        for level in range(index.nlevels):
+            values = index.get_level_values(level).to_numpy()
+            if values.dtype == object:
+                values = values.astype(str)
+            arrays["%s_%d" % (prefix, level)] = values
+        return arrays
+
+    @staticmethod
+    def _index_from_arrays(prefix, npz):
+        names = [None if name == "" else name for name in npz["%s_names" % prefix]]
+        levels = [npz["%s_%d" % (prefix, level)] for level in range(len(names))]
+        if len(levels) == 1:
+            return Index(levels[0], name=names[0])
+        return MultiIndex.from_arrays(levels, names=names)
+
+    @staticmethod
+    def _frame_to_arrays(frame):
+        arrays = {"values": frame.to_numpy()}
+        arrays.update(ExportCache._index_to_arrays("index", frame.index))
+        arrays.update(ExportCache._index_to_arrays("columns", frame.columns))
+        return arrays
+
+    @staticmethod
+    def _frame_from_arrays(npz):
+        return DataFrame(
+            data=npz["values"],
+            index=ExportCache._index_from_arrays("index", npz),
+            columns=ExportCache._index_from_arrays("columns", npz),
+        )
@@ -0,0 +1,216 @@
+import os
+import shutil
+import tempfile
+
+import numpy
+import pandas
+
+
+class ExportWriter(object):
+    """
+    Writes a table to a CSV, Parquet or Feather file one DataFrame block at
+    a time, so the complete table never has to be in memory. The format is
+    given by @output_format, or by the extension of @path.
+
+    The columns of the table are fixed before the first block is written:
+    they are @columns, or the columns of the first block if @columns is not
+    given. Every block is reindexed to these columns, so a column missing
+    from a block is written as NaN, and a block with a column outside the
+    table is rejected. Each block is written to the output as soon as it
+    is given to write().
+
+    For Parquet and Feather the index of the blocks is stored as ordinary
+    columns, and the schema of the file is built from the index names and
+    the columns of the table, with the type given by @dtypes or float64 for
+    the names missing from @dtypes. These formats require pyarrow.
+
+    With @drop_const_cols the columns which have the same value in every
+    row are left out. These are only known when all the rows have been
+    seen, so the blocks are then spooled in a directory next to @path and
+    written at close().
+    """
+
+    FORMATS = ("csv", "parquet", "feather")
+
+    def __init__(
+        self,
+        path,
+        output_format=None,
+        drop_const_cols=False,
+        columns=None,
+        dtypes=None,
+    ):
+        if output_format is None:
+            output_format = ExportWriter.formatFromPath(path)
+        if output_format not in ExportWriter.FORMATS:
+            raise ValueError(
+                "Unknown export format '%s', must be one of: %s"
+                % (output_format, ", ".join(ExportWriter.FORMATS))
+            )
+
+        if output_format != "csv":
+            try:
+                import pyarrow
+            except ImportError:
+                raise ImportError(
+                    "Exporting to %s requires the pyarrow package" % output_format
+                )
+
+        self._path = path
+        self._format = output_format
+        self._columns = None if columns is None else pandas.Index(columns)
+        self._dtypes = dict(dtypes or {})
+        self._num_rows = 0
+        self._file = None
+        self._schema = None
+        self._closed = False
+
+        self._drop_const_cols = drop_const_cols
+        self._spool_dir = None
+        self._spool_files = []
+        self._first_row = None
+        self._varying = None
+        if drop_const_cols:
+            self._spool_dir = tempfile.mkdtemp(
+                prefix=".%s-" % os.path.basename(path),
+                dir=os.path.dirname(os.path.abspath(path)),
+            )
+
+    @staticmethod
+    def formatFromPath(path):
+        """@rtype: str"""
+        extension = os.path.splitext(path)[1].lower()
+        if extension in (".parquet", ".pq"):
+            return "parquet"
+        if extension in (".feather", ".arrow"):
+            return "feather"
+        return "csv"
+
+    @property
+    def columns(self):
+        """The columns of the table, or None before the first block if they
+        were not given. With drop_const_cols these are the columns which are
+        left after close()."""
+        return self._columns
+
+    @property
+    def numRows(self):
+        return self._num_rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._closeFile()
+            self._removeSpool()
+
+    def _alignColumns(self, frame):
+        if self._columns is None:
+            self._columns = frame.columns
+        unknown = frame.columns.difference(self._columns, sort=False)
+        if len(unknown) > 0:
+            raise ValueError(
+                "The columns %s are not among the exported columns"
+                % ", ".join(str(column) for column in unknown)
+            )
+        return frame.reindex(columns=self._columns)
+
+    def _updateVarying(self, frame):
+        # Rows without a column hold NaN there, and NaN never compares
+        # equal, so a column missing from some rows is never constant.
+        if self._first_row is None:
+            self._first_row = frame.iloc[0]
+            self._varying = pandas.Series(False, index=self._columns)
+        self._varying |= (frame != self._first_row).any()
+
+    def write(self, frame):
+        """Appends the rows of the DataFrame @frame to the table."""
+        frame = self._alignColumns(frame)
+        if len(frame.index) == 0:
+            return
+
+        if self._drop_const_cols:
+            self._updateVarying(frame)
+            filename = os.path.join(self._spool_dir, "%d.pkl" % len(self._spool_files))
+            frame.to_pickle(filename)
+            self._spool_files.append(filename)
+        else:
+            self._writeBlock(frame)
+        self._num_rows += len(frame.index)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._drop_const_cols and self._columns is not None:
+                if self._varying is None:
+                    self._columns = pandas.Index([])
+                else:
+                    self._columns = self._varying[self._varying].index
+            for filename in self._spool_files:
+                frame = pandas.read_pickle(filename)
+                self._writeBlock(frame[self._columns])
+                os.unlink(filename)
+            self._spool_files = []
+            if self._file is None and self._format == "csv":
+                # Nothing has been written, leave an empty file
+                open(self._path, "w").close()
+        finally:
+            self._closeFile()
+            self._removeSpool()
+
+    def _removeSpool(self):
+        if self._spool_dir is not None:
+            shutil.rmtree(self._spool_dir, ignore_errors=True)
+            self._spool_dir = None
+
+    def _closeFile(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _createSchema(self, frame):
+        import pyarrow
+
+        fields = []
+        for name in list(frame.index.names) + list(self._columns):
+            dtype = numpy.dtype(self._dtypes.get(name, numpy.float64))
+            if dtype == numpy.dtype(object):
+                field_type = pyarrow.string()
+            else:
+                field_type = pyarrow.from_numpy_dtype(dtype)
+            fields.append(pyarrow.field(str(name), field_type))
+        return pyarrow.schema(fields)
+
+    def _writeBlock(self, frame):
+        if self._format == "csv":
+            if self._file is None:
+                self._file = open(self._path, "w")
+                frame.to_csv(self._file)
+            else:
+                frame.to_csv(self._file, header=False)
+            return
+
+        import pyarrow
+
+        if self._file is None:
+            self._schema = self._createSchema(frame)
+            if self._format == "parquet":
+                import pyarrow.parquet
+
+                self._file = pyarrow.parquet.ParquetWriter(self._path, self._schema)
+            else:
+                import pyarrow.ipc
+
+                self._file = pyarrow.ipc.new_file(self._path, self._schema)
+
+        frame = frame.reset_index()
+        frame.columns = [str(column) for column in frame.columns]
+        table = pyarrow.Table.from_pandas(
+            frame, schema=self._schema, preserve_index=False
+        )
+        self._file.write_table(table)
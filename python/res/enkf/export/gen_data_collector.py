@@ -3,23 +3,35 @@ from pandas import DataFrame, MultiIndex
 import numpy
 from res.enkf import ErtImplType, EnKFMain, EnkfFs, RealizationStateEnum, GenKwConfig
 from res.enkf.plot_data import EnsemblePlotGenData
+from res.enkf.export.export_cache import ExportCache
 from ecl.util.util import BoolVector
 
 
 class GenDataCollector(object):
     @staticmethod
-    def loadGenData(ert, case_name, key, report_step):
+    def loadGenData(ert, case_name, key, report_step, use_cache=False):
         """@type ert: EnKFMain
         @type case_name: str
         @type key: str
         @type report_step: int
+        @type use_cache: bool
         @rtype: DataFrame
 
         In the returned dataframe the realisation index runs along the
         rows, and the gen_data element index runs vertically along the
         columns.
+
+        If @use_cache is True the result is read from, and stored in, the
+        ExportCache of the case.
         """
         fs = ert.getEnkfFsManager().getFileSystem(case_name)
+        cache = None
+        if use_cache:
+            cache = ExportCache(fs)
+            cache_args = (key, report_step, ert.getEnsembleSize())
+            gen_data = cache.load("gen_data", *cache_args)
+            if gen_data is not None:
+                return gen_data
         realizations = fs.realizationList(RealizationStateEnum.STATE_HAS_DATA)
         config_node = ert.ensembleConfig().getNode(key)
         gen_data_config = config_node.getModelConfig()
@@ -45,4 +57,7 @@ class GenDataCollector(object):
                         data_array[data_index][realization_index] = value
 
         realizations = numpy.array(realizations)
-        return DataFrame(data=data_array, columns=realizations)
+        gen_data = DataFrame(data=data_array, columns=realizations)
+        if cache is not None:
+            cache.store("gen_data", gen_data, *cache_args)
+        return gen_data
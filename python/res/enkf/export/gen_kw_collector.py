@@ -3,6 +3,7 @@ from pandas import DataFrame, MultiIndex
 import numpy
 from res.enkf import ErtImplType, EnKFMain, EnkfFs, RealizationStateEnum, GenKwConfig
 from res.enkf.key_manager import KeyManager
+from res.enkf.export.export_cache import ExportCache
 from res.enkf.plot_data import EnsemblePlotGenKW
 from ecl.util.util import BoolVector
 
@@ -28,17 +29,28 @@ class GenKwCollector(object):
         return key_manager.genKwKeys()
 
     @staticmethod
-    def loadAllGenKwData(ert, case_name, keys=None):
+    def loadAllGenKwData(ert, case_name, keys=None, use_cache=False):
         """
         @type ert: EnKFMain
         @type case_name: str
         @type keys: list of str
+        @type use_cache: bool
         @rtype: DataFrame
+
+        If @use_cache is True the result is read from, and stored in, the
+        ExportCache of the case.
         """
         fs = ert.getEnkfFsManager().getFileSystem(case_name)
+        return GenKwCollector.loadAllGenKwDataFromFs(ert, fs, keys, use_cache)
 
-        realizations = GenKwCollector.createActiveList(ert, fs)
-
+    @staticmethod
+    def loadAllGenKwDataFromFs(ert, fs, keys=None, use_cache=False):
+        """
+        As loadAllGenKwData(), for the already mounted case @fs.
+        @type ert: EnKFMain
+        @type fs: EnkfFs
+        @rtype: DataFrame
+        """
         gen_kw_keys = GenKwCollector.getAllGenKwKeys(ert)
 
         if keys is not None:
@@ -46,6 +58,16 @@ class GenKwCollector(object):
                 key for key in keys if key in gen_kw_keys
             ]  # ignore keys that doesn't exist
 
+        cache = None
+        if use_cache:
+            cache = ExportCache(fs)
+            cache_args = GenKwCollector._cacheArgs(ert, gen_kw_keys)
+            gen_kw_data = cache.load("gen_kw", *cache_args)
+            if gen_kw_data is not None:
+                return gen_kw_data
+
+        realizations = GenKwCollector.createActiveList(ert, fs)
+
         gen_kw_array = numpy.empty(
             shape=(len(gen_kw_keys), len(realizations)), dtype=numpy.float64
         )
@@ -78,4 +100,19 @@ class GenKwCollector(object):
         )
         gen_kw_data.index.name = "Realization"
 
+        if cache is not None:
+            cache.store("gen_kw", gen_kw_data, *cache_args)
         return gen_kw_data
+
+    @staticmethod
+    def _cacheArgs(ert, gen_kw_keys):
+        """The configuration the cached frame depends on: the keys, the
+        ensemble size and the priors of the GEN_KW nodes."""
+        node_keys = sorted(
+            set(key.split(":")[0].replace("LOG10_", "", 1) for key in gen_kw_keys)
+        )
+        priors = [
+            ert.ensembleConfig().getNode(key).getModelConfig().get_priors()
+            for key in node_keys
+        ]
+        return gen_kw_keys, ert.getEnsembleSize(), priors
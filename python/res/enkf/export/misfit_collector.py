@@ -1,7 +1,15 @@
-from pandas import DataFrame
+from collections import OrderedDict
+
+from pandas import DataFrame, MultiIndex
 import numpy
-from res.enkf import EnKFMain, EnkfFs, RealizationStateEnum
+from res.enkf import (
+    EnKFMain,
+    EnkfFs,
+    EnkfObservationImplementationType,
+    RealizationStateEnum,
+)
 from res.enkf.key_manager import KeyManager
+from res.enkf.plot_data import EnsemblePlotData
 from ecl.util.util import BoolVector
 
 
@@ -21,6 +29,65 @@ class MisfitCollector(object):
         key_manager = KeyManager(ert)
         return key_manager.misfitKeys(sort_keys=sort_keys)
 
+    @staticmethod
+    def _summaryChi2(obs_vectors, values, mask, fs, realizations):
+        for obs_vector in obs_vectors:
+            steps, obs_values, obs_std = obs_vector.getSummaryData()
+            if not mask[:, steps].all():
+                # The plot data masks both missing data and holes in the
+                # stored vectors, while the chi2 of the observation uses
+                # the stored value at a hole; let the observation compute
+                # vectors with any masked step itself.
+                yield steps, obs_vector.getEnsembleChi2(fs, realizations)
+                continue
+            x = (values[:, steps] - obs_values) / obs_std
+            yield steps, numpy.transpose(x * x)
+
+    @staticmethod
+    def ensembleChi2(ert, fs, realizations):
+        """
+        Yields (column_index, steps, chi2) for every observation vector,
+        where column_index is the position of the vector among the
+        observations, steps the active report steps and chi2 an array with
+        the chi2 of every realization in @realizations at those steps, with
+        shape (len(steps), len(realizations)).
+
+        The summary data of a key is loaded once for the whole ensemble,
+        and shared by all the observations of that key.
+        """
+        summary_vectors = OrderedDict()
+        for column_index, obs_vector in enumerate(ert.getObservations()):
+            impl_type = obs_vector.getImplementationType()
+            if impl_type == EnkfObservationImplementationType.SUMMARY_OBS:
+                summary_vectors.setdefault(obs_vector.getDataKey(), []).append(
+                    (column_index, obs_vector)
+                )
+            else:
+                steps = numpy.array(obs_vector.getStepList(), dtype=numpy.int32)
+                yield column_index, steps, obs_vector.getEnsembleChi2(fs, realizations)
+
+        for data_key, indexed_vectors in summary_vectors.items():
+            column_indices, obs_vectors = zip(*indexed_vectors)
+            num_steps = 1 + max(
+                (
+                    obs_vector.getStepList()[-1]
+                    for obs_vector in obs_vectors
+                    if len(obs_vector) > 0
+                ),
+                default=0,
+            )
+            ensemble_data = EnsemblePlotData(ert.ensembleConfig().getNode(data_key), fs)
+            values, mask = ensemble_data.getValuesAndMask(num_steps)
+            values = values[realizations]
+            mask = mask[realizations]
+            for column_index, (steps, chi2) in zip(
+                column_indices,
+                MisfitCollector._summaryChi2(
+                    obs_vectors, values, mask, fs, realizations
+                ),
+            ):
+                yield column_index, steps, chi2
+
     @staticmethod
     def loadAllMisfitData(ert, case_name):
         """
@@ -29,7 +96,16 @@ class MisfitCollector(object):
         @rtype: DataFrame
         """
         fs = ert.getEnkfFsManager().getFileSystem(case_name)
+        return MisfitCollector.loadAllMisfitDataFromFs(ert, fs)
 
+    @staticmethod
+    def loadAllMisfitDataFromFs(ert, fs):
+        """
+        As loadAllMisfitData(), for the already mounted case @fs.
+        @type ert: EnKFMain
+        @type fs: EnkfFs
+        @rtype: DataFrame
+        """
         realizations = MisfitCollector.createActiveList(ert, fs)
         misfit_keys = MisfitCollector.getAllMisfitKeys(ert, sort_keys=False)
         misfit_sum_index = len(misfit_keys) - 1
@@ -40,13 +116,12 @@ class MisfitCollector(object):
         misfit_array.fill(numpy.nan)
         misfit_array[misfit_sum_index] = 0.0
 
-        for column_index, obs_vector in enumerate(ert.getObservations()):
-
-            for realization_index, realization_number in enumerate(realizations):
-                misfit = obs_vector.getTotalChi2(fs, realization_number)
-
-                misfit_array[column_index][realization_index] = misfit
-                misfit_array[misfit_sum_index][realization_index] += misfit
+        for column_index, _, chi2 in MisfitCollector.ensembleChi2(
+            ert, fs, realizations
+        ):
+            misfit = chi2.sum(axis=0)
+            misfit_array[column_index] = misfit
+            misfit_array[misfit_sum_index] += misfit
 
         misfit_data = DataFrame(
             data=numpy.transpose(misfit_array), index=realizations, columns=misfit_keys
@@ -54,3 +129,47 @@ class MisfitCollector(object):
         misfit_data.index.name = "Realization"
 
         return misfit_data
+
+    @staticmethod
+    def loadStepMisfitData(ert, case_name):
+        """
+        The contribution of every report step to the misfit. The index is
+        (Realization, Report step) for all the steps with an active
+        observation, and the columns are the misfit keys; steps where an
+        observation is not active are NaN.
+        @type ert: EnKFMain
+        @type case_name: str
+        @rtype: DataFrame
+        """
+        fs = ert.getEnkfFsManager().getFileSystem(case_name)
+
+        realizations = MisfitCollector.createActiveList(ert, fs)
+        misfit_keys = MisfitCollector.getAllMisfitKeys(ert, sort_keys=False)
+        misfit_sum_index = len(misfit_keys) - 1
+
+        step_chi2 = list(MisfitCollector.ensembleChi2(ert, fs, realizations))
+        all_steps = numpy.unique(
+            numpy.concatenate(
+                [numpy.zeros(0, dtype=numpy.int32)]
+                + [steps for _, steps, _ in step_chi2]
+            )
+        )
+
+        misfit_array = numpy.full(
+            shape=(len(misfit_keys), len(realizations), len(all_steps)),
+            fill_value=numpy.nan,
+        )
+        misfit_array[misfit_sum_index] = 0.0
+        for column_index, steps, chi2 in step_chi2:
+            step_index = numpy.searchsorted(all_steps, steps)
+            misfit_array[column_index][:, step_index] = numpy.transpose(chi2)
+            misfit_array[misfit_sum_index][:, step_index] += numpy.transpose(chi2)
+
+        multi_index = MultiIndex.from_product(
+            [realizations, all_steps], names=["Realization", "Report step"]
+        )
+        return DataFrame(
+            data=misfit_array.reshape(len(misfit_keys), -1).T,
+            index=multi_index,
+            columns=misfit_keys,
+        )
@@ -2,6 +2,7 @@ from pandas import DataFrame, MultiIndex
 import numpy
 from res.enkf import ErtImplType, EnKFMain, EnkfFs, RealizationStateEnum
 from res.enkf.key_manager import KeyManager
+from res.enkf.export.export_cache import ExportCache
 from res.enkf.plot_data import EnsemblePlotData
 from ecl.util.util import BoolVector
 
@@ -23,46 +24,57 @@ class SummaryCollector(object):
         return key_manager.summaryKeys()
 
     @staticmethod
-    def loadAllSummaryData(ert, case_name, keys=None):
+    def loadAllSummaryData(ert, case_name, keys=None, use_cache=False):
         """
         @type ert: EnKFMain
         @type case_name: str
         @type keys: list of str
+        @type use_cache: bool
         @rtype: DataFrame
+
+        If @use_cache is True the result is read from, and stored in, the
+        ExportCache of the case.
         """
         fs = ert.getEnkfFsManager().getFileSystem(case_name)
+        return SummaryCollector.loadAllSummaryDataFromFs(ert, fs, keys, use_cache)
 
-        time_map = fs.getTimeMap()
-        dates = [time_map[index].datetime() for index in range(1, len(time_map))]
-        realizations = SummaryCollector.createActiveList(ert, fs)
-
+    @staticmethod
+    def loadAllSummaryDataFromFs(ert, fs, keys=None, use_cache=False):
+        """
+        As loadAllSummaryData(), for the already mounted case @fs.
+        @type ert: EnKFMain
+        @type fs: EnkfFs
+        @rtype: DataFrame
+        """
         summary_keys = SummaryCollector.getAllSummaryKeys(ert)
         if keys is not None:
             summary_keys = [
                 key for key in keys if key in summary_keys
             ]  # ignore keys that doesn't exist
 
+        cache = None
+        if use_cache:
+            cache = ExportCache(fs)
+            cache_args = (summary_keys, ert.getEnsembleSize())
+            summary_data = cache.load("summary", *cache_args)
+            if summary_data is not None:
+                return summary_data
+
+        time_map = fs.getTimeMap()
+        dates = [time_map[index].datetime() for index in range(1, len(time_map))]
+        realizations = SummaryCollector.createActiveList(ert, fs)
+
         summary_array = numpy.empty(
             shape=(len(summary_keys), len(realizations) * len(dates)),
             dtype=numpy.float64,
         )
-        summary_array.fill(numpy.nan)
 
         for key_index, key in enumerate(summary_keys):
             ensemble_config_node = ert.ensembleConfig().getNode(key)
             ensemble_data = EnsemblePlotData(ensemble_config_node, fs)
-            summary_row = summary_array[key_index]
-
-            for realization_index, realization_number in enumerate(realizations):
-                realization_vector = ensemble_data[realization_number]
-                column_index = realization_index * len(dates)
-
-                for index in range(1, len(realization_vector)):
-                    if realization_vector.isActive(index):
-                        # assert time_map[index] == realization_vector.getTime(index)
-                        # assert time_map[index].datetime() == dates[index - 1]
-                        value = realization_vector.getValue(index)
-                        summary_row[column_index + index - 1] = value
+            values, _ = ensemble_data.getValuesAndMask(len(time_map))
+            # Report step 0 has no summary data, hence the dates start at 1
+            summary_array[key_index] = values[realizations, 1:].ravel()
 
         multi_index = MultiIndex.from_product(
             [realizations, dates], names=["Realization", "Date"]
@@ -70,4 +82,6 @@ class SummaryCollector(object):
         summary_data = DataFrame(
             data=numpy.transpose(summary_array), index=multi_index, columns=summary_keys
         )
+        if cache is not None:
+            cache.store("summary", summary_data, *cache_args)
         return summary_data
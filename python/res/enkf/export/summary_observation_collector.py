@@ -43,19 +43,17 @@ class SummaryObservationCollector(object):
             ]  # ignore keys that doesn't exist
         columns = summary_keys
         std_columns = ["STD_%s" % key for key in summary_keys]
-        df = DataFrame(index=dates, columns=columns + std_columns)
-        for key in summary_keys:
+        data = numpy.full((len(dates), 2 * len(summary_keys)), numpy.nan)
+        for column, key in enumerate(summary_keys):
             observation_keys = ert.ensembleConfig().getNode(key).getObservationKeys()
             for obs_key in observation_keys:
-                observation_data = observations[obs_key]
-                for index in range(0, history_length + 1):
-                    if observation_data.isActive(index):
-                        obs_time = observations.getObservationTime(index).datetime()
-                        node = observation_data.getNode(index)
-                        value = node.getValue()
-                        std = node.getStandardDeviation()
-                        df[key][obs_time] = value
-                        df["STD_%s" % key][obs_time] = std
+                steps, values, std = observations[obs_key].getSummaryData()
+                # The rows are the report steps 1..history_length
+                in_range = (steps >= 1) & (steps <= history_length)
+                rows = steps[in_range] - 1
+                data[rows, column] = values[in_range]
+                data[rows, len(summary_keys) + column] = std[in_range]
+        df = DataFrame(data, index=dates, columns=columns + std_columns)
         return df
 
     @classmethod
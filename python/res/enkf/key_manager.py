@@ -50,14 +50,10 @@ class KeyManager(object):
     def summaryKeysWithObservations(self):
         """:rtype: list of str"""
         if self.__summary_keys_with_observations is None:
-            self.__summary_keys_with_observations = sorted(
-                [
-                    key
-                    for key in self.summaryKeys()
-                    if len(self.ensembleConfig().getNode(key).getObservationKeys()) > 0
-                ],
-                key=lambda k: k.lower(),
-            )
+            observed_keys = set(self._ert().getObservations().getObservedDataKeys())
+            self.__summary_keys_with_observations = [
+                key for key in self.summaryKeys() if key in observed_keys
+            ]
 
         return self.__summary_keys_with_observations
 
@@ -32,6 +32,9 @@ class LocalMinistep(BaseCClass):
     )
     _name = ResPrototype("char* local_ministep_get_name(local_ministep)")
     _data_size = ResPrototype("int local_ministep_get_num_dataset(local_ministep)")
+    _dataset_keys = ResPrototype(
+        "stringlist_obj local_ministep_alloc_dataset_keys(local_ministep)"
+    )
 
     def __init__(self, ministep_key):
         raise NotImplementedError("Class can not be instantiated directly!")
@@ -51,6 +54,10 @@ class LocalMinistep(BaseCClass):
     def __contains__(self, data_key):
         return self._has_local_data(data_key)
 
+    def keys(self):
+        """The names of the datasets in the ministep."""
+        return self._dataset_keys()
+
     def addNode(self, node):
         assert isinstance(node, LocalObsdataNode)
         self._add_node(node)
@@ -157,6 +157,10 @@ class ModelConfig(BaseCClass):
 
             # FORWARD_MODEL_KEY
             forward_model = ForwardModel(ext_joblist=joblist)
+            # MEMORY_POLL_PERIOD_KEY
+            memory_poll_period = config_dict.get(ConfigKeys.MEMORY_POLL_PERIOD)
+            if memory_poll_period is not None:
+                forward_model.memory_poll_period = memory_poll_period
             # SIMULATION_JOB_KEY
             for job_description in config_dict.get(ConfigKeys.FORWARD_MODEL, []):
                 job = forward_model.add_job(job_description[ConfigKeys.NAME])
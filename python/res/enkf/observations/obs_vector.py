@@ -13,6 +13,9 @@
 #
 #  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
 #  for more details.
+import ctypes
+
+import numpy as np
 from cwrap import BaseCClass
 from res import ResPrototype
 from res.enkf.config import EnkfConfigNode
@@ -56,6 +59,12 @@ class ObsVector(BaseCClass):
     _create_local_node = ResPrototype(
         "local_obsdata_node_obj obs_vector_alloc_local_node(obs_vector)"
     )
+    _export_summary_data = ResPrototype(
+        "void obs_vector_export_summary_data(obs_vector, int*, double*, double*)"
+    )
+    _export_chi2 = ResPrototype(
+        "void obs_vector_export_chi2(obs_vector, enkf_fs, int, int*, double*)"
+    )
 
     def __init__(self, observation_type, observation_key, config_node, num_reports):
         """
@@ -136,6 +145,29 @@ class ObsVector(BaseCClass):
                 "the firstActiveStep() method cannot be called with no active steps."
             )
 
+    def getSummaryData(self):
+        """
+        Will return the active report steps of a summary observation vector,
+        and the observed values and standard deviations at those steps, as
+        three numpy arrays.
+        """
+        impl_type = self.getImplementationType()
+        if impl_type != EnkfObservationImplementationType.SUMMARY_OBS:
+            raise TypeError(
+                "The observation %s is not a summary observation" % self.getKey()
+            )
+
+        size = len(self)
+        steps = np.zeros(size, dtype=np.int32)
+        values = np.zeros(size)
+        std = np.zeros(size)
+        self._export_summary_data(
+            steps.ctypes.data_as(ctypes.POINTER(ctypes.c_int)),
+            values.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            std.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+        )
+        return steps, values, std
+
     def getActiveCount(self):
         """@rtype: int"""
         return len(self)
@@ -187,3 +219,19 @@ class ObsVector(BaseCClass):
     def getTotalChi2(self, fs, realization_number):
         """@rtype: float"""
         return self._get_total_chi2(fs, realization_number)
+
+    def getEnsembleChi2(self, fs, realizations):
+        """
+        Will return the chi2 of the realizations in @realizations at the
+        active report steps, as a numpy array with one row for each step in
+        getStepList() and one column for each realization.
+        """
+        iens = np.ascontiguousarray(realizations, dtype=np.int32)
+        chi2 = np.zeros((len(self), len(iens)))
+        self._export_chi2(
+            fs,
+            len(iens),
+            iens.ctypes.data_as(ctypes.POINTER(ctypes.c_int)),
+            chi2.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+        )
+        return chi2
@@ -1,3 +1,6 @@
+import ctypes
+
+import numpy
 from cwrap import BaseCClass
 from res import ResPrototype
 from res.enkf.config import EnkfConfigNode
@@ -17,6 +20,9 @@ class EnsemblePlotData(BaseCClass):
         "ensemble_plot_data_vector_ref enkf_plot_data_iget(ensemble_plot_data, int)"
     )
     _free = ResPrototype("void  enkf_plot_data_free(ensemble_plot_data)")
+    _export = ResPrototype(
+        "void  enkf_plot_data_export(ensemble_plot_data, int, double*, bool*)"
+    )
 
     def __init__(
         self, ensemble_config_node, file_system=None, user_index=None, input_mask=None
@@ -50,6 +56,22 @@ class EnsemblePlotData(BaseCClass):
             yield self[cur]
             cur += 1
 
+    def getValuesAndMask(self, num_steps):
+        """
+        Returns the data of the whole ensemble as a tuple (values, mask) of
+        numpy arrays with shape (len(self), num_steps). Inactive steps are
+        False in the mask and NaN in the values.
+        @rtype: (numpy.ndarray, numpy.ndarray)
+        """
+        values = numpy.empty(shape=(len(self), num_steps), dtype=numpy.float64)
+        mask = numpy.empty(shape=(len(self), num_steps), dtype=numpy.bool_)
+        self._export(
+            num_steps,
+            values.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            mask.ctypes.data_as(ctypes.POINTER(ctypes.c_bool)),
+        )
+        return values, mask
+
     def free(self):
         self._free()
 
@@ -20,6 +20,38 @@ from cwrap import BaseCClass
 from res import ResPrototype
 
 
+def _active_cell_centers(grid):
+    """The x, y and z coordinates of the centers of all active cells, ordered
+    by active index."""
+    positions = grid.export_position(grid.export_index(active_only=True))
+    return positions[:, 0], positions[:, 1], positions[:, 2]
+
+
+def distance_taper(grid, pos, length_scale, taper=None):
+    """Tapering as a function of distance from @pos for all active cells.
+
+    The distance from the point @pos to the center of each active cell is
+    scaled with @length_scale, which can be a number or a tuple with one
+    length scale for each of the x, y and z directions. The tapering is
+    @taper(r) of the scaled distance r, by default exp(-r). The result is a
+    numpy vector which can be passed to RowScaling.assign_vector():
+
+        pos = grid.get_xyz(ijk=(10, 10, 1))
+        row_scaling.assign_vector(distance_taper(grid, pos, (500, 250, 10)))
+
+        gaussian = lambda r: numpy.exp(-0.5 * r * r)
+        row_scaling.assign_vector(distance_taper(grid, pos, 500, gaussian))
+    """
+    x, y, z = _active_cell_centers(grid)
+    lx, ly, lz = np.broadcast_to(np.asarray(length_scale, dtype=np.float64), (3,))
+    r = np.sqrt(
+        ((x - pos[0]) / lx) ** 2 + ((y - pos[1]) / ly) ** 2 + ((z - pos[2]) / lz) ** 2
+    )
+    if taper is None:
+        return np.exp(-r)
+    return np.asarray(taper(r), dtype=np.float64)
+
+
 class RowScaling(BaseCClass):
     TYPE_NAME = "row_scaling"
 
@@ -60,7 +92,7 @@ class RowScaling(BaseCClass):
     def clamp(self, value):
         return self._clamp(value)
 
-    def assign(self, target_size, func):
+    def assign(self, target_size, func, vectorized=False):
         """Assign tapering value for all elements.
 
         The assign() method is the main function used to assign a row scaling
@@ -107,11 +139,48 @@ class RowScaling(BaseCClass):
         for the size argument things will silently pass initially but might
         blow up in the subsequent update step.
 
+        Calling func once per element is slow for large fields. With
+        vectorized=True func is instead called once, with a numpy array of
+        all the indices, and should return a numpy array of the tapering
+        values. To taper based on the grid coordinates of a field use the
+        assign_grid() method, or the distance_taper() function.
+
         """
+        if vectorized:
+            scaling_vector = np.asarray(func(np.arange(target_size)), dtype=np.float64)
+            if scaling_vector.shape != (target_size,):
+                raise ValueError(
+                    f"The function returned {scaling_vector.shape} values, expected {target_size}"
+                )
+            self.assign_vector(scaling_vector)
+            return
 
         for index in range(target_size):
             self[index] = func(index)
 
+    def assign_grid(self, grid, func):
+        """Assign tapering value for all active cells of a grid.
+
+        The callable func is called once with three numpy arrays, the x, y
+        and z coordinates of the centers of all the active cells in the grid,
+        and should return a numpy array with the tapering value of each
+        active cell. The example from the assign() method becomes:
+
+            def exp_decay(pos, r0, x, y, z):
+                r = numpy.sqrt((x - pos[0])**2 + (y - pos[1])**2 + (z - pos[2])**2)
+                return numpy.exp(-r / r0)
+
+            row_scaling.assign_grid(grid, functools.partial(exp_decay, pos, r0))
+
+        """
+        x, y, z = _active_cell_centers(grid)
+        scaling_vector = np.asarray(func(x, y, z), dtype=np.float64)
+        if scaling_vector.shape != (grid.get_num_active(),):
+            raise ValueError(
+                f"The function returned {scaling_vector.shape} values, expected {grid.get_num_active()}"
+            )
+        self.assign_vector(scaling_vector)
+
     def assign_vector(self, scaling_vector):
         """Assign tapering value for all elements via a vector.
 
@@ -146,6 +215,7 @@ class RowScaling(BaseCClass):
         # implementation. This solution has been avoided has been avoided
         # because it would not be very performant.
         if isinstance(scaling_vector, np.ndarray):
+            scaling_vector = np.ascontiguousarray(scaling_vector)
             if scaling_vector.dtype == np.float64:
                 func = self._assign_double_vector
                 ptr = scaling_vector.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
@@ -1,9 +1,9 @@
 import os.path
 import os
 import sys
+import glob
 import re
 import time
-import datetime
 import socket
 from collections import namedtuple
 import subprocess
@@ -23,6 +23,45 @@ body_sub_pattern = r"(\s^\s@.+$)*"
 date_sub_pattern = r"\s+AT TIME\s+(?P<Days>\d+\.\d+)\s+DAYS\s+\((?P<Date>(.+)):\s*$"
 error_pattern = r"^\s@--  ERROR{}${}".format(date_sub_pattern, body_sub_pattern)
 
+# Seconds summary_block() waits for the summary files to become stable, and
+# the time the files must be left unchanged to be considered complete.
+SUMMARY_BLOCK_TIMEOUT = 15
+SUMMARY_SETTLE_TIME = 1.0
+SUMMARY_POLL_INTERVAL = 0.2
+
+# The PRT file of a failed simulation can be very large; it is read in
+# chunks of this size, and at most MAX_PARSED_ERRORS error messages are
+# collected from it.
+REPORT_CHUNK_SIZE = 2 ** 16
+MAX_PARSED_ERRORS = 100
+
+
+def _read_blocks_backwards(fileH, chunk_size=REPORT_CHUNK_SIZE):
+    """Yield the content of the binary file @fileH in blocks of complete
+    lines, starting with the last block of the file."""
+    fileH.seek(0, os.SEEK_END)
+    end = fileH.tell()
+    partial_line = b""
+    while end > 0:
+        start = max(0, end - chunk_size)
+        fileH.seek(start)
+        block = fileH.read(end - start) + partial_line
+        end = start
+        if start > 0:
+            newline = block.find(b"\n")
+            if newline < 0:
+                partial_line = block
+                continue
+            partial_line, block = block[: newline + 1], block[newline + 1 :]
+        yield block
+
+
+def _last_match(regexp, block):
+    match = None
+    for match in regexp.finditer(block):
+        pass
+    return match
+
 
 def make_LSB_MCPU_machine_list(LSB_MCPU_HOSTS):
     host_numcpu_list = LSB_MCPU_HOSTS.split()
@@ -327,35 +366,74 @@ class EclRun(object):
             with open(OK_file, "w") as f:
                 f.write("ECLIPSE simulation OK")
 
-    def summary_block(self):
+    def _summary_files(self):
+        """The SMSPEC file and the unified or non-unified summary data files
+        of the case, or None if they have not been written."""
         case = os.path.join(self.run_path, self.base_name)
-        start_time = datetime.datetime.now()
-        prev_len = 0
+        for smspec, unsmry, data_pattern in (
+            (".SMSPEC", ".UNSMRY", ".S[0-9][0-9][0-9][0-9]"),
+            (".FSMSPEC", ".FUNSMRY", ".A[0-9][0-9][0-9][0-9]"),
+        ):
+            if not os.path.isfile(case + smspec):
+                continue
+            if os.path.isfile(case + unsmry):
+                return [case + smspec, case + unsmry]
+            data_files = sorted(glob.glob(case + data_pattern))
+            if data_files:
+                return [case + smspec] + data_files
+        return None
+
+    def summary_block(
+        self,
+        timeout=SUMMARY_BLOCK_TIMEOUT,
+        settle_time=SUMMARY_SETTLE_TIME,
+        poll_interval=SUMMARY_POLL_INTERVAL,
+    ):
+        """Wait for the summary files to be completely written, and load them.
+
+        With MPI the summary files can still be written, or not yet be
+        visible on a network file system, when the simulator has exited. The
+        files are considered complete when their size and modification time
+        have been observed unchanged for @settle_time seconds. The interval
+        is measured with the local clock only, because the modification
+        times set by a file server can be skewed relative to it. Only then
+        is the EclSum loaded.
+
+        If no complete summary is found within @timeout seconds None is
+        returned. This either implies that something is completely broken,
+        or that this is a NOSIM simulation; due to the possibility of NOSIM
+        no error is signalled.
+        """
+        case = os.path.join(self.run_path, self.base_name)
+        deadline = time.monotonic() + timeout
+        prev_signature = None
+        unchanged_since = None
         while True:
-            dt = datetime.datetime.now() - start_time
-            if dt.total_seconds() > 15:
-                # We have not got a stable summary file after 15 seconds of waiting,
-                # this eitther implies that something is completely broken or this is
-                # a NOSIM simulation. Due the possibility of NOSIM solution we just return
-                # here without signalling an error.
+            stats = None
+            files = self._summary_files()
+            if files is not None:
+                try:
+                    stats = [os.stat(f) for f in files]
+                except OSError:
+                    pass
+
+            if stats is not None:
+                now = time.monotonic()
+                signature = [(st.st_size, st.st_mtime_ns) for st in stats]
+                if signature != prev_signature:
+                    prev_signature = signature
+                    unchanged_since = now
+                if now - unchanged_since >= settle_time:
+                    try:
+                        return EclSum(case)
+                    except (IOError, OSError, ValueError):
+                        # Not loadable although unchanged, wait for it to be
+                        # modified again.
+                        prev_signature = None
+
+            if time.monotonic() >= deadline:
                 return None
-
-            time.sleep(1)
-
-            try:
-                ecl_sum = EclSum(case)
-            except:
-                continue
-
-            this_len = len(ecl_sum)
-            if prev_len == 0:
-                prev_len = this_len
-                continue
-
-            if prev_len == this_len:
-                break
-
-        return ecl_sum
+            time.sleep(poll_interval)
 
     def assertECLEND(self):
         result = self.readECLEND()
@@ -372,43 +450,65 @@ class EclRun(object):
             raise Exception("Eclipse simulation failed with:%d bugs" % result.bugs)
 
     def readECLEND(self):
-        error_regexp = re.compile(r"^\s*Errors\s+(\d+)\s*$")
-        bug_regexp = re.compile(r"^\s*Bugs\s+(\d+)\s*$")
+        """Read the number of errors and bugs from the summary at the end of
+        the ECLEND file, or the PRT file if there is no ECLEND file. The file
+        is searched from the end, so only the tail of a large PRT file is
+        read."""
+        error_regexp = re.compile(rb"^[ \t]*Errors[ \t]+(\d+)\s*$", re.MULTILINE)
+        bug_regexp = re.compile(rb"^[ \t]*Bugs[ \t]+(\d+)\s*$", re.MULTILINE)
 
         report_file = os.path.join(self.run_path, "{}.ECLEND".format(self.base_name))
         if not os.path.isfile(report_file):
             report_file = os.path.join(self.run_path, "{}.PRT".format(self.base_name))
 
-        with open(report_file, "r") as fileH:
-            for line in fileH.readlines():
-                error_match = re.match(error_regexp, line)
-                if error_match:
-                    errors = int(error_match.group(1))
-
-                bug_match = re.match(bug_regexp, line)
-                if bug_match:
-                    bugs = int(bug_match.group(1))
-
+        errors = bugs = None
+        with open(report_file, "rb") as fileH:
+            for block in _read_blocks_backwards(fileH):
+                if errors is None:
+                    error_match = _last_match(error_regexp, block)
+                    if error_match:
+                        errors = int(error_match.group(1))
+
+                if bugs is None:
+                    bug_match = _last_match(bug_regexp, block)
+                    if bug_match:
+                        bugs = int(bug_match.group(1))
+
+                if errors is not None and bugs is not None:
+                    break
+
+        if errors is None or bugs is None:
+            raise ValueError(
+                "Could not find the number of errors and bugs in:{}".format(report_file)
+            )
         return EclipseResult(errors=errors, bugs=bugs)
 
-    def parseErrors(self):
+    def parseErrors(self, max_errors=MAX_PARSED_ERRORS):
+        """Return the first @max_errors error messages in the PRT file. The
+        file is scanned line by line, so it is never read into memory."""
         prt_file = os.path.join(self.runPath(), "%s.PRT" % self.baseName())
         error_list = []
-        error_regexp = re.compile(error_pattern, re.MULTILINE)
-        with open(prt_file) as f:
-            content = f.read()
-
-        offset = 0
-        while True:
-            match = error_regexp.search(content[offset:])
-            if match:
-                error_list.append(
-                    content[offset + match.start() : offset + match.end()]
-                )
-                offset += match.end()
-            else:
-                break
-
+        header_regexp = re.compile(r"\s@--  ERROR{}".format(date_sub_pattern))
+        body_regexp = re.compile(r"\s@.+$")
+
+        error_lines = None
+        with open(prt_file, errors="replace") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if error_lines is not None:
+                    if body_regexp.match(line):
+                        error_lines.append(line)
+                        continue
+                    error_list.append("\n".join(error_lines))
+                    error_lines = None
+                    if len(error_list) >= max_errors:
+                        return error_list
+
+                if header_regexp.match(line):
+                    error_lines = [line]
+
+        if error_lines is not None:
+            error_list.append("\n".join(error_lines))
         return error_list
 
     @classmethod
@@ -55,6 +55,9 @@ class Driver(BaseCClass):
     _get_status = ResPrototype(
         "job_status_type_enum queue_driver_get_status(driver, job)"
     )
+    _update_status_list = ResPrototype(
+        "void job_queue_node_update_status_list( driver , void* , int )"
+    )
     _kill_job = ResPrototype("void queue_driver_kill_job( driver , job )")
     _get_max_running = ResPrototype("int queue_driver_get_max_running( driver )")
     _set_max_running = ResPrototype("void queue_driver_set_max_running( driver , int)")
@@ -94,6 +97,12 @@ class Driver(BaseCClass):
     def get_status(self, job):
         return self._get_status(job)
 
+    def update_status(self, jobs):
+        """Update the status of the JobQueueNodes in @jobs with one status
+        query to the driver."""
+        nodes = (ctypes.c_void_p * len(jobs))(*[job._address() for job in jobs])
+        self._update_status_list(nodes, len(jobs))
+
     def kill_job(self, job):
         self._kill_job(job)
 
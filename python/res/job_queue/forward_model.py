@@ -33,6 +33,12 @@ class ForwardModel(BaseCClass):
     )
     _iget_job = ResPrototype("ext_job_ref forward_model_iget_job( forward_model, int)")
     _get_length = ResPrototype("int forward_model_get_length(forward_model)")
+    _set_memory_poll_period = ResPrototype(
+        "void forward_model_set_memory_poll_period(forward_model, double)"
+    )
+    _get_memory_poll_period = ResPrototype(
+        "double forward_model_get_memory_poll_period(forward_model)"
+    )
     _formatted_fprintf = ResPrototype(
         "void forward_model_formatted_fprintf(forward_model, char*, char*, char*, subst_list, int, env_varlist)"
     )
@@ -65,6 +71,16 @@ class ForwardModel(BaseCClass):
     def clear(self):
         self._clear()
 
+    @property
+    def memory_poll_period(self):
+        """Seconds between the resource usage samples the job runner takes
+        of the jobs, or 0 for the job runner's default."""
+        return self._get_memory_poll_period()
+
+    @memory_poll_period.setter
+    def memory_poll_period(self, memory_poll_period):
+        self._set_memory_poll_period(memory_poll_period)
+
     def free(self):
         self._free()
 
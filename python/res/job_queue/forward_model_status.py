@@ -49,6 +49,10 @@ class ForwardModelJobStatus(object):
         std_err_file="",
         current_memory_usage=0,
         max_memory_usage=0,
+        max_pss_memory_usage=None,
+        cpu_seconds=None,
+        read_bytes=None,
+        write_bytes=None,
     ):
 
         self.start_time = start_time
@@ -60,6 +64,10 @@ class ForwardModelJobStatus(object):
         self.std_err_file = std_err_file
         self.current_memory_usage = current_memory_usage
         self.max_memory_usage = max_memory_usage
+        self.max_pss_memory_usage = max_pss_memory_usage
+        self.cpu_seconds = cpu_seconds
+        self.read_bytes = read_bytes
+        self.write_bytes = write_bytes
 
     @classmethod
     def load(cls, job, data, run_path):
@@ -82,6 +90,10 @@ class ForwardModelJobStatus(object):
             std_err_file=os.path.join(run_path, std_err_file),
             current_memory_usage=current_memory_usage,
             max_memory_usage=max_memory_usage,
+            max_pss_memory_usage=data.get("max_pss_memory_usage"),
+            cpu_seconds=data.get("cpu_seconds"),
+            read_bytes=data.get("read_bytes"),
+            write_bytes=data.get("write_bytes"),
         )
 
     def __str__(self):
@@ -100,6 +112,10 @@ class ForwardModelJobStatus(object):
             "stderr": self.std_err_file,
             "current_memory_usage": self.current_memory_usage,
             "max_memory_usage": self.max_memory_usage,
+            "max_pss_memory_usage": self.max_pss_memory_usage,
+            "cpu_seconds": self.cpu_seconds,
+            "read_bytes": self.read_bytes,
+            "write_bytes": self.write_bytes,
         }
 
 
@@ -132,6 +148,9 @@ class ForwardModelStatus(object):
 
     @classmethod
     def load(cls, path, num_retry=10):
+        # The job runner now replaces status.json atomically, but files
+        # written by older versions can still be read half-written. Use
+        # num_retry=1 to return immediately if the file can not be loaded.
         sleep_time = 0.10
         attempt = 0
 
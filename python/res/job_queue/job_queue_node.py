@@ -66,6 +66,7 @@ class JobQueueNode(BaseCClass):
         self._thread_status = ThreadStatus.READY
         self._thread = None
         self._mutex = Lock()
+        self._on_status_change = None
 
         self.run_path = run_path
         self._max_runtime = max_runtime
@@ -117,6 +118,7 @@ class JobQueueNode(BaseCClass):
             self._set_status(JobStatusType.JOB_QUEUE_SUCCESS)
         else:
             self._set_status(JobStatusType.JOB_QUEUE_EXIT)
+        self._notify_status_change()
 
         return callback_status
 
@@ -146,28 +148,37 @@ class JobQueueNode(BaseCClass):
             self._max_runtime is not None and self.runtime >= self._max_runtime
         )
 
-    def _job_monitor(self, driver, pool_sema, max_submit):
-
+    def _submit_job(self, driver):
         self.submit(driver)
         self.update_status(driver)
+        self._notify_status_change()
 
-        while self.is_running():
+    def _update_start_time(self):
+        if self._start_time is None and self.status == JobStatusType.JOB_QUEUE_RUNNING:
+            self._start_time = time.time()
+
+    def _poll_status(self, driver):
+        """Update the status of a submitted job once, and kill it if required."""
+        previous_status = self.status
+        self.update_status(driver)
+        self._handle_status_update(driver, previous_status)
+
+    def _handle_status_update(self, driver, previous_status):
+        """Notify about a change from @previous_status after the status of the
+        job has been updated, and kill the job if required."""
+        if self.status != previous_status:
+            self._notify_status_change()
+        if self._should_be_killed():
+            self._kill(driver)
             if (
-                self._start_time is None
-                and self.status == JobStatusType.JOB_QUEUE_RUNNING
+                self._max_runtime
+                and self.runtime >= self._max_runtime
+                and self.callback_timeout
             ):
-                self._start_time = time.time()
-            time.sleep(1)
-            self.update_status(driver)
-            if self._should_be_killed():
-                self._kill(driver)
-                if (
-                    self._max_runtime
-                    and self.runtime >= self._max_runtime
-                    and self.callback_timeout
-                ):
-                    self.callback_timeout(self.callback_arguments)
+                self.callback_timeout(self.callback_arguments)
 
+    def _finalize(self, pool_sema, max_submit):
+        """Run the done/exit callbacks of a job which is no longer running."""
         self._end_time = time.time()
 
         with self._mutex:
@@ -183,6 +194,7 @@ class JobQueueNode(BaseCClass):
                     return
                 else:
                     self._set_status(JobStatusType.JOB_QUEUE_FAILED)
+                    self._notify_status_change()
                     self.run_exit_callback()
             elif self.status == JobStatusType.JOB_QUEUE_IS_KILLED:
                 pass
@@ -196,16 +208,43 @@ class JobQueueNode(BaseCClass):
 
             self._set_thread_status(ThreadStatus.DONE)
 
-    def run(self, driver, pool_sema, max_submit=2):
+    def _job_monitor(self, driver, pool_sema, max_submit):
+        self._submit_job(driver)
+
+        while self.is_running():
+            self._update_start_time()
+            time.sleep(1)
+            self._poll_status(driver)
+
+        self._finalize(pool_sema, max_submit)
+
+    def _prepare_run(self, on_status_change=None):
+        """Mark the job as running; returns False if it should not be started."""
         # Prevent multiple threads working on the same object
         self.wait_for()
+        self._on_status_change = on_status_change
         # Do not start if already kill signal is sent
         if self.thread_status == ThreadStatus.STOPPING:
             self._set_thread_status(ThreadStatus.DONE)
-            return
+            return False
 
         self._set_thread_status(ThreadStatus.RUNNING)
         self._start_time = None
+        return True
+
+    def run(self, driver, pool_sema, max_submit=2, on_status_change=None):
+        """Start monitoring the job in a separate thread.
+
+        If @on_status_change is given it is called, without arguments, from
+        the monitor thread whenever the job or thread status changes. The
+        queue uses this to wake up immediately instead of polling.
+
+        The queue itself monitors all its jobs from a single
+        JobQueuePoller; this method is for running a standalone job.
+        """
+        if not self._prepare_run(on_status_change):
+            return
+
         self._thread = Thread(
             target=self._job_monitor, args=(driver, pool_sema, max_submit)
         )
@@ -236,3 +275,8 @@ class JobQueueNode(BaseCClass):
 
     def _set_thread_status(self, new_status):
         self._thread_status = new_status
+        self._notify_status_change()
+
+    def _notify_status_change(self):
+        if self._on_status_change is not None:
+            self._on_status_change()
@@ -0,0 +1,137 @@
+#  Copyright (C) 2021  Equinor ASA, Norway.
+#
+#  The file 'job_queue_poller.py' is part of ERT - Ensemble based Reservoir Tool.
+#
+#  ERT is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  ERT is distributed in the hope that it will be useful, but WITHOUT ANY
+#  WARRANTY; without even the implied warranty of MERCHANTABILITY or
+#  FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  See the GNU General Public License at <http://www.gnu.org/licenses/gpl.html>
+#  for more details.
+"""
+Module implementing a single status poller for all jobs in a queue.
+
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATUS_POLL_INTERVAL = 1.0
+DEFAULT_MAX_WORKERS = 8
+
+
+class JobQueuePoller:
+    """Monitors all in-flight jobs of a queue from one thread.
+
+    Instead of one monitor thread per JobQueueNode the poller updates the
+    status of all the submitted jobs with one bulk status query to the
+    driver per tick. Drivers which cache the output of the cluster status
+    command, like LSF with its bjobs cache, will then issue one status
+    command per tick regardless of the number of jobs. Job submission and
+    the done/exit callbacks are run on two separate bounded pools of worker
+    threads, so the number of threads does not grow with the number of
+    realizations, and callbacks waiting for the internalization semaphore
+    do not hold up the submission of new jobs.
+    """
+
+    def __init__(
+        self,
+        driver,
+        pool_sema,
+        max_submit,
+        on_status_change=None,
+        interval=DEFAULT_STATUS_POLL_INTERVAL,
+        max_workers=DEFAULT_MAX_WORKERS,
+    ):
+        self._driver = driver
+        self._pool_sema = pool_sema
+        self._max_submit = max_submit
+        self._on_status_change = on_status_change
+        self._interval = interval
+
+        self._jobs = []
+        self._lock = Lock()
+        self._stop_event = Event()
+        self._submit_executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._finalize_executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._thread = Thread(target=self._run, name="JobQueuePoller", daemon=True)
+        self._thread.start()
+
+    def add(self, job):
+        """Submit @job and start monitoring it."""
+        if not job._prepare_run(self._on_status_change):
+            return
+        self._submit_executor.submit(self._submit, job)
+
+    def _submit(self, job):
+        try:
+            job._submit_job(self._driver)
+        finally:
+            with self._lock:
+                self._jobs.append(job)
+
+    def _finalize(self, job):
+        try:
+            job._finalize(self._pool_sema, self._max_submit)
+        except Exception:
+            logger.exception("Failed to finalize job %s", job.run_path)
+
+    def poll(self):
+        """Update the status of all in-flight jobs once."""
+        with self._lock:
+            jobs = list(self._jobs)
+        if not jobs:
+            return
+
+        previous_status = [job.status for job in jobs]
+        self._driver.update_status(jobs)
+
+        finished = []
+        for job, status in zip(jobs, previous_status):
+            try:
+                job._handle_status_update(self._driver, status)
+            except Exception:
+                # The job stays in flight, and is polled again next tick
+                logger.exception("Failed to poll the status of job %s", job.run_path)
+                continue
+            if job.is_running():
+                job._update_start_time()
+            else:
+                finished.append(job)
+
+        if finished:
+            with self._lock:
+                for job in finished:
+                    self._jobs.remove(job)
+            for job in finished:
+                self._finalize_executor.submit(self._finalize, job)
+
+    def _run(self):
+        while not self._stop_event.wait(self._interval):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Failed to poll the job queue")
+
+    def is_alive(self):
+        """Whether the polling thread is still running."""
+        return self._thread.is_alive()
+
+    @property
+    def num_jobs(self):
+        with self._lock:
+            return len(self._jobs)
+
+    def shutdown(self):
+        """Stop polling and wait for outstanding submissions and callbacks."""
+        self._stop_event.set()
+        self._thread.join()
+        self._submit_executor.shutdown(wait=True)
+        self._finalize_executor.shutdown(wait=True)
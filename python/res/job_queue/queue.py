@@ -24,6 +24,7 @@ import json
 import logging
 import time
 import ssl
+import threading
 import typing
 
 import websockets
@@ -33,11 +34,25 @@ from cwrap import BaseCClass
 from job_runner import JOBS_FILE, CERT_FILE
 from res import ResPrototype
 from res.job_queue import JobQueueNode, JobStatusType, ThreadStatus
+from res.job_queue.job_queue_poller import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_STATUS_POLL_INTERVAL,
+    JobQueuePoller,
+)
 
 logger = logging.getLogger(__name__)
 
 LONG_RUNNING_FACTOR = 1.25
 
+# The queue loop wakes up as soon as a job changes status; when nothing
+# happens it falls back to polling with this interval (in seconds) so that
+# the queue evaluators are still invoked regularly.
+DEFAULT_POLL_INTERVAL = 1.0
+
+# When publishing queue state changes in batches, at most this many events
+# are sent in one websocket frame.
+DEFAULT_EVENT_BATCH_SIZE = 500
+
 
 _FM_STEP_FAILURE = "com.equinor.ert.forward_model_step.failure"
 _FM_STEP_PENDING = "com.equinor.ert.forward_model_step.pending"
@@ -139,7 +154,15 @@ class JobQueue(BaseCClass):
         cnt = "%s, num_running=%d, num_complete=%d, num_waiting=%d, num_pending=%d, active=%d"
         return self._create_repr(cnt % (isrun, nrun, ncom, nwait, npend, len(self)))
 
-    def __init__(self, driver, max_submit=2, size=0):
+    def __init__(
+        self,
+        driver,
+        max_submit=2,
+        size=0,
+        poll_interval=DEFAULT_POLL_INTERVAL,
+        status_poll_interval=DEFAULT_STATUS_POLL_INTERVAL,
+        max_workers=DEFAULT_MAX_WORKERS,
+    ):
         """
         Short doc...
         The @max_submit argument says how many times the job be submitted (including a failure)
@@ -157,6 +180,13 @@ class JobQueue(BaseCClass):
                 and will continue until this number of jobs have completed
                 - it is not necessary to call the submit_complete() method
                 in this case.
+        The @poll_interval argument is the longest time, in seconds, the
+        queue loop will sleep when no job changes status.
+
+        While the queue is executing, the status of all running jobs is
+        polled from the driver every @status_poll_interval seconds by a
+        single poller thread; job submission and the done/exit callbacks
+        run on separate pools of at most @max_workers threads each.
         """
 
         OK_file = "OK"
@@ -173,6 +203,14 @@ class JobQueue(BaseCClass):
         self._qindex_to_iens = {}
         self._state = []
 
+        self.poll_interval = poll_interval
+        self.status_poll_interval = status_poll_interval
+        self.max_workers = max_workers
+        self._poller = None
+        self._changes_event = threading.Event()
+        self._async_changes_event = None
+        self._loop = None
+
     def kill_job(self, queue_index):
         """
         Will kill job nr @index.
@@ -327,6 +365,7 @@ class JobQueue(BaseCClass):
 
     def kill_all_jobs(self):
         self._stopped = True
+        self._notify_changes()
 
     @property
     def queue_size(self):
@@ -369,13 +408,37 @@ class JobQueue(BaseCClass):
         for job in self.job_list:
             job.stop()
         while self.is_active():
-            time.sleep(1)
+            self._wait_for_changes()
 
     async def stop_jobs_async(self):
         for job in self.job_list:
             job.stop()
         while self.is_active():
-            await asyncio.sleep(1)
+            await self._wait_for_changes_async()
+
+    def _notify_changes(self):
+        """Wake up the queue loop; called from the job monitor threads."""
+        self._changes_event.set()
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._async_changes_event.set)
+            except RuntimeError:
+                # The event loop has been closed.
+                pass
+
+    def _wait_for_changes(self):
+        self._changes_event.wait(self.poll_interval)
+        self._changes_event.clear()
+
+    async def _wait_for_changes_async(self):
+        try:
+            await asyncio.wait_for(
+                self._async_changes_event.wait(), timeout=self.poll_interval
+            )
+        except asyncio.TimeoutError:
+            pass
+        self._async_changes_event.clear()
 
     def assert_complete(self):
         for job in self.job_list:
@@ -389,17 +452,48 @@ class JobQueue(BaseCClass):
             job = self.fetch_next_waiting()
             if job is None:
                 break
-            job.run(
-                driver=self.driver,
-                pool_sema=pool_sema,
-                max_submit=self.max_submit,
-            )
+            if self._poller is not None:
+                self._poller.add(job)
+            else:
+                job.run(
+                    driver=self.driver,
+                    pool_sema=pool_sema,
+                    max_submit=self.max_submit,
+                    on_status_change=self._notify_changes,
+                )
+
+    def _start_poller(self, pool_sema):
+        self._poller = JobQueuePoller(
+            self.driver,
+            pool_sema,
+            self.max_submit,
+            on_status_change=self._notify_changes,
+            interval=self.status_poll_interval,
+            max_workers=self.max_workers,
+        )
+
+    def _check_poller(self):
+        if self._poller is not None and not self._poller.is_alive():
+            raise RuntimeError("The job status poller has stopped unexpectedly")
+
+    def _stop_poller(self):
+        if self._poller is not None:
+            self._poller.shutdown()
+            self._poller = None
 
     def execute_queue(self, pool_sema, evaluators):
+        self._start_poller(pool_sema)
+        try:
+            self._execute_queue(pool_sema, evaluators)
+        finally:
+            self._stop_poller()
+
+    def _execute_queue(self, pool_sema, evaluators):
         while self.is_active() and not self.stopped:
             self.launch_jobs(pool_sema)
 
-            time.sleep(1)
+            self._wait_for_changes()
+            self._check_poller()
 
             if evaluators is not None:
                 for func in evaluators:
@@ -426,17 +520,51 @@ class JobQueue(BaseCClass):
         )
 
     @staticmethod
-    async def _publish_changes(ee_id, changes, websocket):
+    def _to_json_batch(events):
+        """Serialize @events as a CloudEvents JSON batch, i.e. a JSON array
+        of structured events."""
+        return b"[" + b",".join(to_json(event) for event in events) + b"]"
+
+    @staticmethod
+    async def _publish_changes(ee_id, changes, websocket, batch_size=None):
+        """Send one CloudEvent per change, or if @batch_size is given, send
+        the changes as JSON batches of at most @batch_size events."""
         events = [
             JobQueue._translate_change_to_cloudevent(ee_id, real_id, status)
             for real_id, status in changes.items()
         ]
-        for event in events:
-            await websocket.send(to_json(event))
+        if batch_size is None:
+            for event in events:
+                await websocket.send(to_json(event))
+            return
+
+        for start in range(0, len(events), batch_size):
+            await websocket.send(
+                JobQueue._to_json_batch(events[start : start + batch_size])
+            )
 
     async def execute_queue_async(
-        self, ws_uri, ee_id, pool_sema, evaluators, cert=None, token=None
+        self,
+        ws_uri,
+        ee_id,
+        pool_sema,
+        evaluators,
+        cert=None,
+        token=None,
+        batch_events=False,
+        max_batch_size=DEFAULT_EVENT_BATCH_SIZE,
+        flush_interval=0.0,
     ):
+        """Run the queue and publish the state changes of the realizations
+        to the websocket at @ws_uri.
+
+        By default every change is sent as a separate CloudEvent. With
+        @batch_events the changes are sent as CloudEvents JSON batches of at
+        most @max_batch_size events. Changes are collected for at least
+        @flush_interval seconds, only the latest state of each realization
+        is sent, before a batch is published, unless @max_batch_size changes
+        have accumulated.
+        """
         if cert is not None:
             ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
             ssl_context.load_verify_locations(cadata=cert)
@@ -445,24 +573,71 @@ class JobQueue(BaseCClass):
         headers = Headers()
         if token is not None:
             headers["token"] = token
+        self._async_changes_event = asyncio.Event()
+        self._loop = asyncio.get_event_loop()
+        self._start_poller(pool_sema)
+        try:
+            await self._execute_queue_async(
+                ws_uri,
+                ee_id,
+                pool_sema,
+                evaluators,
+                ssl_context,
+                headers,
+                max_batch_size if batch_events else None,
+                flush_interval,
+            )
+        finally:
+            self._stop_poller()
+            self._loop = None
+
+    async def _execute_queue_async(
+        self,
+        ws_uri,
+        ee_id,
+        pool_sema,
+        evaluators,
+        ssl_context,
+        headers,
+        batch_size,
+        flush_interval,
+    ):
+        pending_changes = {}
+        last_flush = time.monotonic()
+
         async with websockets.connect(
             ws_uri, ssl=ssl_context, extra_headers=headers
         ) as websocket:
-            await JobQueue._publish_changes(ee_id, self.snapshot(), websocket)
+            await JobQueue._publish_changes(
+                ee_id, self.snapshot(), websocket, batch_size
+            )
 
             try:
                 while self.is_active() and not self.stopped:
                     self.launch_jobs(pool_sema)
 
-                    await asyncio.sleep(1)
+                    await self._wait_for_changes_async()
+                    self._check_poller()
 
                     if evaluators is not None:
                         for func in evaluators:
                             func()
 
-                    await JobQueue._publish_changes(
-                        ee_id, self._changes_after_transition(), websocket
-                    )
+                    changes = self._changes_after_transition()
+                    if batch_size is None:
+                        await JobQueue._publish_changes(ee_id, changes, websocket)
+                        continue
+
+                    pending_changes.update(changes)
+                    if pending_changes and (
+                        len(pending_changes) >= batch_size
+                        or time.monotonic() - last_flush >= flush_interval
+                    ):
+                        await JobQueue._publish_changes(
+                            ee_id, pending_changes, websocket, batch_size
+                        )
+                        pending_changes = {}
+                        last_flush = time.monotonic()
             except asyncio.CancelledError:
                 if self.stopped:
                     logger.debug(
@@ -478,7 +653,10 @@ class JobQueue(BaseCClass):
                 logger.debug("jobs now stopped")
             self.assert_complete()
             self._transition()
-            await JobQueue._publish_changes(ee_id, self.snapshot(), websocket)
+            # The final snapshot supersedes any pending batched changes.
+            await JobQueue._publish_changes(
+                ee_id, self.snapshot(), websocket, batch_size
+            )
 
     def add_job_from_run_arg(self, run_arg, res_config, max_runtime, ok_cb, exit_cb):
         job_name = run_arg.job_name
@@ -26,6 +26,9 @@
 # general linear algebra in Python the numpy library is a natural
 # choice.
 
+import ctypes
+
+import numpy as np
 
 from cwrap import BaseCClass, CFILE
 from res import ResPrototype
@@ -33,6 +36,9 @@ from res import ResPrototype
 
 class Matrix(BaseCClass):
     _matrix_alloc = ResPrototype("void*  matrix_alloc(int, int )", bind=False)
+    _matrix_alloc_wrapper = ResPrototype(
+        "matrix_obj  matrix_alloc_wrapper(int, int, double*)", bind=False
+    )
     _matrix_alloc_identity = ResPrototype(
         "matrix_obj  matrix_alloc_identity( int )", bind=False
     )
@@ -53,6 +59,9 @@ class Matrix(BaseCClass):
     )
     _rows = ResPrototype("int matrix_get_rows(matrix)")
     _columns = ResPrototype("int matrix_get_columns(matrix)")
+    _row_stride = ResPrototype("int matrix_get_row_stride(matrix)")
+    _column_stride = ResPrototype("int matrix_get_column_stride(matrix)")
+    _get_data = ResPrototype("void* matrix_get_data(matrix)")
     _equal = ResPrototype("bool matrix_equal(matrix, matrix)")
     _pretty_print = ResPrototype("void matrix_pretty_print(matrix, char*, char*)")
     _fprint = ResPrototype("void matrix_fprintf(matrix, char*, FILE)")
@@ -86,6 +95,61 @@ class Matrix(BaseCClass):
         super(Matrix, self).__init__(c_ptr)
         self.setAll(value)
 
+    @classmethod
+    def fromNumpy(cls, array):
+        """
+        Will return a matrix which wraps the storage of the two dimensional
+        numpy array @array, i.e. the matrix and the array share the same
+        data. A one dimensional array is wrapped as a single column.
+
+        The storage is only shared if the array already has dtype float64
+        and column-major (Fortran) order, which is the layout of the C
+        matrix; otherwise the matrix wraps a column-major copy of the
+        array. The matrix keeps the array alive, and can not be resized.
+        """
+        array = np.asarray(array)
+        if array.ndim == 1:
+            array = array.reshape(-1, 1)
+        if array.ndim != 2:
+            raise ValueError(
+                "Expected a one or two dimensional array, got %d dimensions"
+                % array.ndim
+            )
+        if array.size == 0:
+            raise ValueError("Can not wrap an empty array")
+
+        array = np.asfortranarray(array, dtype=np.float64)
+        rows, columns = array.shape
+        matrix = cls._matrix_alloc_wrapper(
+            rows, columns, array.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+        )
+        matrix._array = array
+        return matrix
+
+    def numpyView(self):
+        """
+        Will return a numpy array sharing storage with the matrix, i.e.
+        changes to the array are seen by the matrix and vice versa. The
+        array keeps the matrix alive, but it is invalidated if the storage
+        of the matrix is reallocated, as in an inplace transpose.
+        @rtype: numpy.ndarray
+        """
+        rows, columns = self.dims()
+        row_stride = self._row_stride()
+        column_stride = self._column_stride()
+        size = (rows - 1) * row_stride + (columns - 1) * column_stride + 1
+
+        buffer_type = ctypes.c_double * size
+        data = buffer_type.from_address(self._get_data())
+        data._matrix = self
+        itemsize = ctypes.sizeof(ctypes.c_double)
+        return np.ndarray(
+            shape=(rows, columns),
+            dtype=np.float64,
+            buffer=data,
+            strides=(row_stride * itemsize, column_stride * itemsize),
+        )
+
     def copy(self):
         return self._copy()
 
@@ -18,6 +18,8 @@ try:
 except ImportError:
     from collections import Sequence
 
+import numpy
+
 from cwrap import PrototypeError
 from res import ResPrototype
 from ecl import EclPrototype
@@ -32,12 +34,18 @@ except PrototypeError:
     _polyfit = None
 
 
+def _as_matrix(values):
+    if isinstance(values, Matrix):
+        return values
+    return Matrix.fromNumpy(numpy.fromiter(values, dtype=numpy.float64))
+
+
 def polyfit(n, x, y, s=None):
     """
     @type n: int
-    @type x: Matrix or Sequence or DoubleVector
-    @type y: Matrix or Sequence or DoubleVector
-    @type s: Matrix or Sequence or DoubleVector or None
+    @type x: Matrix or numpy.ndarray or Sequence or DoubleVector
+    @type y: Matrix or numpy.ndarray or Sequence or DoubleVector
+    @type s: Matrix or numpy.ndarray or Sequence or DoubleVector or None
     @return: tuple
     """
     if _polyfit is None:
@@ -45,29 +53,9 @@ def polyfit(n, x, y, s=None):
             "Sorry - your ert distribution has been built without lapack support"
         )
 
-    if isinstance(x, Matrix):
-        xm = x
-    else:
-        xm = Matrix(len(x), 1)
-        for i in range(len(x)):
-            xm[i, 0] = x[i]
-
-    if isinstance(y, Matrix):
-        ym = y
-    else:
-        ym = Matrix(len(y), 1)
-        for i in range(len(y)):
-            ym[i, 0] = y[i]
-
-    if s:
-        if isinstance(s, Matrix):
-            sm = s
-        else:
-            sm = Matrix(len(s), 1)
-            for i in range(len(s)):
-                sm[i, 0] = s[i]
-    else:
-        sm = s
+    xm = _as_matrix(x)
+    ym = _as_matrix(y)
+    sm = None if s is None else _as_matrix(s)
 
     beta = Matrix(n, 1)
     res = _polyfit(beta, xm, ym, sm)
@@ -75,8 +63,4 @@ def polyfit(n, x, y, s=None):
     if not res == LLSQResultEnum.LLSQ_SUCCESS:
         raise Exception("Linear Least Squares Estimator failed?")
 
-    l = []
-    for i in range(n):
-        l.append(beta[i, 0])
-
-    return tuple(l)
+    return tuple(beta.numpyView()[:, 0])
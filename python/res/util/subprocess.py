@@ -16,32 +16,83 @@
 
 
 import os
+import selectors
 
+# Bytes read from the process per system call, and the amount of output
+# collected from a stream before it is written to the output files.
+_READ_SIZE = 2 ** 16
+_BUFFER_SIZE = 2 ** 20
 
-def await_process_tee(process, *out_files):
+
+def _write_all(fd, bytes_):
+    view = memoryview(bytes_)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def await_process_tee(process, *out_files, err_files=None):
     """Wait for process to finish, "tee"-ing the subprocess' stdout into all the
     given file objects.
 
-    NB: We aren't checking if `os.write` succeeds. It succeeds if its return
-    value matches `len(bytes_)`. In other cases we might want to do something
-    smart, such as retry or raise an error. At the time of writing it is
-    uncertain what we should do, and it is assumed that data loss is acceptable.
+    If the process was started with stderr=PIPE its stderr is also tee-ed,
+    into @err_files if given and otherwise into the same files as stdout.
+
+    The pipes are monitored with select/poll, so no CPU is used while
+    waiting for output, and output arriving in small pieces is collected
+    and written to the files in larger blocks. When all the pipes are
+    closed we block in process.wait().
+
+    NB: Errors writing to the output files are not handled; data loss is
+    assumed to be acceptable.
 
     """
+    for f in out_files + tuple(err_files or ()):
+        f.flush()
+
     out_fds = [f.fileno() for f in out_files]
-    process_fd = process.stdout.fileno()
-
-    while True:
-        while True:
-            bytes_ = os.read(process_fd, 4096)
-            if bytes_ == b"":  # check EOF
-                break
-            for fd in out_fds:
-                os.write(fd, bytes_)
-
-        # Check if process terminated
-        if process.poll() is not None:
-            break
-    process.stdout.close()
-
-    return process.returncode
+    targets = {}
+    pipes = []
+    if process.stdout is not None:
+        targets[process.stdout.fileno()] = out_fds
+        pipes.append(process.stdout)
+    if process.stderr is not None:
+        err_fds = out_fds if err_files is None else [f.fileno() for f in err_files]
+        targets[process.stderr.fileno()] = err_fds
+        pipes.append(process.stderr)
+
+    pending = {process_fd: bytearray() for process_fd in targets}
+
+    def flush(process_fd):
+        if pending[process_fd]:
+            for fd in targets[process_fd]:
+                _write_all(fd, pending[process_fd])
+            pending[process_fd].clear()
+
+    with selectors.DefaultSelector() as selector:
+        for process_fd in targets:
+            selector.register(process_fd, selectors.EVENT_READ)
+
+        while selector.get_map():
+            # Only wait for more output when everything read has been
+            # written, otherwise write as soon as the pipes are drained.
+            timeout = 0 if any(pending.values()) else None
+            events = selector.select(timeout)
+            if not events:
+                for process_fd in pending:
+                    flush(process_fd)
+                continue
+
+            for key, _ in events:
+                bytes_ = os.read(key.fd, _READ_SIZE)
+                if bytes_ == b"":  # check EOF
+                    selector.unregister(key.fd)
+                    flush(key.fd)
+                    continue
+                pending[key.fd] += bytes_
+                if len(pending[key.fd]) >= _BUFFER_SIZE:
+                    flush(key.fd)
+
+    for pipe in pipes:
+        pipe.close()
+
+    return process.wait()
@@ -1,6 +1,9 @@
+import collections
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy
 import pandas
 import sys
 
@@ -10,8 +13,8 @@ except ImportError:
   from PyQt5.QtWidgets import QCheckBox
 
 
-from res.enkf import ErtPlugin, CancelPluginException
-from res.enkf.export import SummaryCollector, GenKwCollector, MisfitCollector, DesignMatrixReader
+from res.enkf import ErtPlugin, CancelPluginException, EnkfFsManager
+from res.enkf.export import SummaryCollector, GenKwCollector, MisfitCollector, DesignMatrixReader, ExportWriter
 from ert_gui.ertwidgets.customdialog import CustomDialog
 from ert_gui.ertwidgets.listeditbox import ListEditBox
 from ert_gui.ertwidgets.models.path_model import PathModel
@@ -24,7 +27,12 @@ class CSVExportJob(ErtPlugin):
 
     The script expects a single argument:
 
-    output_file: this is the path to the file to output the CSV data to
+    output_file: this is the path to the file to output the CSV data to. If the
+                 extension is .parquet or .feather the data is written in that
+                 format instead, which requires pyarrow
+
+    The cases are loaded in parallel, and each case is written to the output as
+    soon as it is loaded, so only a few cases are kept in memory at a time.
 
     Optional arguments:
 
@@ -92,55 +100,86 @@ class CSVExportJob(ErtPlugin):
             if not os.path.isfile(design_matrix_path):
                 raise UserWarning("The design matrix is not a file!")
 
-        data = pandas.DataFrame()
-
-        for index, case in enumerate(cases):
-            case = case.strip()
-
-            if not self.ert().getEnkfFsManager().caseExists(case):
+        fs_manager = self.ert().getEnkfFsManager()
+        cases = [case.strip() for case in cases]
+        for case in cases:
+            if not fs_manager.caseExists(case):
                 raise UserWarning("The case '%s' does not exist!" % case)
 
-            if not self.ert().getEnkfFsManager().caseHasData(case):
+            if not fs_manager.caseHasData(case):
                 raise UserWarning("The case '%s' does not have any data!" % case)
 
-            if infer_iteration:
-                iteration_number = self.inferIterationNumber(case)
-            else:
-                iteration_number = index
-
-            case_data = GenKwCollector.loadAllGenKwData(self.ert(), case)
-
-            if design_matrix_path is not None:
-                design_matrix_data = DesignMatrixReader.loadDesignMatrix(design_matrix_path)
-                if not design_matrix_data.empty:
-                    case_data = case_data.join(design_matrix_data, how='outer')
-
-            misfit_data = MisfitCollector.loadAllMisfitData(self.ert(), case)
-            if not misfit_data.empty:
-                case_data = case_data.join(misfit_data, how='outer')
-
-            summary_data = SummaryCollector.loadAllSummaryData(self.ert(), case)
-            if not summary_data.empty:
-                case_data = case_data.join(summary_data, how='outer')
-            else:
-                case_data["Date"] = None
-                case_data.set_index(["Date"], append=True, inplace=True)
-
-            case_data["Iteration"] = iteration_number
-            case_data["Case"] = case
-            case_data.set_index(["Case", "Iteration"], append=True, inplace=True)
-
-            data = pandas.concat([data, case_data])
-
-        data = data.reorder_levels(["Realization", "Iteration", "Date", "Case"])
-        if drop_const_cols:
-            data = data.loc[:, (data != data.iloc[0]).any()]
-        
-        data.to_csv(output_file)
-
-        export_info = "Exported %d rows and %d columns to %s." % (len(data.index), len(data.columns), output_file)
+        design_matrix_data = None
+        if design_matrix_path is not None:
+            design_matrix_data = DesignMatrixReader.loadDesignMatrix(design_matrix_path)
+
+        # The cases are mounted from this thread, and the loaders are given
+        # the EnkfFs so they never touch the fs manager. The pending queue
+        # holds a reference to every case in flight, which keeps it mounted
+        # even if the fs manager drops it.
+        num_workers = max(1, min(os.cpu_count() or 1, EnkfFsManager.DEFAULT_CAPACITY))
+        pending = collections.deque()
+        columns, dtypes = self.exportColumns(design_matrix_data)
+        with ExportWriter(output_file, drop_const_cols=drop_const_cols, columns=columns, dtypes=dtypes) as writer, \
+             ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for index, case in enumerate(cases):
+                if infer_iteration:
+                    iteration_number = self.inferIterationNumber(case)
+                else:
+                    iteration_number = index
+
+                if len(pending) == num_workers:
+                    writer.write(pending.popleft()[0].result())
+
+                fs = fs_manager.getFileSystem(case)
+                future = executor.submit(self.loadCaseData, case, fs, iteration_number, design_matrix_data)
+                pending.append((future, fs))
+
+            while pending:
+                writer.write(pending.popleft()[0].result())
+
+        num_columns = 0 if writer.columns is None else len(writer.columns)
+        export_info = "Exported %d rows and %d columns to %s." % (writer.numRows, num_columns, output_file)
         return export_info
 
+    def exportColumns(self, design_matrix_data=None):
+        """
+        The columns of the export, in the order loadCaseData() joins them,
+        and the types of the index levels and the columns which are not
+        float64.
+        """
+        dtypes = {"Realization": numpy.int64, "Iteration": numpy.int64, "Date": "datetime64[ns]", "Case": object}
+        columns = list(GenKwCollector.getAllGenKwKeys(self.ert()))
+        if design_matrix_data is not None and not design_matrix_data.empty:
+            columns += list(design_matrix_data.columns)
+            dtypes.update(design_matrix_data.dtypes.items())
+        columns += MisfitCollector.getAllMisfitKeys(self.ert(), sort_keys=False)
+        columns += SummaryCollector.getAllSummaryKeys(self.ert())
+        return columns, dtypes
+
+    def loadCaseData(self, case, fs, iteration_number, design_matrix_data=None):
+        case_data = GenKwCollector.loadAllGenKwDataFromFs(self.ert(), fs)
+
+        if design_matrix_data is not None and not design_matrix_data.empty:
+            case_data = case_data.join(design_matrix_data, how='outer')
+
+        misfit_data = MisfitCollector.loadAllMisfitDataFromFs(self.ert(), fs)
+        if not misfit_data.empty:
+            case_data = case_data.join(misfit_data, how='outer')
+
+        summary_data = SummaryCollector.loadAllSummaryDataFromFs(self.ert(), fs)
+        if not summary_data.empty:
+            case_data = case_data.join(summary_data, how='outer')
+        else:
+            case_data["Date"] = None
+            case_data.set_index(["Date"], append=True, inplace=True)
+
+        case_data["Iteration"] = iteration_number
+        case_data["Case"] = case
+        case_data.set_index(["Case", "Iteration"], append=True, inplace=True)
+
+        return case_data.reorder_levels(["Realization", "Iteration", "Date", "Case"])
+
 
     def getArguments(self, parent=None):
         description = "The CSV export requires some information before it starts:"
@@ -0,0 +1,81 @@
+import asyncio
+
+from job_runner.util.client import Client
+
+from tests.utils import _mock_ws_thread
+
+
+def test_buffered_send(unused_tcp_port):
+    host = "localhost"
+    url = f"ws://{host}:{unused_tcp_port}"
+    messages = []
+    with _mock_ws_thread(host, unused_tcp_port, messages):
+        with Client(url, buffered=True) as client:
+            for i in range(100):
+                client.send(str(i))
+
+    assert messages == [str(i) for i in range(100)]
+
+
+def test_spilled_messages_are_sent_by_next_client(unused_tcp_port, tmpdir):
+    host = "localhost"
+    url = f"ws://{host}:{unused_tcp_port}"
+    spill_path = str(tmpdir / "spill")
+
+    # Nothing is listening, so all messages end up in the spill file.
+    with Client(
+        url,
+        buffered=True,
+        max_buffer_size=2,
+        spill_path=spill_path,
+        close_timeout=0.5,
+    ) as client:
+        for i in range(5):
+            client.send(str(i))
+    with open(spill_path) as f:
+        assert len(f.readlines()) == 5
+
+    messages = []
+    with _mock_ws_thread(host, unused_tcp_port, messages):
+        with Client(
+            url, buffered=True, max_buffer_size=2, spill_path=spill_path
+        ) as client:
+            client.send("5")
+
+    assert messages == [str(i) for i in range(6)]
+    assert not (tmpdir / "spill").exists()
+
+
+def test_buffered_send_async(unused_tcp_port):
+    host = "localhost"
+    url = f"ws://{host}:{unused_tcp_port}"
+    messages = []
+
+    async def _send_all(client):
+        async with client:
+            for i in range(100):
+                await client.send_async(str(i))
+
+    with _mock_ws_thread(host, unused_tcp_port, messages):
+        client = Client(url, buffered=True)
+        sender_thread = client._sender_thread
+        asyncio.run(_send_all(client))
+        assert not sender_thread.is_alive()
+
+    assert messages == [str(i) for i in range(100)]
+
+
+def test_send_async(unused_tcp_port):
+    host = "localhost"
+    url = f"ws://{host}:{unused_tcp_port}"
+    messages = []
+
+    async def _send_all():
+        async with Client(url) as client:
+            for i in range(10):
+                await client.send_async(str(i))
+
+    with _mock_ws_thread(host, unused_tcp_port, messages):
+        asyncio.run(_send_all())
+
+    assert messages == [str(i) for i in range(10)]
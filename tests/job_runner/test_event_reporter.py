@@ -140,3 +140,69 @@ def test_report_with_failed_finish_message_argument(unused_tcp_port):
         reporter.report(Finish().with_error("massive_failure"))
 
     assert len(lines) == 1
+
+
+def test_report_coalesces_running_messages(unused_tcp_port):
+    host = "localhost"
+    url = f"ws://{host}:{unused_tcp_port}"
+    reporter = Event(evaluator_url=url)
+    job1 = Job({"name": "job1", "stdout": "stdout", "stderr": "stderr"}, 0)
+
+    lines = []
+    with _mock_ws_thread(host, unused_tcp_port, lines):
+        reporter.report(Init([job1], 1, 19, ee_id="ee_id", real_id=0, step_id=0))
+        reporter.report(Start(job1))
+        for memory in range(1, 1001):
+            reporter.report(Running(job1, memory, memory))
+        reporter.report(Exited(job1, 0))
+        reporter.report(Finish())
+
+    events = [json.loads(line) for line in lines]
+    assert events[0]["type"] == _FM_JOB_START
+    assert events[-1]["type"] == _FM_JOB_SUCCESS
+    running = events[1:-1]
+    assert 1 <= len(running) <= 1000
+    assert all(event["type"] == _FM_JOB_RUNNING for event in running)
+    assert running[-1]["data"]["current_memory_usage"] == 1000
+
+
+def test_report_never_drops_state_changes():
+    reporter = Event(evaluator_url="ws://localhost:0", max_queue_size=2)
+    jobs = [
+        Job({"name": f"job{i}", "stdout": "stdout", "stderr": "stderr"}, i)
+        for i in range(3)
+    ]
+    for job in jobs:
+        reporter._job_handler(Start(job))
+        reporter._job_handler(Running(job, 100, 10))
+        reporter._job_handler(Running(job, 200, 20))
+        reporter._job_handler(Exited(job, 0))
+
+    events = [slot[0] for slot in reporter._event_queue]
+    assert [event["type"] for event in events] == [
+        _FM_JOB_START,
+        _FM_JOB_RUNNING,
+        _FM_JOB_SUCCESS,
+        _FM_JOB_START,
+        _FM_JOB_SUCCESS,
+        _FM_JOB_START,
+        _FM_JOB_SUCCESS,
+    ]
+    assert events[1].data["current_memory_usage"] == 20
+
+
+def test_report_with_batched_events(unused_tcp_port):
+    host = "localhost"
+    url = f"ws://{host}:{unused_tcp_port}"
+    reporter = Event(evaluator_url=url, batch_events=True)
+    job1 = Job({"name": "job1", "stdout": "stdout", "stderr": "stderr"}, 0)
+
+    lines = []
+    with _mock_ws_thread(host, unused_tcp_port, lines):
+        reporter.report(Init([job1], 1, 19, ee_id="ee_id", real_id=0, step_id=0))
+        reporter.report(Start(job1))
+        reporter.report(Exited(job1, 0))
+        reporter.report(Finish())
+
+    events = [event for line in lines for event in json.loads(line)]
+    assert [event["type"] for event in events] == [_FM_JOB_START, _FM_JOB_SUCCESS]
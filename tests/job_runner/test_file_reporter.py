@@ -1,3 +1,4 @@
+import json
 import os
 import os.path
 from unittest import TestCase
@@ -170,6 +171,31 @@ class FileReporterTests(TestCase):
                 "status.json missing current_memory_usage",
             )
 
+    @tmpdir(None)
+    def test_running_updates_are_throttled(self):
+        job1 = Job({"name": "job1"}, 0)
+        self.reporter.report(Init([job1], 1, 19))
+
+        self.reporter.report(Running(job1, 100, 10))
+        with open(self.reporter.STATUS_json) as f:
+            self.assertEqual(json.load(f)["jobs"][0]["status"], "Waiting")
+
+        self.reporter.report(Exited(job1, 0))
+        with open(self.reporter.STATUS_json) as f:
+            status = json.load(f)["jobs"][0]
+        self.assertEqual(status["status"], "Success")
+        self.assertEqual(status["max_memory_usage"], 100)
+        self.assertEqual(
+            sorted(os.listdir(".")),
+            sorted([self.reporter.STATUS_file, self.reporter.STATUS_json]),
+        )
+
+        reporter = File(sync_disc_timeout=0, running_update_interval=0)
+        reporter.report(Init([job1], 1, 19))
+        reporter.report(Running(job1, 200, 20))
+        with open(reporter.STATUS_json) as f:
+            self.assertEqual(json.load(f)["jobs"][0]["max_memory_usage"], 200)
+
     @tmpdir(None)
     def test_report_with_successful_finish_message_argument(self):
         msg = Finish()
@@ -6,7 +6,7 @@ from tests.utils import tmpdir
 from job_runner.reporting.message import Exited, Running, Start
 from job_runner.job import Job
 
-from unittest.mock import patch, PropertyMock
+from unittest.mock import MagicMock, patch, PropertyMock
 
 
 class JobTests(TestCase):
@@ -21,6 +21,15 @@ class JobTests(TestCase):
         type(mock_process.return_value.memory_info.return_value).rss = PropertyMock(
             return_value=10
         )
+        type(
+            mock_process.return_value.memory_full_info.return_value
+        ).pss = PropertyMock(return_value=5)
+        mock_process.return_value.cpu_times.return_value = MagicMock(
+            user=1.0, system=0.5
+        )
+        mock_process.return_value.io_counters.return_value = MagicMock(
+            read_bytes=0, write_bytes=0
+        )
         mock_process.return_value.wait.return_value = 9
 
         run = job.run()
@@ -34,6 +43,53 @@ class JobTests(TestCase):
         with self.assertRaises(StopIteration):
             next(run)
 
+    @tmpdir(None)
+    def test_memory_usage_includes_child_processes(self):
+        child = "import time; data = b'x' * (100 * 2 ** 20); time.sleep(2)"
+        parent = (
+            "import subprocess, sys; "
+            "subprocess.check_call([sys.executable, '-c', {!r}])".format(child)
+        )
+        job = Job(
+            {
+                "name": "process_tree",
+                "executable": sys.executable,
+                "argList": ["-c", parent],
+            },
+            0,
+            memory_poll_period=0.1,
+        )
+
+        statuses = list(job.run())
+
+        running = [status for status in statuses if isinstance(status, Running)]
+        self.assertGreater(
+            max(status.max_memory_usage for status in running), 100 * 2 ** 20
+        )
+        exited = statuses[-1]
+        self.assertIsInstance(exited, Exited)
+        self.assertEqual(exited.exit_code, 0)
+        self.assertGreaterEqual(exited.usage.max_rss, 100 * 2 ** 20)
+        self.assertGreater(exited.usage.cpu_seconds, 0)
+
+    @tmpdir(None)
+    def test_exited_usage_covers_time_after_last_sample(self):
+        # With a long poll period the only sample is taken at the start
+        busy = "import time\nwhile time.process_time() < 0.5: pass"
+        job = Job(
+            {
+                "name": "busy",
+                "executable": sys.executable,
+                "argList": ["-c", busy],
+            },
+            0,
+            memory_poll_period=30,
+        )
+
+        exited = list(job.run())[-1]
+        self.assertIsInstance(exited, Exited)
+        self.assertGreaterEqual(exited.usage.cpu_seconds, 0.5)
+
     @tmpdir(None)
     def test_run_fails_using_exit_bash_builtin(self):
         job = Job(
@@ -0,0 +1,90 @@
+import os
+from pandas.testing import assert_frame_equal
+from pytest import MonkeyPatch
+
+from tests import ResTest
+from res.test import ErtTestContext
+
+from res.enkf import RealizationStateEnum
+from res.enkf.export import (
+    ExportCache,
+    GenDataCollector,
+    GenKwCollector,
+    SummaryCollector,
+)
+
+
+class ExportCacheTest(ResTest):
+    def setUp(self):
+        self.monkeypatch = MonkeyPatch()
+        self.monkeypatch.setenv(
+            "TZ", "CET"
+        )  # The ert_statoil case was generated in CET
+        self.config = self.createTestPath("local/snake_oil/snake_oil.ert")
+
+    def tearDown(self):
+        self.monkeypatch.undo()
+
+    def test_cached_frames_are_equal(self):
+        with ErtTestContext("python/enkf/export/export_cache", self.config) as context:
+            ert = context.getErt()
+            fs = ert.getEnkfFsManager().getFileSystem("default_0")
+            cache = ExportCache(fs)
+
+            loaders = [
+                lambda: SummaryCollector.loadAllSummaryData(
+                    ert, "default_0", use_cache=True
+                ),
+                lambda: GenKwCollector.loadAllGenKwData(
+                    ert, "default_0", use_cache=True
+                ),
+                lambda: GenDataCollector.loadGenData(
+                    ert, "default_0", "SNAKE_OIL_OPR_DIFF", 199, use_cache=True
+                ),
+            ]
+            for loader in loaders:
+                data = loader()
+                cached = loader()
+                assert_frame_equal(data, cached)
+
+            self.assertEqual(len(os.listdir(cache.path)), len(loaders))
+
+    def test_cache_invalidated_by_state_map(self):
+        with ErtTestContext(
+            "python/enkf/export/export_cache_invalidate", self.config
+        ) as context:
+            ert = context.getErt()
+            fs = ert.getEnkfFsManager().getFileSystem("default_0")
+
+            data = GenKwCollector.loadAllGenKwData(ert, "default_0", use_cache=True)
+            cache = ExportCache(fs)
+            gen_kw_keys = GenKwCollector.getAllGenKwKeys(ert)
+            cache_args = GenKwCollector._cacheArgs(ert, gen_kw_keys)
+            self.assertIsNotNone(cache.load("gen_kw", *cache_args))
+
+            state_map = fs.getStateMap()
+            state_map[0] = RealizationStateEnum.STATE_LOAD_FAILURE
+            self.assertIsNone(ExportCache(fs).load("gen_kw", *cache_args))
+
+            data = GenKwCollector.loadAllGenKwData(ert, "default_0", use_cache=True)
+            self.assertNotIn(0, data.index)
+
+            ExportCache(fs).clear()
+            self.assertEqual(os.listdir(cache.path), [])
+
+    def test_cache_keyed_by_resolved_keys(self):
+        with ErtTestContext(
+            "python/enkf/export/export_cache_keys", self.config
+        ) as context:
+            ert = context.getErt()
+            fs = ert.getEnkfFsManager().getFileSystem("default_0")
+            summary_keys = SummaryCollector.getAllSummaryKeys(ert)
+
+            SummaryCollector.loadAllSummaryData(ert, "default_0", use_cache=True)
+            cache = ExportCache(fs)
+            size = ert.getEnsembleSize()
+            self.assertIsNotNone(cache.load("summary", summary_keys, size))
+            # A configuration with fewer keys, or another ensemble size,
+            # does not see the entry
+            self.assertIsNone(cache.load("summary", summary_keys[:1], size))
+            self.assertIsNone(cache.load("summary", summary_keys, size + 1))
@@ -0,0 +1,129 @@
+import os
+
+import numpy
+import pandas
+import pytest
+from pandas.testing import assert_frame_equal
+
+from tests import ResTest
+from tests.utils import tmpdir
+
+from res.enkf.export import ExportWriter
+
+
+def _case_frame(case, realizations):
+    index = pandas.MultiIndex.from_product(
+        [realizations, [case]], names=["Realization", "Case"]
+    )
+    return pandas.DataFrame(
+        {
+            "PARAM": numpy.arange(len(index), dtype=numpy.float64),
+            "CONST": 1.0,
+            "NAME": "x",
+        },
+        index=index,
+    )
+
+
+class ExportWriterTest(ResTest):
+    def test_format_from_path(self):
+        self.assertEqual(ExportWriter.formatFromPath("output.csv"), "csv")
+        self.assertEqual(ExportWriter.formatFromPath("output"), "csv")
+        self.assertEqual(ExportWriter.formatFromPath("out/data.PARQUET"), "parquet")
+        self.assertEqual(ExportWriter.formatFromPath("data.feather"), "feather")
+
+        with self.assertRaises(ValueError):
+            ExportWriter("output.csv", output_format="xlsx")
+
+    @tmpdir()
+    def test_write_csv_blocks(self):
+        frames = [_case_frame("a", [0, 1, 2]), _case_frame("b", [0, 1])]
+        with ExportWriter("output.csv") as writer:
+            for frame in frames:
+                writer.write(frame)
+            writer.write(frames[0].iloc[:0])
+
+        self.assertEqual(writer.numRows, 5)
+        self.assertEqual(list(writer.columns), ["PARAM", "CONST", "NAME"])
+
+        expected = pandas.concat(frames)
+        expected.to_csv("expected.csv")
+        with open("output.csv") as output, open("expected.csv") as reference:
+            self.assertEqual(output.read(), reference.read())
+
+    @tmpdir()
+    def test_columns_given_up_front(self):
+        first = _case_frame("a", [0])[["PARAM"]]
+        second = _case_frame("b", [0])[["NAME", "PARAM"]]
+        second["EXTRA"] = 7.0
+        with ExportWriter("output.csv", columns=["PARAM", "NAME", "EXTRA"]) as writer:
+            writer.write(first)
+            self.assertTrue(os.path.isfile("output.csv"))
+            writer.write(second)
+
+        self.assertEqual(list(writer.columns), ["PARAM", "NAME", "EXTRA"])
+        expected = pandas.concat([first, second])
+        expected.to_csv("expected.csv")
+        with open("output.csv") as output, open("expected.csv") as reference:
+            self.assertEqual(output.read(), reference.read())
+
+    @tmpdir()
+    def test_unknown_column(self):
+        with self.assertRaises(ValueError):
+            with ExportWriter("output.csv") as writer:
+                writer.write(_case_frame("a", [0])[["PARAM"]])
+                writer.write(_case_frame("b", [0]))
+
+    @tmpdir()
+    def test_drop_const_cols_with_missing_values(self):
+        first = _case_frame("a", [0, 1])[["PARAM", "CONST"]]
+        second = _case_frame("b", [0, 1])
+        with ExportWriter(
+            "output.csv", drop_const_cols=True, columns=["PARAM", "CONST", "NAME"]
+        ) as writer:
+            writer.write(first)
+            writer.write(second)
+
+        # NAME is constant where present, but missing from the first block
+        self.assertEqual(list(writer.columns), ["PARAM", "NAME"])
+        data = pandas.read_csv("output.csv", index_col=[0, 1])
+        self.assertEqual(data["NAME"].isnull().tolist(), [True, True, False, False])
+
+    @tmpdir()
+    def test_drop_const_cols(self):
+        os.mkdir("out")
+        with ExportWriter("out/output.csv", drop_const_cols=True) as writer:
+            writer.write(_case_frame("a", [0, 1]))
+            writer.write(_case_frame("b", [0, 1]))
+            spool_dir = writer._spool_dir
+            self.assertEqual(os.path.dirname(spool_dir), os.path.abspath("out"))
+
+        self.assertFalse(os.path.exists(spool_dir))
+        self.assertEqual(os.listdir("out"), ["output.csv"])
+        self.assertEqual(list(writer.columns), ["PARAM"])
+        data = pandas.read_csv("out/output.csv", index_col=[0, 1])
+        self.assertEqual(list(data.columns), ["PARAM"])
+        self.assertEqual(data["PARAM"].tolist(), [0.0, 1.0, 0.0, 1.0])
+
+    @tmpdir()
+    def test_empty_export(self):
+        with ExportWriter("output.csv") as writer:
+            pass
+        self.assertTrue(os.path.isfile("output.csv"))
+        self.assertEqual(writer.numRows, 0)
+
+    @tmpdir()
+    def test_write_arrow_formats(self):
+        pytest.importorskip("pyarrow")
+        frames = [_case_frame("a", [0, 1, 2]), _case_frame("b", [0, 1])]
+        expected = pandas.concat(frames).reset_index()
+
+        for path, read in [
+            ("output.parquet", pandas.read_parquet),
+            ("output.feather", pandas.read_feather),
+        ]:
+            dtypes = {"Realization": numpy.int64, "Case": object, "NAME": object}
+            with ExportWriter(path, dtypes=dtypes) as writer:
+                for frame in frames:
+                    writer.write(frame)
+            assert_frame_equal(read(path), expected)
@@ -1,6 +1,8 @@
 from tests import ResTest
 from res.test import ErtTestContext
 
+from res.enkf import EnkfNode, NodeId
+from res.enkf.data.summary import Summary
 from res.enkf.export import MisfitCollector
 
 
@@ -25,3 +27,60 @@ class MisfitCollectorTest(ResTest):
 
             with self.assertRaises(KeyError):
                 realization_60 = data.loc[60]
+
+    def test_misfit_matches_total_chi2(self):
+        with ErtTestContext(
+            "python/enkf/export/misfit_collector_chi2", self.config
+        ) as context:
+            ert = context.getErt()
+            fs = ert.getEnkfFsManager().getFileSystem("default_0")
+            data = MisfitCollector.loadAllMisfitData(ert, "default_0")
+
+            for obs_vector in ert.getObservations():
+                key = "MISFIT:%s" % obs_vector.getObservationKey()
+                for iens in [0, 13, 24]:
+                    self.assertAlmostEqual(
+                        data[key][iens], obs_vector.getTotalChi2(fs, iens)
+                    )
+
+    def test_step_misfit(self):
+        with ErtTestContext(
+            "python/enkf/export/misfit_collector_steps", self.config
+        ) as context:
+            ert = context.getErt()
+            data = MisfitCollector.loadAllMisfitData(ert, "default_0")
+            step_data = MisfitCollector.loadStepMisfitData(ert, "default_0")
+
+            self.assertEqual(step_data.index.names, ["Realization", "Report step"])
+            self.assertEqual(list(step_data.columns), list(data.columns))
+            self.assertEqual(
+                step_data["MISFIT:WOPR_OP1_108"].dropna().index.tolist(),
+                [(iens, 108) for iens in data.index],
+            )
+
+            summed = step_data.groupby(level="Realization").sum()
+            for key in data.columns:
+                for iens in data.index:
+                    self.assertAlmostEqual(summed[key][iens], data[key][iens])
+
+    def test_misfit_with_hole_in_summary_vector(self):
+        with ErtTestContext(
+            "python/enkf/export/misfit_collector_hole", self.config
+        ) as context:
+            ert = context.getErt()
+            fs = ert.getEnkfFsManager().getFileSystem("default_0")
+            obs_vector = ert.getObservations()["FOPR"]
+            step = obs_vector.getStepList()[0]
+
+            # Store the undefined value at an observed step of realization 0
+            node = EnkfNode(ert.ensembleConfig().getNode("FOPR"))
+            node_id = NodeId(step, 0)
+            node.load(fs, node_id)
+            node.as_summary()[step] = Summary._get_undef_value()
+            node.save(fs, node_id)
+
+            data = MisfitCollector.loadAllMisfitData(ert, "default_0")
+            for iens in [0, 13]:
+                self.assertAlmostEqual(
+                    data["MISFIT:FOPR"][iens], obs_vector.getTotalChi2(fs, iens)
+                )
@@ -4,6 +4,7 @@ from pytest import MonkeyPatch
 from tests import ResTest
 from res.test import ErtTestContext
 from res.enkf.export import SummaryCollector
+from res.enkf.plot_data import EnsemblePlotData
 
 
 class SummaryCollectorTest(ResTest):
@@ -45,3 +46,24 @@ class SummaryCollectorTest(ResTest):
 
             with self.assertRaises(KeyError):
                 data["FOPR"]
+
+    def test_ensemble_values_match_vectors(self):
+        with ErtTestContext(
+            "python/enkf/export/summary_collector_values", self.config
+        ) as context:
+            ert = context.getErt()
+            fs = ert.getEnkfFsManager().getFileSystem("default_0")
+            node = ert.ensembleConfig().getNode("FOPR")
+            ensemble_data = EnsemblePlotData(node, fs)
+            num_steps = len(fs.getTimeMap())
+
+            values, mask = ensemble_data.getValuesAndMask(num_steps)
+            self.assertEqual(values.shape, (len(ensemble_data), num_steps))
+            self.assertEqual(mask.shape, (len(ensemble_data), num_steps))
+
+            for iens in (0, 24):
+                vector = ensemble_data[iens]
+                for step in range(len(vector)):
+                    self.assertEqual(mask[iens][step], vector.isActive(step))
+                    if vector.isActive(step):
+                        self.assertEqual(values[iens][step], vector.getValue(step))
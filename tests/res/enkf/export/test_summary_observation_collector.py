@@ -64,6 +64,26 @@ class SummaryObservationCollectorTest(ResTest):
             with self.assertRaises(KeyError):
                 data["FOPR"]
 
+    def test_obs_vector_summary_data(self):
+        with ErtTestContext(
+            "python/enkf/export/obs_vector_summary_data", self.config
+        ) as context:
+            observations = context.getErt().getObservations()
+
+            obs_vector = observations["WOPR_OP1_108"]
+            steps, values, std = obs_vector.getSummaryData()
+            self.assertEqual(steps.tolist(), list(obs_vector.getStepList()))
+            node = obs_vector.getNode(steps[0])
+            self.assertEqual(values.tolist(), [node.getValue()])
+            self.assertEqual(std.tolist(), [node.getStandardDeviation()])
+
+            steps, values, std = observations["FOPR"].getSummaryData()
+            self.assertEqual(len(steps), len(observations["FOPR"]))
+            self.assertEqual(len(values), len(std))
+
+            with self.assertRaises(TypeError):
+                observations["WPR_DIFF_1"].getSummaryData()
+
 
 test_data_root = Path(source_root()) / "test-data" / "local"
 
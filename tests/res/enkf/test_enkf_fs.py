@@ -1,4 +1,5 @@
 import os
+import numpy
 import pytest
 
 from ecl.util.test import TestAreaContext
@@ -8,7 +9,8 @@ from res.test import ErtTestContext
 
 from res.enkf import EnkfFs
 from res.enkf import EnKFMain
-from res.enkf.enums import EnKFFSType
+from res.enkf.enums import EnKFFSType, EnkfVarType
+from res.enkf.plot_data import EnsemblePlotData
 
 
 @pytest.mark.equinor_test
@@ -53,3 +55,39 @@ class EnKFFSTest(ResTest):
     def test_throws(self):
         with self.assertRaises(Exception):
             fs = EnkfFs("/does/not/exist")
+
+
+class EnKFFSViewTest(ResTest):
+    def setUp(self):
+        self.config_file = self.createTestPath("local/snake_oil/snake_oil.ert")
+        self.mount_point = "storage/snake_oil/ensemble/default_0"
+
+    def test_summary_view(self):
+        with ErtTestContext("enkf_fs_view", self.config_file) as context:
+            ert = context.getErt()
+            fs = ert.getEnkfFsManager().getFileSystem("default_0")
+            ensemble_data = EnsemblePlotData(ert.ensembleConfig().getNode("FOPR"), fs)
+
+            mmap_fs = EnkfFs(self.mount_point, read_only=True, use_mmap=True)
+            self.assertTrue(mmap_fs.isReadOnly())
+            view = mmap_fs.summaryView("FOPR", 0)
+            self.assertFalse(view.flags.writeable)
+
+            values, mask = ensemble_data.getValuesAndMask(len(view))
+            numpy.testing.assert_array_equal(view[mask[0]], values[0][mask[0]])
+
+            self.assertIsNone(mmap_fs.summaryView("NO_SUCH_KEY", 0))
+            param_view = mmap_fs.nodeView(
+                "SNAKE_OIL_PARAM", EnkfVarType.PARAMETER, 0, 0
+            )
+            self.assertGreater(len(param_view), 0)
+
+            # The view keeps the filesystem mounted
+            del mmap_fs
+            numpy.testing.assert_array_equal(view[mask[0]], values[0][mask[0]])
+
+            read_only_fs = EnkfFs(self.mount_point, read_only=True)
+            self.assertIsNone(read_only_fs.summaryView("FOPR", 0))
+
+            with self.assertRaises(ValueError):
+                EnkfFs(self.mount_point, use_mmap=True)
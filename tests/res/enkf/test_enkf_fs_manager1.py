@@ -1,4 +1,5 @@
 import os
+from pandas.testing import assert_frame_equal
 from res.test import ErtTestContext
 from tests import ResTest
 from tests.utils import tmpdir
@@ -6,6 +7,7 @@ from tests.utils import tmpdir
 from res.enkf import EnkfFs
 from res.enkf import EnKFMain
 from res.enkf import EnkfFsManager
+from res.enkf.export import GenKwCollector
 
 
 class EnKFFSManagerTest1(ResTest):
@@ -44,3 +46,66 @@ class EnKFFSManagerTest1(ResTest):
             self.assertTrue(fsm.caseExists("newFS"))
             self.assertFalse(fsm.caseHasData("newFS"))
             self.assertFalse(fsm.isCaseRunning("newFS"))
+
+    @tmpdir()
+    def test_create_sharded(self):
+        with ErtTestContext(
+            "enkf_fs_manager_create_sharded_test", self.config_file
+        ) as testContext:
+            ert = testContext.getErt()
+            fsm = ert.getEnkfFsManager()
+            ensemble_size = fsm.getEnsembleSize()
+
+            self.assertEqual(32, fsm.getFileSystem("default_0").numShards())
+
+            fs = fsm.getFileSystem("sharded", num_shards=ensemble_size)
+            self.assertEqual(ensemble_size, fs.numShards())
+
+            # The number of shards is kept in the case
+            fsm.umount()
+            fs = fsm.getFileSystem("sharded")
+            self.assertEqual(ensemble_size, fs.numShards())
+
+            with self.assertRaises(ValueError):
+                EnkfFs.createFileSystem("invalid", num_shards=0)
+
+    @tmpdir()
+    def test_compact_case(self):
+        with ErtTestContext(
+            "enkf_fs_manager_compact_test", self.config_file
+        ) as testContext:
+            ert = testContext.getErt()
+            fsm = ert.getEnkfFsManager()
+            data = GenKwCollector.loadAllGenKwData(ert, "default_0")
+
+            result = fsm.compactCase("default_0")
+            self.assertGreaterEqual(result.bytes_reclaimed, 0)
+            self.assertGreaterEqual(result.seconds, 0)
+            assert_frame_equal(data, GenKwCollector.loadAllGenKwData(ert, "default_0"))
+
+            # There is nothing left to reclaim
+            self.assertEqual(0, fsm.compactCase("default_0").bytes_reclaimed)
+
+            with self.assertRaises(KeyError):
+                fsm.compactCase("no_such_case")
+
+    @tmpdir()
+    def test_index_snapshot(self):
+        with ErtTestContext(
+            "enkf_fs_manager_index_snapshot_test", self.config_file
+        ) as testContext:
+            ert = testContext.getErt()
+            fsm = ert.getEnkfFsManager()
+            data = GenKwCollector.loadAllGenKwData(ert, "default_0")
+
+            fs = fsm.getFileSystem("default_0")
+            index_file = os.path.join(
+                fs.getMountPoint(), "Ensemble", "mod_0", "PARAMETER.index"
+            )
+            fs.fsync()
+            self.assertTrue(os.path.isfile(index_file))
+
+            fsm.umount()
+            self.assertTrue(fsm.caseHasData("default_0"))
+            self.assertFalse(fsm.isCaseMounted("default_0"))
+            assert_frame_equal(data, GenKwCollector.loadAllGenKwData(ert, "default_0"))
@@ -0,0 +1,30 @@
+from tests import ResTest
+from res.test import ErtTestContext
+
+from ecl.util.util import BoolVector
+
+
+class LoadTimingTest(ResTest):
+    def setUp(self):
+        self.config_file = self.createTestPath("local/snake_oil/snake_oil.ert")
+
+    def test_load_times_for_active_realizations(self):
+        with ErtTestContext("load_timing_test", self.config_file) as test_context:
+            ert = test_context.getErt()
+            fs = ert.getEnkfFsManager().getFileSystem("load_timing")
+
+            ens_size = ert.getEnsembleSize()
+            realisations = BoolVector(default_value=True, initial_size=ens_size)
+            realisations[2] = False
+            run_context = ert.getRunContextENSEMPLE_EXPERIMENT(fs, realisations)
+
+            for num_threads in (0, 1, 3):
+                loaded, load_times = ert.loadFromRunContextWithTiming(
+                    run_context, fs, num_threads=num_threads
+                )
+                self.assertEqual(0, loaded)
+                self.assertEqual(
+                    sorted(load_times), [i for i in range(ens_size) if i != 2]
+                )
+                for load_time in load_times.values():
+                    self.assertGreaterEqual(load_time, 0)
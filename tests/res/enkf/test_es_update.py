@@ -1,3 +1,4 @@
+import numpy as np
 from tests import ResTest
 from tests.utils import tmpdir
 from res.test import ErtTestContext
@@ -112,3 +113,77 @@ class ESUpdateTest(ResTest):
             )
             for i in non_localized_idxs:
                 self.assertEqual(sim_gen_kw[i], target_gen_kw[i])
+
+    @tmpdir()
+    def test_update_problem(self):
+        config = self.createTestPath("local/snake_oil/snake_oil.ert")
+        with ErtTestContext("update_problem_test", config) as context:
+            ert = context.getErt()
+            es_update = ESUpdate(ert)
+            fsm = ert.getEnkfFsManager()
+            sim_fs = fsm.getFileSystem("default_0")
+            target_fs = fsm.getFileSystem("target")
+
+            problem = es_update.createUpdateProblem(sim_fs)
+            ens_size = problem.ens_mask.count()
+            num_obs = problem.S.shape[0]
+            self.assertEqual(problem.S.shape, (num_obs, ens_size))
+            self.assertEqual(problem.E.shape, (num_obs, ens_size))
+            self.assertEqual(problem.R.shape, (num_obs, num_obs))
+            self.assertEqual(problem.dObs.shape, (num_obs, 2))
+            np.testing.assert_allclose(
+                problem.D, problem.dObs[:, :1] + problem.E - problem.S
+            )
+
+            self.assertEqual(list(problem.A), ["ALL_DATA"])
+            A = problem.A["ALL_DATA"]
+            self.assertEqual(A.shape[1], ens_size)
+
+            conf = ert.ensembleConfig()["SNAKE_OIL_PARAM"]
+            sim_node = EnkfNode(conf)
+            sim_node.load(sim_fs, NodeId(0, 0))
+            sim_gen_kw = sim_node.asGenKw()
+            self.assertEqual(A[: len(sim_gen_kw), 0].shape, (len(sim_gen_kw),))
+
+            problem.A["ALL_DATA"] = A + 0.25
+            es_update.saveUpdateProblem(problem, sim_fs, target_fs)
+
+            target_node = EnkfNode(conf)
+            target_node.load(target_fs, NodeId(0, 0))
+            target_gen_kw = target_node.asGenKw()
+            for index in range(len(sim_gen_kw)):
+                self.assertNotEqual(sim_gen_kw[index], target_gen_kw[index])
+
+            problem.A["ALL_DATA"] = A[1:, :]
+            with self.assertRaises(ValueError):
+                es_update.saveUpdateProblem(problem, sim_fs, target_fs)
+
+    @tmpdir()
+    def test_chunked_update(self):
+        config = self.createTestPath("local/snake_oil/snake_oil.ert")
+
+        def updated_values(row_chunk_size):
+            with ErtTestContext("chunked_update_test", config) as context:
+                ert = context.getErt()
+                ert.analysisConfig().setRowChunkSize(row_chunk_size)
+                es_update = ESUpdate(ert)
+                fsm = ert.getEnkfFsManager()
+                sim_fs = fsm.getFileSystem("default_0")
+                target_fs = fsm.getFileSystem("target")
+                run_context = ErtRunContext.ensemble_smoother_update(sim_fs, target_fs)
+                es_update.smootherUpdate(run_context)
+
+                conf = ert.ensembleConfig()["SNAKE_OIL_PARAM"]
+                values = []
+                for iens in range(ert.getEnsembleSize()):
+                    target_node = EnkfNode(conf)
+                    target_node.load(target_fs, NodeId(0, iens))
+                    values.append(list(target_node.asGenKw().items()))
+                return values
+
+        full_update = updated_values(0)
+        chunked_update = updated_values(3)
+        for full, chunked in zip(full_update, chunked_update):
+            for (key, value), (chunked_key, chunked_value) in zip(full, chunked):
+                self.assertEqual(key, chunked_key)
+                self.assertAlmostEqual(value, chunked_value)
@@ -1,3 +1,4 @@
+from res.enkf.enums import EnkfObservationImplementationType
 from res.enkf.key_manager import KeyManager
 from res.test import ErtTestContext
 
@@ -20,6 +21,26 @@ class KeyManagerTest(ResTest):
             self.assertTrue("FOPR" in key_man.summaryKeysWithObservations())
             self.assertTrue(key_man.isKeyWithObservations("FOPR"))
 
+    def test_observation_index(self):
+        with ErtTestContext("enkf_key_manager_test", self.config_file) as testContext:
+            obs = testContext.getErt().getObservations()
+
+            self.assertEqual(
+                set(obs.getObservedDataKeys()),
+                {"FOPR", "WOPR:OP1", "SNAKE_OIL_WPR_DIFF"},
+            )
+            self.assertEqual(len(obs.getDataObservationKeys("WOPR:OP1")), 6)
+            self.assertIn("WOPR_OP1_108", obs.getDataObservationKeys("WOPR:OP1"))
+            self.assertEqual(len(obs.getDataObservationKeys("FOPT")), 0)
+
+            self.assertEqual(list(obs.getMatchingKeys("FOPR")), ["FOPR"])
+            self.assertEqual(list(obs.getMatchingKeys("FOPT")), [])
+            self.assertEqual(len(obs.getMatchingKeys("WOPR_*")), 6)
+            self.assertEqual(
+                obs.getMatchingKeys("W*", EnkfObservationImplementationType.GEN_OBS),
+                ["WPR_DIFF_1"],
+            )
+
     def test_gen_data_keys(self):
         with ErtTestContext("enkf_key_manager_test", self.config_file) as testContext:
             ert = testContext.getErt()
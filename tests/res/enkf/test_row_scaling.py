@@ -16,8 +16,10 @@
 
 import pytest
 import random
+import numpy as np
 from functools import partial
 from res.enkf import RowScaling
+from res.enkf.row_scaling import distance_taper
 
 import math
 from ecl.grid import EclGridGenerator
@@ -114,3 +116,55 @@ def test_field_config():
         assert row_scaling[g] == row_scaling.clamp(
             gaussian_decay(obs_pos, length_scale, grid, g)
         )
+
+
+def test_assign_vectorized():
+    nx = 10
+    ny = 10
+    row_scaling = RowScaling()
+    row_scaling.assign(nx * ny, lambda index: index / (nx * ny), vectorized=True)
+    assert len(row_scaling) == nx * ny
+    for g in range(nx * ny):
+        assert row_scaling[g] == row_scaling.clamp(g / (nx * ny))
+
+    with pytest.raises(ValueError):
+        row_scaling.assign(nx * ny, lambda index: index[1:], vectorized=True)
+
+
+def test_assign_grid():
+    nx = 10
+    ny = 10
+    nz = 5
+    actnum = [1] * nx * ny * nz
+    actnum[0] = 0
+    actnum[3] = 0
+    actnum[10] = 0
+
+    grid = EclGridGenerator.create_rectangular((nx, ny, nz), (1, 1, 1), actnum)
+    obs_pos = grid.get_xyz(ijk=(5, 5, 1))
+    length_scale = (2, 1, 0.50)
+
+    def vectorized_gaussian(x, y, z):
+        dx = (obs_pos[0] - x) / length_scale[0]
+        dy = (obs_pos[1] - y) / length_scale[1]
+        dz = (obs_pos[2] - z) / length_scale[2]
+        return np.exp(-0.5 * (dx * dx + dy * dy + dz * dz))
+
+    row_scaling = RowScaling()
+    row_scaling.assign_grid(grid, vectorized_gaussian)
+    assert len(row_scaling) == grid.get_num_active()
+
+    taper = distance_taper(grid, obs_pos, length_scale, lambda r: np.exp(-0.5 * r * r))
+    for g in range(grid.get_num_active()):
+        expected = gaussian_decay(obs_pos, length_scale, grid, g)
+        assert row_scaling[g] == pytest.approx(row_scaling.clamp(expected))
+        assert taper[g] == pytest.approx(expected)
+
+    r0 = 3
+    taper = distance_taper(grid, obs_pos, r0)
+    for g in [0, 100, grid.get_num_active() - 1]:
+        x, y, z = grid.get_xyz(active_index=g)
+        r = math.sqrt(
+            (x - obs_pos[0]) ** 2 + (y - obs_pos[1]) ** 2 + (z - obs_pos[2]) ** 2
+        )
+        assert taper[g] == pytest.approx(math.exp(-r / r0))
@@ -28,7 +28,7 @@ from ecl.util.test import TestAreaContext
 from tests import ResTest
 from tests.utils import tmpdir
 from res.fm.ecl import *
-from res.fm.ecl.ecl_run import make_SLURM_machine_list
+from res.fm.ecl.ecl_run import make_SLURM_machine_list, error_pattern
 from subprocess import Popen, PIPE
 from subprocess import Popen, PIPE
 from distutils.spawn import find_executable
@@ -545,6 +545,48 @@ class EclRunTest(ResTest):
         self.assertEqual(error_list[0], error0)
         self.assertEqual(error_list[1], error1)
 
+    @tmpdir()
+    def test_error_parse_is_streaming(self):
+        with open("SPE1.DATA", "w") as f:
+            f.write("-- Dummy")
+        prt_file = os.path.join(
+            self.SOURCE_ROOT, "test-data/local/eclipse/parse/ERROR.PRT"
+        )
+        with open(prt_file) as f:
+            content = f.read()
+        with open("SPE1.PRT", "w") as f:
+            for _ in range(3):
+                f.write(content)
+
+        ecl_run = EclRun("SPE1.DATA", None)
+        expected = [
+            match.group(0)
+            for match in re.finditer(error_pattern, content, re.MULTILINE)
+        ]
+        self.assertEqual(len(expected), 2)
+        self.assertEqual(ecl_run.parseErrors(), expected * 3)
+        self.assertEqual(ecl_run.parseErrors(max_errors=3), expected + expected[:1])
+
+    @tmpdir()
+    def test_read_eclend_from_tail(self):
+        with open("DUMMY.DATA", "w") as f:
+            f.write("dummy")
+        with open("DUMMY.PRT", "w") as f:
+            f.write(" Errors  7\n")
+            for i in range(100000):
+                f.write(" Some output line {}\n".format(i))
+            f.write(" Errors      2\n")
+            f.write(" Bugs        1\n")
+            f.write(" Final line\n")
+
+        ecl_run = EclRun("DUMMY.DATA", None)
+        self.assertEqual(ecl_run.readECLEND(), (2, 1))
+
+        with open("DUMMY.ECLEND", "w") as f:
+            f.write(" Errors  0\n")
+        with self.assertRaises(ValueError):
+            ecl_run.readECLEND()
+
     def test_slurm_env_parsing(self):
         host_list = make_SLURM_machine_list("ws", "2")
         self.assertEqual(host_list, ["ws", "ws"])
@@ -221,6 +221,24 @@ with open("env.json", "w") as f:
         ecl_sum = ecl_run.summary_block()
         self.assertTrue(isinstance(ecl_sum, EclSum))
 
+    @tmpdir()
+    def test_summary_block_waits_for_stable_files(self):
+        refcase = os.path.join(
+            self.SOURCE_ROOT, "test-data/local/snake_oil/refcase/SNAKE_OIL_FIELD"
+        )
+        with open("SNAKE_OIL_FIELD.DATA", "w") as f:
+            f.write("-- Dummy")
+        ecl_run = EclRun("SNAKE_OIL_FIELD.DATA", None)
+        self.assertIsNone(ecl_run.summary_block(timeout=0.5))
+
+        # The files must be seen unchanged for the settle time, also when
+        # their modification time is long ago, which could be clock skew
+        for ext in [".SMSPEC", ".UNSMRY"]:
+            shutil.copy2(refcase + ext, "SNAKE_OIL_FIELD" + ext)
+        self.assertIsNone(ecl_run.summary_block(timeout=0.5, settle_time=5))
+        ecl_sum = ecl_run.summary_block(timeout=5, settle_time=0.5)
+        self.assertIsInstance(ecl_sum, EclSum)
+
     @pytest.mark.equinor_test
     @tmpdir()
     def test_check(self):
@@ -348,6 +348,20 @@ class ForwardModelFormattedPrintTest(ResTest):
 
             self.verify_json_dump([], global_args, umask, run_id)
 
+    def test_memory_poll_period(self):
+        with TestAreaContext("python/job_queue/forward_model_memory_poll_period"):
+            forward_model = self.set_up_forward_model([])
+            args = ("run_id", os.getcwd(), "data_root", SubstitutionList(), 4)
+
+            forward_model.formatted_fprintf(*args, EnvironmentVarlist())
+            with open("jobs.json") as f:
+                self.assertNotIn("memory_poll_period", json.load(f))
+
+            forward_model.memory_poll_period = 0.5
+            forward_model.formatted_fprintf(*args, EnvironmentVarlist())
+            with open("jobs.json") as f:
+                self.assertEqual(json.load(f)["memory_poll_period"], 0.5)
+
     def test_transfer_arg_types(self):
         with TestAreaContext("python/job_queue/forward_model_transfer_arg_types"):
             with open("FWD_MODEL", "w") as f:
@@ -1,8 +1,11 @@
 from res.job_queue import JobStatusType, Driver, QueueDriverEnum, JobQueue, JobQueueNode
+from res.job_queue.job_queue_poller import JobQueuePoller
 from tests import ResTest
 from tests.utils import wait_until
 from ecl.util.test import TestAreaContext
 import os, stat, time, pathlib, json
+import asyncio
+import threading
 from threading import BoundedSemaphore
 
 
@@ -128,6 +131,145 @@ class JobQueueTest(ResTest):
             for job in job_queue.job_list:
                 job.wait_for()
 
+    def test_status_change_notification(self):
+        with TestAreaContext("job_queue_test_notify") as work_area:
+            job_queue = create_queue(simple_script)
+            notifications = []
+
+            job = job_queue.fetch_next_waiting()
+            job.run(
+                job_queue.driver,
+                BoundedSemaphore(value=1),
+                job_queue.max_submit,
+                on_status_change=lambda: notifications.append(job.status),
+            )
+            job.wait_for()
+
+            # The dummy ok callback does not report success
+            assert job.status == JobStatusType.JOB_QUEUE_FAILED
+            assert notifications[-1] == JobStatusType.JOB_QUEUE_FAILED
+            assert len(notifications) > 1
+
+    def test_poller_uses_fixed_number_of_threads(self):
+        with TestAreaContext("job_queue_test_poller") as work_area:
+            job_queue = create_queue(never_ending_script)
+            num_threads = threading.active_count()
+
+            poller = JobQueuePoller(
+                job_queue.driver,
+                BoundedSemaphore(value=10),
+                job_queue.max_submit,
+                interval=0.1,
+                max_workers=2,
+            )
+            job = job_queue.fetch_next_waiting()
+            while job is not None:
+                poller.add(job)
+                job = job_queue.fetch_next_waiting()
+
+            wait_until(lambda: self.assertEqual(poller.num_jobs, 10))
+            assert threading.active_count() <= num_threads + 3
+
+            for job in job_queue.job_list:
+                job.stop()
+            wait_until(lambda: self.assertFalse(job_queue.is_active()))
+            poller.shutdown()
+
+            for job in job_queue.job_list:
+                assert job.status == JobStatusType.JOB_QUEUE_IS_KILLED
+
+    def test_poller_queries_status_in_bulk(self):
+        with TestAreaContext("job_queue_test_poller_bulk") as work_area:
+            job_queue = create_queue(never_ending_script)
+            driver = job_queue.driver
+            update_status = driver.update_status
+            bulk_sizes = []
+
+            def _update_status(jobs):
+                bulk_sizes.append(len(jobs))
+                update_status(jobs)
+
+            driver.update_status = _update_status
+            # A long interval, so only the explicit poll() below queries the driver
+            poller = JobQueuePoller(
+                driver, BoundedSemaphore(value=10), job_queue.max_submit, interval=60
+            )
+            job = job_queue.fetch_next_waiting()
+            while job is not None:
+                poller.add(job)
+                job = job_queue.fetch_next_waiting()
+            wait_until(lambda: self.assertEqual(poller.num_jobs, 10))
+
+            bulk_sizes.clear()
+            poller.poll()
+            assert bulk_sizes == [10]
+            for job in job_queue.job_list:
+                assert job.is_running()
+
+            for job in job_queue.job_list:
+                job.stop()
+            poller.poll()
+            poller.shutdown()
+
+    def test_poller_survives_failing_status_poll(self):
+        with TestAreaContext("job_queue_test_poller_failure") as work_area:
+            job_queue = create_queue(simple_script)
+            job_queue.status_poll_interval = 0.1
+
+            job = job_queue.job_list[0]
+            handle_status_update = job._handle_status_update
+            calls = []
+
+            def _failing_handle_status_update(driver, previous_status):
+                calls.append(driver)
+                if len(calls) == 1:
+                    raise RuntimeError("Status poll failed")
+                handle_status_update(driver, previous_status)
+
+            job._handle_status_update = _failing_handle_status_update
+
+            execute_thread = threading.Thread(
+                target=job_queue.execute_queue,
+                args=(BoundedSemaphore(value=10), None),
+                daemon=True,
+            )
+            execute_thread.start()
+            execute_thread.join(timeout=60)
+
+            assert not execute_thread.is_alive()
+            assert len(calls) > 1
+            assert not job_queue.is_active()
+
+    def test_publish_changes_in_batches(self):
+        class MockWebsocket:
+            def __init__(self):
+                self.frames = []
+
+            async def send(self, frame):
+                self.frames.append(frame)
+
+        changes = {iens: "JOB_QUEUE_RUNNING" for iens in range(10)}
+
+        websocket = MockWebsocket()
+        asyncio.run(JobQueue._publish_changes("ee_id", changes, websocket))
+        self.assertEqual(len(websocket.frames), 10)
+
+        websocket = MockWebsocket()
+        asyncio.run(
+            JobQueue._publish_changes("ee_id", changes, websocket, batch_size=4)
+        )
+        batches = [json.loads(frame) for frame in websocket.frames]
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+        sources = [event["source"] for batch in batches for event in batch]
+        self.assertEqual(
+            sources, ["/ert/ee/ee_id/real/{}/step/0".format(i) for i in range(10)]
+        )
+        for batch in batches:
+            for event in batch:
+                self.assertEqual(
+                    event["data"], {"queue_event_type": "JOB_QUEUE_RUNNING"}
+                )
+
     def test_failing_jobs(self):
         with TestAreaContext("job_queue_test_add") as work_area:
             job_queue = create_queue(failing_script, max_submit=1)
@@ -10,7 +10,7 @@ from res.enkf import ResConfig
 from tests import ResTest
 from tests.utils import wait_until
 from ecl.util.test import TestAreaContext
-import os, stat
+import os, stat, time
 
 from threading import BoundedSemaphore
 
@@ -159,6 +159,20 @@ class JobQueueManagerTest(ResTest):
                 with open(ok_file, "r") as f:
                     assert f.read() == "success"
 
+    def test_execute_queue_wakes_on_status_change(self):
+        with TestAreaContext("job_queue_manager_test") as work_area:
+            job_queue = create_queue(simple_script)
+            # With event driven wake-ups the idle poll interval should never
+            # be waited out while jobs are finishing.
+            job_queue.poll_interval = 60
+            manager = JobQueueManager(job_queue)
+
+            start = time.time()
+            manager.execute_queue()
+
+            self.assertLess(time.time() - start, 60)
+            self.assertFalse(job_queue.is_active())
+
     def test_max_submit_reached(self):
         with TestAreaContext("job_queue_manager_test") as work_area:
             max_submit_num = 5
@@ -1,3 +1,4 @@
+import numpy as np
 from ecl.util.util import RandomNumberGenerator
 from ecl.util.enums import RngAlgTypeEnum, RngInitModeEnum
 from ecl.util.test import TestAreaContext
@@ -239,3 +240,38 @@ class MatrixTest(ResTest):
                     self.assertEqual(elt, 1)
                 else:
                     self.assertEqual(elt, 0)
+
+    def test_numpy_view(self):
+        m = Matrix(3, 2)
+        m[2, 1] = 5
+        view = m.numpyView()
+        self.assertEqual(view.shape, (3, 2))
+        self.assertEqual(view[2, 1], 5)
+
+        view[0, 1] = 7
+        self.assertEqual(m[0, 1], 7)
+
+        del m
+        self.assertEqual(view[0, 1], 7)
+
+    def test_from_numpy(self):
+        array = np.asfortranarray(np.arange(6, dtype=np.float64).reshape(3, 2))
+        m = Matrix.fromNumpy(array)
+        self.assertEqual(m.dims(), (3, 2))
+        for i in range(3):
+            for j in range(2):
+                self.assertEqual(m[i, j], array[i, j])
+
+        m[1, 1] = 99
+        self.assertEqual(array[1, 1], 99)
+        self.assertTrue(np.shares_memory(array, m.numpyView()))
+
+        column = Matrix.fromNumpy([1, 2, 3])
+        self.assertEqual(column.dims(), (3, 1))
+
+        c_ordered = np.arange(6).reshape(2, 3)
+        m = Matrix.fromNumpy(c_ordered)
+        np.testing.assert_array_equal(m.numpyView(), c_ordered)
+
+        with self.assertRaises(ValueError):
+            Matrix.fromNumpy(np.zeros((2, 2, 2)))
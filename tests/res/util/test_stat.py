@@ -1,3 +1,4 @@
+import numpy as np
 from tests import ResTest
 from ecl.util.util import DoubleVector
 from res.util import polyfit
@@ -28,3 +29,13 @@ class StatTest(ResTest):
         self.assertAlmostEqual(A, beta[0])
         self.assertAlmostEqual(B, beta[1])
         self.assertAlmostEqual(C, beta[2])
+
+    def test_polyfit_numpy(self):
+        x = np.linspace(0, 10, 100)
+        y = 7.25 - 4 * x + 0.025 * x * x
+
+        beta = polyfit(3, x, y, np.ones(100))
+
+        self.assertAlmostEqual(7.25, beta[0])
+        self.assertAlmostEqual(-4, beta[1])
+        self.assertAlmostEqual(0.025, beta[2])
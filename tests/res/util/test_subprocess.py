@@ -17,6 +17,7 @@
 
 import unittest
 import os
+import resource
 from tests.utils import tmpdir
 from subprocess import Popen, PIPE
 
@@ -58,3 +59,35 @@ class TestSubprocess(unittest.TestCase):
         self.assertTrue(process.stdout.closed)
         self.assertEqual(cat_content, a_content)
         self.assertEqual(cat_content, b_content)
+
+    @tmpdir()
+    def test_await_process_tee_stdout_and_stderr(self):
+        with open("out", "wb") as out_fh, open("err", "wb") as err_fh:
+            process = Popen(
+                ["/bin/sh", "-c", "echo out; echo err 1>&2; echo out2"],
+                stdout=PIPE,
+                stderr=PIPE,
+            )
+            await_process_tee(process, out_fh, err_files=[err_fh])
+
+        with open("out", "rb") as f:
+            self.assertEqual(b"out\nout2\n", f.read())
+        with open("err", "rb") as f:
+            self.assertEqual(b"err\n", f.read())
+        self.assertTrue(process.stderr.closed)
+
+    @tmpdir()
+    def test_await_process_tee_waits_without_spinning(self):
+        start = resource.getrusage(resource.RUSAGE_SELF)
+        with open("a", "wb") as a_fh:
+            process = Popen(
+                ["/bin/sh", "-c", "echo output; exec 1>&-; sleep 1; exit 3"],
+                stdout=PIPE,
+            )
+            self.assertEqual(3, await_process_tee(process, a_fh))
+        end = resource.getrusage(resource.RUSAGE_SELF)
+
+        cpu_time = (end.ru_utime + end.ru_stime) - (start.ru_utime + start.ru_stime)
+        self.assertLess(cpu_time, 0.5)
+        with open("a", "rb") as f:
+            self.assertEqual(b"output\n", f.read())